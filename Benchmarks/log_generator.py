@@ -0,0 +1,463 @@
+import argparse
+import json
+import random
+import re
+import sys
+
+from datetime import datetime, timedelta
+
+# Relative weight of each block type in the generated log. Every block type
+# matches the patterns used by one of the parsers in Parsers/.
+DEFAULT_MIX = {
+    'shader': 4,
+    'compute_shader': 1,
+    'import': 25,
+    'worker_import': 15,
+    'pipeline_refresh': 4,
+    'domain_reload': 1,
+    'player_build': 0.2,
+    'utp_other': 6,
+    'eilpp': 4,
+    'il2cpp_postprocess': 2,
+    'tundra': 1,
+    'performance': 0.1,
+    'shader_issue': 2,
+    'build_report': 0.05,
+    'noise': 120,
+}
+
+SHADER_NAMES = [
+    "Universal Render Pipeline/Lit", "Universal Render Pipeline/Unlit", "Universal Render Pipeline/Terrain/Lit",
+    "Hidden/Universal Render Pipeline/Blit", "Shader Graphs/Water", "Custom/Foliage", "Custom/Skin", "TextMeshPro/Distance Field"
+]
+SHADER_PASSES = [("ForwardLit", "fp"), ("ShadowCaster", "vp"), ("DepthOnly", "fp"), ("GBuffer", "fp"), ("Meta", "vp")]
+COMPUTE_SHADERS = ["StpSetup", "Bloom", "ClusteredLighting", "LutBuilder", "OcclusionCulling"]
+IMPORTERS = [
+    (".png", "TextureImporter"), (".fbx", "FBXImporter"), (".cs", "MonoImporter"), (".mat", "NativeFormatImporter"),
+    (".prefab", "PrefabImporter"), (".wav", "AudioImporter"), (".shader", "ShaderImporter"), (".asset", "NativeFormatImporter")
+]
+ASSET_FOLDERS = ["Assets/Art/Textures", "Assets/Art/Models", "Assets/Scripts/Gameplay", "Assets/Audio/SFX",
+                 "Assets/Prefabs/Characters", "Packages/com.unity.render-pipelines.universal/Runtime"]
+REFRESH_OPERATIONS = [
+    "InvokeBeforeRefreshCallbacks", "ApplyChangesToAssetFolders", "Scan", "OnSourceAssetsModified",
+    "CategorizeAssetsWithTransientArtifact", "ProcessAssetsWithTransientArtifactChanges", "CategorizeAssets",
+    "ImportOutOfDateAssets", "PostProcessAllAssets", "Hotreload", "GatherAllCurrentPrimaryArtifactRevisions",
+    "UnloadStreamsBegin", "LoadedImportedAssetsRun", "UnloadStreamsEnd", "Untracked"
+]
+REFRESH_NESTED_OPERATIONS = ["ImportManagerImport", "EnsureUptoDateAssetsAreRegisteredWithGuidPM", "CompileScripts",
+                             "PostProcessAllAssetNotificationsAddChangedAssets", "ReloadImportedAssets"]
+REFRESH_INITIATORS = ["RefreshV2(NoUpdateAssetOptions)", "RefreshV2(AllowForceSynchronousImport)",
+                      "Application.UpdateScene", "AssetDatabase.Refresh", "ScriptCompilation"]
+DOMAIN_RELOAD_TREE = [
+    ("BeginReloadAssembly", ["ExecutionOrderSort", "DisableScriptedObjects", "BackupInstance", "ReleaseScriptingObjects",
+                             "CreateAndSetChildDomain"]),
+    ("RebuildCommonClasses", []),
+    ("RebuildNativeTypeToScriptingClass", []),
+    ("initialDomainReloadingComplete", []),
+    ("LoadAllAssembliesAndSetupDomain", ["LoadAssemblies", "RebuildTransferFunctionScriptingTraits", "AnalyzeDomain",
+                                         "CreateManagedAttributeMaps", "SetupDomain"]),
+    ("FinalizeReload", ["ReleaseScriptCaches", "RebuildScriptCaches", "SetupLoadedEditorAssemblies",
+                        "AwakeInstancesAfterBackupRestoration", "AfterProcessingInitializeOnLoad"]),
+]
+BUILD_STEPS = ["Preprocess Player", "ProducePlayerScriptAssemblies", "Prepare For Build", "Prepare splash screen",
+               "Build scenes", "Build Player Data", "Write data build dirty tracking information",
+               "Postprocess built player", "Running IL2CPP", "Compile C++ code"]
+ASSEMBLIES = ["Unity.Entities", "Unity.Transforms", "Unity.Physics", "Unity.Collections", "Unity.Burst",
+              "Unity.Mathematics", "Assembly-CSharp", "Unity.Rendering.Hybrid", "Unity.NetCode", "Game.Core"]
+EILPP_STEPS = ["ReadAssembly", "ILPostProcess", "WriteAssembly", "ResolveReferences"]
+UTP_OTHER_TYPES = ["LogEntry", "Compiler", "Action", "MemoryLeaks", "AssemblyCompilation"]
+PERFORMANCE_MARKERS = [
+    "Application.InitializeProject", "Application.Message", "Application.Tick", "AssetDatabase.Refresh",
+    "CodeEditorProjectSync.SyncEditorProject", "Compiling Scripts", "Domain Reload", "GUIView.RepaintAll.PlayerLoop",
+    "ProjectBrowser.OnGUI", "SceneView.OnGUI", "SceneHierarchyWindow.OnGUI", "InspectorWindow.OnGUI"
+]
+PERFORMANCE_UNITS = [("ns", 100000), ("us", 1000), ("ms", 1), ("s", 0.001)]
+BUILD_REPORT_CATEGORIES = ["Textures", "Meshes", "Animations", "Sounds", "Shaders", "Other Assets", "Levels",
+                           "Scripts", "Included DLLs", "File headers"]
+NOISE_LINES = [
+    "Refreshing native plugins compatible for Editor in {ms:.2f} ms, found {n} plugins.",
+    "Preloading {n} native plugins for Editor in {ms:.2f} ms.",
+    "[Licensing::Client] Successfully resolved entitlements",
+    "Unloading {n} Unused Serialized files (Serialized files now loaded: 0)",
+    "Loaded scene 'Temp/__Backupscenes/0.backup'",
+    "UnloadTime: {ms:.6f} ms",
+    "System memory in use before: {n}.1 MB.",
+    "Unloading {n} unused Assets / (1.2 MB). Loaded Objects now: {n}.",
+    "Memory consumption went from 150.2 MB to 148.9 MB.",
+    "TcpMessagingSession - receive error",
+    "Asset Pipeline Refresh: DirtyState changed for {n} assets",
+    "[Package Manager] Done resolving packages in {ms:.2f} seconds",
+    "AssetDatabase: script compilation time: {ms:.6f}s",
+    "Reloading assemblies after forced synchronous recompile.",
+    "Begin MonoManager ReloadAssembly",
+    "Mono: successfully reloaded assembly",
+    "Registered in {ms:.6f} seconds.",
+]
+
+
+def parse_size(text):
+    """Convert a human readable size such as '512MB' or '2GB' to bytes."""
+    match = re.fullmatch(r'\s*([\d.]+)\s*([kmgt]?)b?\s*', text.lower())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid size: {text}")
+    multiplier = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3, 't': 1024 ** 4}[match.group(2)]
+    return int(float(match.group(1)) * multiplier)
+
+
+class EditorLogGenerator:
+    """Deterministic generator for synthetic Unity Editor.log content."""
+
+    def __init__(self, seed=0, mix=None, timestamps=True, unity_version="2022.3.10f1",
+                 start_time=datetime(2024, 1, 1, 9, 0, 0), gap_probability=0.0005):
+        self.rng = random.Random(seed)
+        self.mix = dict(DEFAULT_MIX)
+        if mix:
+            self.mix.update(mix)
+        self.kinds = [kind for kind, weight in self.mix.items() if weight > 0]
+        self.weights = [self.mix[kind] for kind in self.kinds]
+        self.timestamps = timestamps
+        self.unity_version = unity_version
+        self.current_time = start_time
+        self.gap_probability = gap_probability
+        self.counter = 0
+        self.block_builders = {
+            'shader': self.shader_block,
+            'compute_shader': self.compute_shader_block,
+            'import': self.import_block,
+            'worker_import': self.worker_import_block,
+            'pipeline_refresh': self.pipeline_refresh_block,
+            'domain_reload': self.domain_reload_block,
+            'player_build': self.player_build_block,
+            'utp_other': self.utp_other_block,
+            'eilpp': self.eilpp_block,
+            'il2cpp_postprocess': self.il2cpp_postprocess_block,
+            'tundra': self.tundra_block,
+            'performance': self.performance_block,
+            'shader_issue': self.shader_issue_block,
+            'build_report': self.build_report_block,
+            'noise': self.noise_block,
+        }
+
+    # -- helpers ---------------------------------------------------------------
+
+    def prefix(self, advance_ms=None):
+        """Return the timestamp prefix for a new log message and advance the clock."""
+        if advance_ms is None:
+            advance_ms = self.rng.expovariate(1 / 40.0)
+        if self.rng.random() < self.gap_probability:
+            # Simulate the Editor freezing for a while
+            advance_ms += self.rng.uniform(60, 600) * 1000
+        self.current_time += timedelta(milliseconds=advance_ms)
+        if not self.timestamps:
+            return ""
+        stamp = self.current_time.strftime('%Y-%m-%dT%H:%M:%S.') + f"{self.current_time.microsecond // 1000:03d}Z"
+        return f"{stamp}|0x{self.rng.randint(0x1000, 0xffff):04x}|"
+
+    def asset_path(self):
+        extension, importer = self.rng.choice(IMPORTERS)
+        self.counter += 1
+        return f"{self.rng.choice(ASSET_FOLDERS)}/Asset_{self.counter}{extension}", importer
+
+    def guid(self):
+        return f"{self.rng.getrandbits(128):032x}"
+
+    # -- session header --------------------------------------------------------
+
+    def header_block(self):
+        prefix = self.prefix(0)
+        return [
+            f"{prefix}[Licensing::Module] Trying to connect to existing licensing client channel...",
+            f"{prefix}Built from '2022.3/staging' branch; Version is '{self.unity_version} (ff3792e53c62)'; "
+            f"using compiler version '192829333'; Build Type 'Release'",
+            f"{prefix}OS: 'Windows 11  (10.0.22631) 64bit Professional' Language: 'en' Physical Memory: 65309 MB",
+            f"{prefix}COMMAND LINE ARGUMENTS:",
+            "C:\\Program Files\\Unity\\Hub\\Editor\\2022.3.10f1\\Editor\\Unity.exe",
+            "-projectpath",
+            "C:/Projects/SyntheticProject",
+            "-useHub",
+            f"{prefix}Successfully changed project path to: C:/Projects/SyntheticProject",
+            f"{prefix}[Project] Loading completed in {self.rng.uniform(20, 90):.3f} seconds",
+            f"\tProject init time: \t\t\t\t{self.rng.uniform(15, 60):.3f} seconds",
+            f"\t\tTemplate init time: \t\t{self.rng.uniform(0, 0.1):.3f} seconds",
+            f"\t\tPackage Manager init time: \t\t{self.rng.uniform(1, 10):.3f} seconds",
+            f"\t\tAsset Database init time: \t\t{self.rng.uniform(1, 10):.3f} seconds",
+            f"\t\tGlobal illumination init time: \t\t{self.rng.uniform(0, 1):.3f} seconds",
+            f"\t\tAssemblies load time: \t\t{self.rng.uniform(0, 3):.3f} seconds",
+            f"\t\tUnity extensions init time: \t\t{self.rng.uniform(0, 1):.3f} seconds",
+            f"\t\tAsset Database refresh time: \t\t{self.rng.uniform(1, 20):.3f} seconds",
+            f"\tScene opening time: {self.rng.uniform(1, 10):.3f} seconds",
+        ]
+
+    # -- block builders --------------------------------------------------------
+
+    def shader_block(self):
+        shader = self.rng.choice(SHADER_NAMES)
+        pass_name, pass_type = self.rng.choice(SHADER_PASSES)
+        full = self.rng.randint(64, 1 << 16)
+        filtered = self.rng.randint(1, full)
+        builtin = self.rng.randint(1, filtered)
+        scriptable = self.rng.randint(1, builtin)
+        local_hits = self.rng.randint(0, scriptable)
+        compiled = scriptable - local_hits
+        return [
+            f"{self.prefix()}Compiling shader \"{shader}\" pass \"{pass_name}\" ({pass_type})",
+            f"    Full variant space:         {full}",
+            f"    After settings filtering:   {filtered}",
+            f"    After built-in stripping:   {builtin}",
+            f"    After scriptable stripping: {scriptable}",
+            f"    Processed in {self.rng.uniform(0, 2):.2f} seconds",
+            "    starting compilation...",
+            f"    finished in {self.rng.uniform(0, 30):.2f} seconds. Local cache hits {local_hits} "
+            f"({self.rng.uniform(0, 2):.2f}s CPU time), remote cache hits 0 (0.00s CPU time), "
+            f"compiled {compiled} variants ({self.rng.uniform(0, 120):.2f}s CPU time), skipped 0 variants",
+            f"    Prepared data for serialisation in {self.rng.uniform(0, 0.5):.2f}s",
+        ]
+
+    def compute_shader_block(self):
+        total = self.rng.randint(2, 64)
+        left = self.rng.randint(1, total)
+        local_hits = self.rng.randint(0, left)
+        return [
+            f"{self.prefix()}Compiling compute shader \"{self.rng.choice(COMPUTE_SHADERS)}\"",
+            "    starting stripping...",
+            f"    finished in {self.rng.uniform(0, 0.1):.2f} seconds. {left} of {total} variants left",
+            "    starting compilation...",
+            f"    finished in {self.rng.uniform(0, 5):.2f} seconds. Local cache hits {local_hits}, "
+            f"remote cache hits 0, compiled {left - local_hits} variants",
+        ]
+
+    def import_block(self):
+        path, importer = self.asset_path()
+        return [
+            f"{self.prefix()}Start importing {path} using Guid({self.guid()}) ({importer}) -> "
+            f"(artifact id: '{self.guid()}') in {self.rng.expovariate(1 / 0.05):.6f} seconds"
+        ]
+
+    def worker_import_block(self):
+        workers = self.rng.randint(1, 8)
+        lines = []
+        pending = []
+        for worker in range(workers):
+            path, importer = self.asset_path()
+            lines.append(f"{self.prefix(1)}[Worker{worker}] Start importing {path} using Guid({self.guid()}) ({importer})")
+            pending.append(worker)
+        self.rng.shuffle(pending)
+        for worker in pending:
+            lines.append(f"{self.prefix()}[Worker{worker}]  -> (artifact id: '{self.guid()}') in "
+                         f"{self.rng.expovariate(1 / 0.2):.6f} seconds")
+        return lines
+
+    def pipeline_refresh_block(self):
+        operations = []
+        total_ms = 0.0
+        for name in REFRESH_OPERATIONS:
+            time_ms = self.rng.expovariate(1 / (400.0 if name == "ImportOutOfDateAssets" else 20.0))
+            total_ms += time_ms
+            if name == "ImportOutOfDateAssets" and self.rng.random() < 0.7:
+                nested = []
+                remaining = time_ms
+                for nested_name in self.rng.sample(REFRESH_NESTED_OPERATIONS, 3):
+                    nested_time = self.rng.uniform(0, remaining)
+                    remaining -= nested_time
+                    nested.append(f"\t\t{nested_name}: {nested_time:.3f}ms ({nested_time:.3f}ms without children)")
+                operations.append(f"\t{name}: {time_ms:.3f}ms ({remaining:.3f}ms without children)")
+                operations.extend(nested)
+            else:
+                operations.append(f"\t{name}: {time_ms:.3f}ms")
+        imports = self.rng.randint(0, 50)
+        return [
+            f"{self.prefix(total_ms)}Asset Pipeline Refresh (id={self.guid()}): Total: {total_ms / 1000:.3f} seconds - "
+            f"Initiated by {self.rng.choice(REFRESH_INITIATORS)}",
+            "\tSummary:",
+            f"\t\tImports: total={imports} (actual={imports}, local cache=0, cache server=0)",
+            f"\t\tAsset DB Process Time: managed={self.rng.randint(0, 50)} ms, native={self.rng.randint(0, 500)} ms",
+            f"\t\tScripting: domain reloads=0, domain reload time=0 ms, compile time=0 ms",
+        ] + operations + [""]
+
+    def domain_reload_block(self):
+        children_lines = []
+        total_ms = 0
+        for name, children in DOMAIN_RELOAD_TREE:
+            child_lines = []
+            child_total = 0
+            for child in children:
+                child_ms = int(self.rng.expovariate(1 / 50.0))
+                child_total += child_ms
+                child_lines.append(f"\t\t{child} ({child_ms}ms)")
+            op_ms = child_total + int(self.rng.expovariate(1 / 20.0))
+            total_ms += op_ms
+            children_lines.append(f"\t{name} ({op_ms}ms)")
+            children_lines.extend(child_lines)
+        return [
+            f"{self.prefix()}Reloading assemblies after forced synchronous recompile.",
+            f"{self.prefix()}Begin MonoManager ReloadAssembly",
+            f"{self.prefix(total_ms)}- Finished resetting the current domain, in {total_ms / 1000:.3f} seconds",
+            f"{self.prefix(1)}Domain Reload Profiling: {total_ms}ms",
+        ] + children_lines + [""]
+
+    def player_build_block(self):
+        steps = [{"description": step, "duration": int(self.rng.expovariate(1 / 8000.0))} for step in BUILD_STEPS]
+        duration = sum(step["duration"] for step in steps)
+        tundra = [self.tundra_block()[0] for _ in range(self.rng.randint(1, 3))]
+        payload = {
+            "type": "PlayerBuildInfo", "version": 2, "phase": "Immediate",
+            "time": int(self.current_time.timestamp() * 1000), "processId": 4242,
+            "steps": steps, "duration": duration
+        }
+        return tundra + [f"{self.prefix(duration)}##utp:{json.dumps(payload, separators=(',', ':'))}"]
+
+    def utp_other_block(self):
+        message_type = self.rng.choice(UTP_OTHER_TYPES)
+        payload = {
+            "type": message_type, "version": 2, "phase": "Immediate",
+            "time": int(self.current_time.timestamp() * 1000), "processId": 4242,
+            "message": f"Synthetic {message_type} message {self.rng.randint(0, 1 << 20)}"
+        }
+        return [f"{self.prefix()}##utp:{json.dumps(payload, separators=(',', ':'))}"]
+
+    def eilpp_block(self):
+        assembly = self.rng.choice(ASSEMBLIES)
+        steps = [(step, int(self.rng.expovariate(1 / 30.0))) for step in EILPP_STEPS]
+        total = sum(time_ms for _, time_ms in steps) + self.rng.randint(0, 10)
+        lines = [f"{self.prefix()}  - EILPP : {assembly} : : {total}ms (~{max(total - 1, 0)}ms)"]
+        lines.extend(f"    - EILPP : {assembly} : {step}: {time_ms}ms" for step, time_ms in steps)
+        return lines
+
+    def il2cpp_postprocess_block(self):
+        index = self.rng.randint(1, 1250)
+        return [f"{self.prefix()}[{index:4d}/1250  {self.rng.randint(0, 9)}s] ILPostProcess "
+                f"Library/Bee/artifacts/1900b0aPDevDbg.dag/post-processed/{self.rng.choice(ASSEMBLIES)}.dll"]
+
+    def tundra_block(self):
+        seconds = self.rng.expovariate(1 / 20.0)
+        formatted = str(timedelta(seconds=int(seconds)))
+        evaluated = self.rng.randint(100, 5000)
+        return [f"{self.prefix(seconds * 1000)}*** Tundra build success ({seconds:.2f} seconds - {formatted}), "
+                f"{self.rng.randint(0, evaluated)} items updated, {evaluated} evaluated"]
+
+    def performance_block(self):
+        lines = [f"{self.prefix()}Editor performance report:"]
+        for marker in PERFORMANCE_MARKERS:
+            unit, scale = self.rng.choice(PERFORMANCE_UNITS)
+            samples = self.rng.randint(1, 100000)
+            avg = self.rng.uniform(0.01, 10) * scale
+            factor = self.rng.uniform(1, 50)
+            lines.append(
+                f"[Performance] {marker:<60}: {samples:>8} samples, Peak.  {avg * factor:.2f} {unit} ({factor:.1f}x), "
+                f"Avg.  {avg:.2f} {unit}, Total. {avg * samples:.3f} {unit} ({self.rng.uniform(0, 20):.1f}%)"
+            )
+        return lines
+
+    def shader_issue_block(self):
+        kind = "error" if self.rng.random() < 0.4 else "warning"
+        message = self.rng.choice([
+            "undeclared identifier '_MainTex_ST' at line {n} (on d3d11)",
+            "implicit truncation of vector type at line {n} (on d3d11)",
+            "'UNITY_PASS_FORWARDBASE' : macro redefinition at line {n} (on vulkan)",
+        ]).format(n=self.rng.randint(1, 400))
+        return [f"{self.prefix()}Shader {kind} in '{self.rng.choice(SHADER_NAMES)}': {message}"]
+
+    def build_report_block(self):
+        sizes = {category: self.rng.uniform(0.01, 200) for category in BUILD_REPORT_CATEGORIES}
+        total = sum(sizes.values())
+        lines = [
+            f"{self.prefix()}Build Report",
+            "Uncompressed usage by category (Percentages based on user generated assets only):",
+        ]
+        for category, size in sizes.items():
+            lines.append(f"{category:<22} {size:.1f} mb\t {size / total * 100:.1f}% ")
+        lines.append(f"{'Total User Assets':<22} {total:.1f} mb\t 100.0% ")
+        lines.append(f"{'Complete build size':<22} {total * 1.4:.1f} mb")
+        lines.append("Used Assets and files from the Resources folder, sorted by uncompressed size:")
+        asset_sizes = sorted((self.rng.expovariate(1 / 200.0) for _ in range(self.rng.randint(20, 400))), reverse=True)
+        for size_kb in asset_sizes:
+            path, _ = self.asset_path()
+            lines.append(f" {size_kb:.1f} kb\t {size_kb / 1024 / total * 100:.1f}% {path}")
+        lines.append("-" * 79)
+        return lines
+
+    def noise_block(self):
+        template = self.rng.choice(NOISE_LINES)
+        return [self.prefix() + template.format(n=self.rng.randint(1, 5000), ms=self.rng.uniform(0, 50))]
+
+    # -- output ----------------------------------------------------------------
+
+    def iter_blocks(self):
+        """Yield an endless stream of log blocks, starting with the session header."""
+        yield self.header_block()
+        while True:
+            kind = self.rng.choices(self.kinds, weights=self.weights)[0]
+            yield self.block_builders[kind]()
+
+    def write(self, output, target_bytes, sessions=1):
+        """Write roughly target_bytes of log content to a path or binary file object."""
+        owns_file = isinstance(output, str)
+        file = open(output, 'wb') if owns_file else output
+        written = 0
+        lines_written = 0
+        try:
+            session_target = max(1, target_bytes // sessions)
+            for _ in range(sessions):
+                session_written = 0
+                pending = []
+                pending_size = 0
+                for block in self.iter_blocks():
+                    text = "\n".join(block) + "\n"
+                    pending.append(text)
+                    pending_size += len(text)
+                    lines_written += len(block)
+                    if pending_size >= 1 << 20:
+                        data = "".join(pending).encode('utf-8')
+                        file.write(data)
+                        written += len(data)
+                        session_written += len(data)
+                        pending = []
+                        pending_size = 0
+                    if session_written + pending_size >= session_target:
+                        break
+                if pending:
+                    data = "".join(pending).encode('utf-8')
+                    file.write(data)
+                    written += len(data)
+        finally:
+            if owns_file:
+                file.close()
+        return written, lines_written
+
+
+def generate_editor_log(output, target_bytes, seed=0, mix=None, timestamps=True, sessions=1):
+    """Generate a deterministic synthetic Editor.log and return (bytes written, lines written)."""
+    generator = EditorLogGenerator(seed=seed, mix=mix, timestamps=timestamps)
+    return generator.write(output, target_bytes, sessions=sessions)
+
+
+def parse_mix(values):
+    """Parse 'kind=weight' overrides from the command line."""
+    mix = {}
+    for value in values or []:
+        kind, _, weight = value.partition('=')
+        if kind not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown block type '{kind}'. Valid types: {', '.join(DEFAULT_MIX)}")
+        mix[kind] = float(weight)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic Unity Editor.log for benchmarking")
+    parser.add_argument("output", help="Path of the log file to write", type=str)
+    parser.add_argument("--size", "-s", help="Approximate size of the log (e.g. 1MB, 500MB, 4GB)", type=parse_size,
+                        default=parse_size("1MB"))
+    parser.add_argument("--seed", help="Random seed (same seed and options produce identical logs)", type=int, default=0)
+    parser.add_argument("--mix", help="Override block weights, e.g. --mix shader=10 noise=50", nargs='*', default=[])
+    parser.add_argument("--sessions", help="Number of concatenated Editor sessions", type=int, default=1)
+    parser.add_argument("--no-timestamps", help="Generate a log without timestamp prefixes", action="store_true")
+    args = parser.parse_args(argv)
+
+    written, lines = generate_editor_log(args.output, args.size, seed=args.seed, mix=parse_mix(args.mix),
+                                         timestamps=not args.no_timestamps, sessions=args.sessions)
+    print(f"Wrote {written / (1024 * 1024):.1f} MB ({lines} lines) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
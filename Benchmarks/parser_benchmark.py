@@ -0,0 +1,248 @@
+import argparse
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+
+# Allow running as "python Benchmarks/parser_benchmark.py" from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Benchmarks.log_generator import generate_editor_log, parse_size
+
+try:
+    import resource
+except ImportError:  # resource is not available on Windows
+    resource = None
+
+END_TO_END = "visualize_log_data"
+END_TO_END_PDF = "visualize_log_data+generate_pdf_report"
+
+# Seconds between two checks that a benchmark process is still running
+RESULT_POLL_INTERVAL = 1.0
+
+# parse_* functions that split the log or run the other parsers rather than parse one kind of data
+ORCHESTRATION_FUNCTIONS = {'parse_log_data', 'parse_log_sessions', 'parse_sessions_data', 'parse_timestamp_index'}
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of the current process in MB (None if unavailable)."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    try:
+        import psutil
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, 'peak_wset', memory_info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def _required_arguments(func):
+    return [parameter for parameter in inspect.signature(func).parameters.values()
+            if parameter.default is parameter.empty
+            and parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)]
+
+
+def discover_parsers():
+    """
+    Return the names of the log parsers in the Parsers package: the parse_* functions that take the log
+    as their one required argument, without the entry points that run the other parsers.
+    """
+    import Parsers
+
+    names = []
+    for name in sorted(dir(Parsers)):
+        func = getattr(Parsers, name)
+        if not name.startswith('parse_') or not callable(func) or name in ORCHESTRATION_FUNCTIONS:
+            continue
+        func = getattr(func, '__wrapped__', func)
+        if getattr(func, '__module__', '').startswith('Parsers.') and len(_required_arguments(func)) == 1:
+            names.append(name)
+    return names
+
+
+def all_parsing_options():
+    return {
+        'shader': True, 'imports': True, 'loading': True, 'build_report': True, 'pipeline': True,
+        'domain_reload': True, 'player_build': True, 'il2cpp': True, 'tundra': True,
+        'timestamp_gaps': True, 'performance_report': True
+    }
+
+
+def _run_target(target, log_path, results):
+    """Run a single benchmark target in a fresh process and report timing and peak RSS."""
+    import Parsers
+
+    baseline_rss = peak_rss_mb()
+    try:
+        if target in (END_TO_END, END_TO_END_PDF):
+            from Visualizers import visualize_log_data
+            from Reporting import generate_pdf_report
+
+            start = time.perf_counter()
+            parsed_data = visualize_log_data(log_path, parsing_options=all_parsing_options())
+            if target == END_TO_END_PDF:
+                generate_pdf_report(log_path, parsed_data)
+            elapsed = time.perf_counter() - start
+        else:
+            func = getattr(Parsers, target)
+            # Bypass the Streamlit cache so repeated runs measure the parser itself
+            func = getattr(func, '__wrapped__', func)
+            start = time.perf_counter()
+            func(log_path)
+            elapsed = time.perf_counter() - start
+        results.put({'seconds': elapsed, 'peak_rss_mb': peak_rss_mb(), 'baseline_rss_mb': baseline_rss})
+    except Exception as e:
+        results.put({'error': f"{type(e).__name__}: {e}"})
+
+
+def _wait_for_result(process, results):
+    """The result the process posts, or an error once it has exited without one (killed or crashed)."""
+    while True:
+        try:
+            return results.get(timeout=RESULT_POLL_INTERVAL)
+        except queue.Empty:
+            if process.is_alive():
+                continue
+        # The result may still be in transit when the process exits
+        try:
+            return results.get(timeout=RESULT_POLL_INTERVAL)
+        except queue.Empty:
+            return {'error': f"process exited with code {process.exitcode} without a result"}
+
+
+def run_target(target, log_path, repeat=1):
+    """Run a benchmark target repeat times (each in its own process) and keep the fastest run."""
+    context = multiprocessing.get_context('spawn')
+    best = None
+    for _ in range(repeat):
+        results = context.Queue()
+        process = context.Process(target=_run_target, args=(target, log_path, results))
+        process.start()
+        result = _wait_for_result(process, results)
+        process.join()
+        if 'error' in result:
+            return result
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def count_lines(log_path):
+    lines = 0
+    with open(log_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            lines += chunk.count(b'\n')
+    return lines
+
+
+def benchmark_log(log_path, targets, repeat=1):
+    """Benchmark every target against one log file and return a list of result rows."""
+    size_bytes = os.path.getsize(log_path)
+    line_count = count_lines(log_path)
+    rows = []
+    for target in targets:
+        print(f"  {target}...", end="", flush=True)
+        result = run_target(target, log_path, repeat)
+        row = {
+            'target': target,
+            'log_bytes': size_bytes,
+            'log_lines': line_count,
+        }
+        if 'error' in result:
+            row['error'] = result['error']
+            print(f" failed ({result['error']})")
+        else:
+            seconds = max(result['seconds'], 1e-9)
+            row.update({
+                'seconds': round(seconds, 4),
+                'mb_per_s': round(size_bytes / (1024 * 1024) / seconds, 2),
+                'lines_per_s': round(line_count / seconds, 1),
+                'peak_rss_mb': round(result['peak_rss_mb'], 1) if result['peak_rss_mb'] is not None else None,
+                'baseline_rss_mb': round(result['baseline_rss_mb'], 1) if result['baseline_rss_mb'] is not None else None,
+            })
+            print(f" {row['seconds']:.3f}s, {row['mb_per_s']:.1f} MB/s, peak RSS {row['peak_rss_mb']} MB")
+        rows.append(row)
+    return rows
+
+
+def compare_results(current, baseline_path):
+    """Print the throughput change of each target relative to a previous results file."""
+    with open(baseline_path, 'r') as file:
+        baseline = json.load(file)
+    previous = {(row['target'], row['log_bytes']): row for row in baseline.get('results', []) if 'mb_per_s' in row}
+
+    print(f"\nComparison against {baseline_path}:")
+    print(f"{'Target':<45} {'Size (MB)':>10} {'Before MB/s':>12} {'After MB/s':>12} {'Change':>8}")
+    for row in current:
+        before = previous.get((row['target'], row['log_bytes']))
+        if not before or 'mb_per_s' not in row:
+            continue
+        change = (row['mb_per_s'] / before['mb_per_s'] - 1) * 100 if before['mb_per_s'] else 0
+        print(f"{row['target']:<45} {row['log_bytes'] / (1024 * 1024):>10.1f} {before['mb_per_s']:>12.2f} "
+              f"{row['mb_per_s']:>12.2f} {change:>+7.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Editor.log parsers")
+    parser.add_argument("--log", help="Benchmark an existing log file instead of generating one", type=str)
+    parser.add_argument("--sizes", help="Sizes of synthetic logs to generate (e.g. 1MB 64MB 1GB)", nargs='*',
+                        type=parse_size, default=[parse_size("1MB"), parse_size("16MB")])
+    parser.add_argument("--seed", help="Seed for the synthetic log generator", type=int, default=0)
+    parser.add_argument("--parsers", help="Only benchmark these parse_* functions", nargs='*')
+    parser.add_argument("--skip-end-to-end", help="Do not benchmark visualize_log_data and the PDF path",
+                        action="store_true")
+    parser.add_argument("--repeat", help="Run each target N times and keep the fastest", type=int, default=1)
+    parser.add_argument("--output", "-o", help="Write results as JSON to this path", type=str)
+    parser.add_argument("--compare", help="Compare against a previous JSON results file", type=str)
+    args = parser.parse_args(argv)
+
+    targets = args.parsers or discover_parsers()
+    if not args.skip_end_to_end:
+        targets = targets + [END_TO_END, END_TO_END_PDF]
+
+    results = []
+    if args.log:
+        print(f"Benchmarking {args.log}")
+        results.extend(benchmark_log(args.log, targets, args.repeat))
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for size in args.sizes:
+                log_path = os.path.join(temp_dir, f"synthetic_{size}.log")
+                generate_editor_log(log_path, size, seed=args.seed)
+                print(f"Benchmarking synthetic log of {size / (1024 * 1024):.1f} MB (seed {args.seed})")
+                results.extend(benchmark_log(log_path, targets, args.repeat))
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'log': args.log,
+            'repeat': args.repeat,
+        },
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results saved to: {args.output}")
+
+    if args.compare:
+        compare_results(results, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,14 @@ from .buildreport_parser import *
 from .domainreload_parser import *
 from .il2cpp_parser import *
 from .loading_parser import *
+from .log_data_parser import *
 from .performance_parser import *
 from .playerbuild_parser import *
+from .quicklook_parser import *
+from .session_parser import *
 from .shader_parser import *
 from .shadererrors_parser import *
 from .tundra_parser import *
 from .timestampgap_parser import *
+from .timestampindex_parser import *
+from .utp_parser import *
@@ -19,19 +19,9 @@ def parse_asset_imports(log_file):
     worker_importer_pattern = re.compile(r'\((.*?Importer)\)')
     worker_end_pattern = re.compile(r'\[Worker(\d+)\]  -> \(artifact id: \'.*?\'\) in (\d+\.\d+) seconds')
     
-    # Process content based on input type
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            process_lines(file, standard_pattern, worker_start_pattern, worker_importer_pattern, 
-                         worker_end_pattern, import_data, worker_data, worker_stats)
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        content = log_file.read().decode('utf-8', errors='ignore')
-        lines = content.splitlines()
-        process_lines(lines, standard_pattern, worker_start_pattern, worker_importer_pattern, 
-                     worker_end_pattern, import_data, worker_data, worker_stats)
+    # Stream lines from either a file path or a file-like object (BytesIO)
+    process_lines(iter_log_lines(log_file), standard_pattern, worker_start_pattern, worker_importer_pattern, 
+                 worker_end_pattern, import_data, worker_data, worker_stats)
 
     # Create DataFrame
     df = pd.DataFrame(import_data) if import_data else pd.DataFrame()
@@ -53,14 +43,20 @@ def parse_asset_imports(log_file):
 def process_lines(lines, standard_pattern, worker_start_pattern, worker_importer_pattern, 
                  worker_end_pattern, import_data, worker_data, worker_stats):
     """Process each line of the log file."""
+    line_count = 0
+    evaluations = 0
+    matches = 0
     for line in lines:
+        line_count += 1
         # Make sure line is a string
         if isinstance(line, bytes):
             line = line.decode('utf-8', errors='ignore')
             
         # Check for standard format (most common, so check first)
+        evaluations += 1
         match = standard_pattern.search(line)
         if match:
+            matches += 1
             timestamp_str = match.group(1)
             asset_path = match.group(2)
             importer_type = match.group(3)
@@ -80,8 +76,10 @@ def process_lines(lines, standard_pattern, worker_start_pattern, worker_importer
             continue
         
         # Check for worker start
+        evaluations += 1
         start_match = worker_start_pattern.search(line)
         if start_match:
+            matches += 1
             worker_id = start_match.group(1)
             asset_path = start_match.group(2)
             
@@ -100,8 +98,10 @@ def process_lines(lines, standard_pattern, worker_start_pattern, worker_importer
             continue
         
         # Check for worker end
+        evaluations += 1
         end_match = worker_end_pattern.search(line)
         if end_match:
+            matches += 1
             worker_id = end_match.group(1)
             import_time = float(end_match.group(2))
             
@@ -126,4 +126,6 @@ def process_lines(lines, standard_pattern, worker_start_pattern, worker_importer
                     'importer_type': start_info['importer_type'],
                     'import_time_seconds': import_time,
                     'worker_id': worker_id
-                })
\ No newline at end of file
+                })
+    
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches)
@@ -5,52 +5,151 @@ import streamlit as st
 from datetime import datetime
 from Utils import *
 
+# Asset pipeline refresh header (the timestamp prefix is optional)
+REFRESH_PATTERN = re.compile(r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Asset Pipeline Refresh \(id=([^)]+)\): Total: ([\d.]+) seconds - Initiated by (.*?)$')
+
+# Pattern for individual operations in the breakdown
+OPERATION_PATTERN = re.compile(r'^\t+([\w()]+): ([\d.]+)ms(?:\s+\(([\d.]+)ms without children\))?$')
+
+# Pattern for nested operations (additional indent level)
+NESTED_OPERATION_PATTERN = re.compile(r'^\t\t+([\w()]+): ([\d.]+)ms(?:\s+\(([\d.]+)ms without children\))?$')
+
+# Columns of the operations table
+REFRESH_OPERATION_COLUMNS = ['refresh_id', 'name', 'parent', 'depth', 'time_ms', 'self_time_ms']
+
+
+def _parse_timestamp(timestamp_str):
+    if not timestamp_str:
+        return None
+    try:
+        return datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
+    except ValueError:
+        return None
+
+
+def _operation_entry(match):
+    time_ms = float(match.group(2))
+    return {
+        'name': match.group(1),
+        'time_ms': time_ms,
+        'self_time_ms': float(match.group(3)) if match.group(3) else time_ms
+    }
+
+
+def _scan_asset_pipeline_refreshes(log_file):
+    """
+    Read every refresh header and its breakdown in one streaming pass.
+    After a header the parser moves through the optional summary, the top-level operations and their
+    nested operations; the first line that doesn't belong to the block is processed as a normal line.
+    Returns (refresh details, operations table columns).
+    """
+    refreshes = []
+    operations = {column: [] for column in REFRESH_OPERATION_COLUMNS}
+
+    state = None  # None outside a block, else 'start', 'summary', 'operations' or 'nested'
+    current = None
+    current_operation = None
+
+    def add_operation(refresh, entry, parent):
+        operations['refresh_id'].append(refresh['refresh_id'])
+        operations['name'].append(entry['name'])
+        operations['parent'].append(parent)
+        operations['depth'].append(0 if parent is None else 1)
+        operations['time_ms'].append(entry['time_ms'])
+        operations['self_time_ms'].append(entry['self_time_ms'])
+
+    line_count = 0
+    evaluations = 0
+    matches = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+
+        # Continue the block of the last refresh; a line that ends a section falls through to the next one
+        if state == 'start':
+            state = 'operations'
+            if "Summary:" in line:
+                state = 'summary'
+                continue
+
+        if state == 'summary':
+            if line.strip() and line.startswith('\t\t'):
+                summary_line = line.strip()
+                if ':' in summary_line:
+                    key, value = summary_line.split(':', 1)
+                    current['summary'][key.strip()] = value.strip()
+                continue
+            state = 'operations'
+
+        if state == 'nested':
+            if line.strip() and line.startswith('\t\t'):
+                evaluations += 1
+                nested_match = NESTED_OPERATION_PATTERN.search(line)
+                if nested_match:
+                    entry = _operation_entry(nested_match)
+                    current_operation['nested_operations'].append(entry)
+                    add_operation(current, entry, current_operation['name'])
+                continue
+            state = 'operations'
+
+        if state == 'operations':
+            if line.strip() and line.startswith('\t'):
+                evaluations += 1
+                op_match = OPERATION_PATTERN.search(line)
+                if op_match:
+                    current_operation = _operation_entry(op_match)
+                    current_operation['nested_operations'] = []
+                    current['operations'].append(current_operation)
+                    add_operation(current, current_operation, None)
+                    state = 'nested'
+                continue
+            state = None
+
+        # Look for a refresh header
+        if 'Asset Pipeline Refresh (id=' in line:
+            evaluations += 1
+            match = REFRESH_PATTERN.search(line)
+            if match:
+                matches += 1
+                timestamp_str = match.group(1)
+                current = {
+                    'timestamp': _parse_timestamp(timestamp_str),
+                    'timestamp_str': timestamp_str,
+                    'refresh_id': match.group(2),
+                    'total_time': float(match.group(3)),
+                    'initiator': match.group(4).strip(),
+                    'summary': {},
+                    'operations': []
+                }
+                refreshes.append(current)
+                state = 'start'
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches)
+    return refreshes, operations
+
+
+def _refresh_frame(refreshes):
+    refresh_data = [{
+        'timestamp': refresh['timestamp'],
+        'timestamp_str': refresh['timestamp_str'] if refresh['timestamp_str'] else f"Refresh_{counter}",
+        'refresh_id': refresh['refresh_id'],
+        'total_time': refresh['total_time'],
+        'initiator': refresh['initiator']
+    } for counter, refresh in enumerate(refreshes)]
+    return pd.DataFrame(refresh_data) if refresh_data else pd.DataFrame()
+
+
 @st.cache_data
 def parse_asset_pipeline_refresh(log_file):
     """Extract asset pipeline refresh information from log file."""
-    # Updated pattern to make timestamp optional
-    refresh_pattern = r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Asset Pipeline Refresh \(id=([^)]+)\): Total: ([\d.]+) seconds - Initiated by (.*?)$'
-    
-    refresh_data = []
-    counter = 0
-    
-    # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            content = file.read()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        content = log_file.read().decode('utf-8', errors='ignore')
-    
-    # Find all refresh entries
-    matches = re.finditer(refresh_pattern, content, re.MULTILINE)
-    
-    for match in matches:
-        has_timestamp = match.lastindex >= 4 and match.group(1)
-        timestamp_str = match.group(1) if has_timestamp else f"Refresh_{counter}"
-        group_offset = 0 if has_timestamp else -1
-        
-        refresh_id = match.group(2)
-        total_time = float(match.group(3))
-        initiator = match.group(4).strip()
-        
-        # Try to parse timestamp if available
-        timestamp = None
-        if has_timestamp:
-            try:
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-            except:
-                pass
-            
-        refresh_data.append({
-            'timestamp': timestamp,
-            'timestamp_str': timestamp_str,
-            'refresh_id': refresh_id,
-            'total_time': total_time,
-            'initiator': initiator
-        })
-        counter += 1
-    
-    return pd.DataFrame(refresh_data) if refresh_data else pd.DataFrame()
+    refreshes, _ = _scan_asset_pipeline_refreshes(log_file)
+    return _refresh_frame(refreshes)
+
+
+@st.cache_data
+def parse_asset_pipeline_refresh_with_operations(log_file):
+    """
+    Extract the refreshes together with a flat table of every operation of every refresh breakdown
+    (refresh_id, name, parent, depth, time_ms, self_time_ms), built in the same pass.
+    """
+    refreshes, operations = _scan_asset_pipeline_refreshes(log_file)
+    return _refresh_frame(refreshes), pd.DataFrame(operations, columns=REFRESH_OPERATION_COLUMNS)
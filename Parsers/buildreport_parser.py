@@ -1,77 +1,186 @@
+import heapq
 import re
 import streamlit as st
 import pandas as pd
 
 from Utils import *
 
+# The line that starts a build report (the timestamp prefix is optional)
+BUILD_REPORT_PATTERN = re.compile(r'^(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Build Report\s*$')
+
+# One "Uncompressed usage by category" row: name, size, unit and percentage
+CATEGORY_PATTERN = re.compile(r'^(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?(.*?)[ \t]+(\d+\.?\d*)[ \t]+(\w+)[ \t]+(\d+\.?\d*)\%')
+
+TOTAL_BUILD_PATTERN = re.compile(r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Complete build size\s+(\d+\.?\d*)\s+(\w+)')
+
+# Header of the per-asset list that follows the categories
+USED_ASSETS_HEADER = "Used Assets and files"
+
+# Largest used assets kept per build report
+BUILD_REPORT_TOP_ASSETS = 500
+
+# Lines of the category section read before a report is considered malformed
+MAX_CATEGORY_LINES = 100
+
+
+def _new_report(timestamp_str):
+    return {
+        'timestamp_str': timestamp_str,
+        'categories': [],
+        'total_build_size': None,
+        'total_build_unit': None,
+        'asset_count': 0,
+        'assets_total_mb': 0.0,
+        'top_assets': [],  # min-heap of (size_in_mb, order, path, size_value, size_unit, percentage)
+        'folders': {}  # folder -> [size_in_mb, asset_count]
+    }
+
+
+def _add_used_asset(report, line):
+    """Add one "<size> <unit> <percentage>% <path>" row to the report aggregates. Returns False if the line isn't one."""
+    parts = line.split(None, 3)
+    if len(parts) != 4 or not parts[2].endswith('%'):
+        return False
+    try:
+        size_value = float(parts[0])
+        percentage = float(parts[2][:-1])
+    except ValueError:
+        return False
+
+    size_unit = parts[1]
+    size_in_mb = convert_to_mb(size_value, size_unit)
+    path = parts[3].rstrip()
+
+    report['asset_count'] += 1
+    report['assets_total_mb'] += size_in_mb
+
+    # Aggregate by containing folder instead of keeping a row per asset
+    folder = path.rpartition('/')[0] or '(root)'
+    totals = report['folders'].get(folder)
+    if totals is None:
+        report['folders'][folder] = [size_in_mb, 1]
+    else:
+        totals[0] += size_in_mb
+        totals[1] += 1
+
+    # Keep only the largest assets
+    entry = (size_in_mb, report['asset_count'], path, size_value, size_unit, percentage)
+    top_assets = report['top_assets']
+    if len(top_assets) < BUILD_REPORT_TOP_ASSETS:
+        heapq.heappush(top_assets, entry)
+    elif entry > top_assets[0]:
+        heapq.heapreplace(top_assets, entry)
+    return True
+
+
+def _finish_report(report):
+    """Turn the aggregates of a report into frames."""
+    build_data = [{
+        'timestamp_str': timestamp_str if timestamp_str else "N/A",
+        'category': category,
+        'size_value': size_value,
+        'size_unit': size_unit,
+        # Convert all sizes to MB for consistent comparison
+        'size_in_mb': convert_to_mb(size_value, size_unit),
+        'percentage': percentage
+    } for timestamp_str, category, size_value, size_unit, percentage in report['categories']]
+
+    top_assets = sorted(report['top_assets'], reverse=True)
+    assets_df = pd.DataFrame(
+        [(path, size_value, size_unit, size_in_mb, percentage) for size_in_mb, _, path, size_value, size_unit, percentage in top_assets],
+        columns=['path', 'size_value', 'size_unit', 'size_in_mb', 'percentage']
+    )
+    folders_df = pd.DataFrame(
+        [(folder, size_in_mb, count) for folder, (size_in_mb, count) in report['folders'].items()],
+        columns=['folder', 'size_in_mb', 'asset_count']
+    ).sort_values('size_in_mb', ascending=False, ignore_index=True)
+
+    return {
+        'timestamp_str': report['timestamp_str'],
+        'build_df': pd.DataFrame(build_data) if build_data else pd.DataFrame(),
+        'total_build_size': report['total_build_size'],
+        'total_build_unit': report['total_build_unit'],
+        'asset_count': report['asset_count'],
+        'assets_total_mb': report['assets_total_mb'],
+        'top_assets': assets_df,
+        'asset_folders': folders_df
+    }
+
+
+@st.cache_data
+def parse_build_reports(log_file):
+    """
+    Parse every Unity build report in the log in one streaming pass: the size by category, the complete
+    build size and the used assets list. Used assets are summarized as they are read (a folder table and
+    the BUILD_REPORT_TOP_ASSETS largest assets), so very long asset lists don't need a row per asset.
+    """
+    reports = []
+    report = None
+    section = None  # 'categories' or 'assets' inside a report
+    category_lines = 0
+
+    line_count = 0
+    evaluations = 0
+    matches = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+
+        if section == 'assets':
+            if _add_used_asset(report, line):
+                matches += 1
+                continue
+            # The list ends with a dashed line (or anything that isn't an asset row)
+            section = None
+
+        elif section == 'categories':
+            category_lines += 1
+            if USED_ASSETS_HEADER in line:
+                section = 'assets'
+                continue
+            if 'Complete build size' in line:
+                evaluations += 1
+                total_match = TOTAL_BUILD_PATTERN.search(line)
+                if total_match:
+                    matches += 1
+                    report['total_build_size'] = float(total_match.group(2))
+                    report['total_build_unit'] = total_match.group(3)
+                continue
+            if line.startswith('Uncompressed usage'):
+                continue
+            evaluations += 1
+            category_match = CATEGORY_PATTERN.match(line)
+            if category_match and category_lines <= MAX_CATEGORY_LINES:
+                matches += 1
+                report['categories'].append((
+                    category_match.group(1),
+                    category_match.group(2).strip(),
+                    float(category_match.group(3)),
+                    category_match.group(4),
+                    float(category_match.group(5))
+                ))
+                continue
+            section = None
+
+        # Look for the start of a build report
+        if 'Build Report' in line:
+            evaluations += 1
+            header_match = BUILD_REPORT_PATTERN.match(line)
+            if header_match:
+                matches += 1
+                report = _new_report(header_match.group(1))
+                reports.append(report)
+                section = 'categories'
+                category_lines = 0
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches,
+                        rows_emitted=sum(len(report['categories']) for report in reports))
+    return [_finish_report(report) for report in reports]
+
+
 @st.cache_data
 def parse_build_report(log_file):
-    """Parse Unity build report data from log file."""
-    # Updated pattern to make timestamp optional
-    build_report_pattern = r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Build Report'
-    
-    # Updated pattern to make timestamp optional
-    category_pattern = r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?(.*?)\s+(\d+\.?\d*)\s+(\w+)\s+(\d+\.?\d*)\%'
-    
-    # Updated pattern to make timestamp optional
-    total_build_pattern = r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Complete build size\s+(\d+\.?\d*)\s+(\w+)'
-    
-    build_data = []
-    total_build_size = None
-    total_build_unit = None
-    
-    # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            content = file.read()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        content = log_file.read().decode('utf-8', errors='ignore')
-    
-    # Find the build report section
-    build_report_match = re.search(build_report_pattern, content)
-    if not build_report_match:
+    """Parse Unity build report data from log file. Returns (size by category, total size, total unit) of the first report."""
+    reports = parse_build_reports(log_file)
+    if not reports:
         return pd.DataFrame(), None, None
-    
-    # Extract the portion of the log containing the build report
-    report_start = build_report_match.start()
-    report_end = min(len(content), report_start + 2000)  # Enough lines to capture the report
-    report_content = content[report_start:report_end]
-    
-    # Find all asset category entries
-    category_matches = re.finditer(category_pattern, report_content)
-    
-    for match in category_matches:
-        timestamp_str = match.group(1) if match.lastindex >= 5 and match.group(1) else None
-        group_offset = 0 if timestamp_str is None else 0
-        category = match.group(2).strip()
-        size_value = float(match.group(3))
-        size_unit = match.group(4)
-        percentage = float(match.group(5))
-        
-        # Convert all sizes to MB for consistent comparison
-        size_in_mb = convert_to_mb(size_value, size_unit)
-        
-        build_data.append({
-            'timestamp_str': timestamp_str if timestamp_str else "N/A",
-            'category': category,
-            'size_value': size_value,
-            'size_unit': size_unit,
-            'size_in_mb': size_in_mb,
-            'percentage': percentage
-        })
-    
-    # Extract total build size
-    total_match = re.search(total_build_pattern, report_content)
-    if total_match:
-        group_count = len(total_match.groups())
-        if group_count >= 3 and total_match.group(1):  # With timestamp
-            total_build_size = float(total_match.group(2))
-            total_build_unit = total_match.group(3)
-        else:  # Without timestamp
-            total_build_size = float(total_match.group(1) if group_count == 2 else total_match.group(2))
-            total_build_unit = total_match.group(2) if group_count == 2 else total_match.group(3)
-    
-    return pd.DataFrame(build_data) if build_data else pd.DataFrame(), total_build_size, total_build_unit
+    return reports[0]['build_df'], reports[0]['total_build_size'], reports[0]['total_build_unit']
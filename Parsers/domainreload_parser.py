@@ -1,157 +1,190 @@
 import re
+import pandas as pd
 import streamlit as st
+from collections import deque
 from datetime import datetime
 
 from Utils import *
 
-@st.cache_data
-def parse_domain_reloads(log_file):
-    """Extract domain reload information from log file with proper timing extraction."""
-    domain_reloads = []
-    
-    # Pattern to match domain reload profiling headers
-    profiling_header = r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Domain Reload Profiling: (\d+)ms'
-    
-    # Additional patterns for domain reload time (as backup)
-    time_patterns = [
-        r'Domain Reload completed in ([\d.]+) seconds',
-        r'Finished resetting the current domain, in ([\d.]+) seconds',
-        r'Reload completed in ([\d.]+)s'
-    ]
-    
-    # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            content = file.readlines()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        content = log_file.read().decode('utf-8', errors='ignore').splitlines()
-    
-    i = 0
-    while i < len(content):
-        line = content[i]
-        
-        # Look for profiling header
-        profiling_match = re.search(profiling_header, line)
-        if profiling_match:
-            timestamp_str = profiling_match.group(1) if profiling_match.group(1) else None
-            profiling_time_ms = int(profiling_match.group(2))
-            
-            # Use the profiling time as the reset time (converting from ms to seconds)
-            reset_time = profiling_time_ms / 1000.0
-            
-            # Parse timestamp if available
-            timestamp = None
-            if timestamp_str:
+# Pattern to match domain reload profiling headers
+PROFILING_HEADER_PATTERN = re.compile(r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?Domain Reload Profiling: (\d+)ms')
+
+# Additional patterns for domain reload time (as backup), in order of preference
+RELOAD_TIME_PATTERNS = [
+    r'Domain Reload completed in ([\d.]+) seconds',
+    r'Finished resetting the current domain, in ([\d.]+) seconds',
+    r'Reload completed in ([\d.]+)s'
+]
+RELOAD_TIME_REGEXES = [re.compile(pattern) for pattern in RELOAD_TIME_PATTERNS]
+
+# The same patterns with an optional timestamp prefix, used when the log has no profiling headers
+TIMESTAMPED_RELOAD_TIME_REGEXES = [
+    re.compile(r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?' + pattern)
+    for pattern in RELOAD_TIME_PATTERNS
+]
+
+# One profiled operation: tab-indented "name (123ms)"
+OPERATION_PATTERN = re.compile(r'^\t+(.+?) \((\d+)ms\)$')
+
+# Lines before a profiling header searched for a more specific reload time
+RELOAD_LOOKBACK_LINES = 19
+
+# Maximum number of operation lines read after a profiling header
+MAX_OPERATION_LINES = 99
+
+# Columns of the operations table
+RELOAD_OPERATION_COLUMNS = ['reload_id', 'op_id', 'parent_id', 'depth', 'name', 'time_ms']
+
+
+def _parse_timestamp(timestamp_str):
+    if not timestamp_str:
+        return None
+    try:
+        return datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
+    except ValueError:
+        return None
+
+
+def _lookback_reset_time(recent_lines):
+    """Return the reload time of the nearest preceding line that reports one, and the number of regex evaluations."""
+    evaluations = 0
+    for line in reversed(recent_lines):
+        for regex in RELOAD_TIME_REGEXES:
+            evaluations += 1
+            time_match = regex.search(line)
+            if time_match:
                 try:
-                    timestamp = datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-                except:
+                    return float(time_match.group(1)), evaluations
+                except ValueError:
                     pass
-            
-            # Initialize domain reload entry
-            reload_entry = {
-                'timestamp': timestamp,
-                'timestamp_str': timestamp_str if timestamp_str else f"Reload_{len(domain_reloads)}",
-                'reset_time': reset_time,  # Use profiling time as default
-                'profiling_time_ms': profiling_time_ms,
-                'operations': []
-            }
-            
-            # Look back for more specific domain reload time
-            for j in range(i-1, max(0, i-20), -1):
-                for pattern in time_patterns:
-                    time_match = re.search(pattern, content[j])
-                    if time_match:
-                        try:
-                            # Override with more specific time if found
-                            reload_entry['reset_time'] = float(time_match.group(1))
-                            break
-                        except:
-                            pass
-                if time_match:
-                    break
-            
-            # Parse operations with proper hierarchy
-            operations = []
-            op_stack = []
-            
-            # Move to next line after header
-            j = i + 1
-            while j < len(content) and j < i + 100:  # limit to 100 lines after header
-                op_line = content[j].rstrip()
-                
-                # Check if we've reached the end of the profiling block
-                if not op_line or not op_line.startswith('\t'):
-                    break
-                
-                # Parse the operation line
-                indent_level = len(re.match(r'^\t+', op_line).group(0))
-                op_match = re.search(r'^\t+(.+?) \((\d+)ms\)$', op_line)
-                
+    return None, evaluations
+
+
+def _scan_domain_reloads(log_file):
+    """
+    Stream the log once through a small state machine: outside a profiling block each line is checked
+    for a header (the previous lines are kept in a bounded ring buffer for the reset time look-back);
+    inside a block each tab-indented line is an operation. Returns (domain_reloads, operations table).
+    """
+    domain_reloads = []
+    operations = {column: [] for column in RELOAD_OPERATION_COLUMNS}
+
+    # Reset times found without any profiling header, per pattern (only used if the log has no headers)
+    fallback_matches = [[] for _ in TIMESTAMPED_RELOAD_TIME_REGEXES]
+
+    recent_lines = deque(maxlen=RELOAD_LOOKBACK_LINES)
+    op_stack = []
+    block_lines = None  # operation lines read in the current block, None outside a block
+
+    line_count = 0
+    evaluations = 0
+    matches = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+
+        if block_lines is not None:
+            op_line = line.rstrip()
+            # The block ends at the first empty or non-indented line, which is then processed normally
+            if block_lines < MAX_OPERATION_LINES and op_line.startswith('\t'):
+                block_lines += 1
+                evaluations += 1
+                op_match = OPERATION_PATTERN.match(op_line)
                 if op_match:
-                    name = op_match.group(1)
-                    time_ms = int(op_match.group(2))
-                    
+                    matches += 1
+                    indent_level = len(op_line) - len(op_line.lstrip('\t'))
                     op_entry = {
-                        'name': name,
-                        'time_ms': time_ms,
+                        'name': op_match.group(1),
+                        'time_ms': int(op_match.group(2)),
                         'indent_level': indent_level,
                         'children': []
                     }
-                    
+
                     # Handle the hierarchy
-                    while op_stack and op_stack[-1]['indent_level'] >= indent_level:
+                    while op_stack and op_stack[-1][0]['indent_level'] >= indent_level:
                         op_stack.pop()
-                    
+
+                    op_id = len(operations['op_id'])
                     if op_stack:
-                        op_stack[-1]['children'].append(op_entry)
+                        op_stack[-1][0]['children'].append(op_entry)
                     else:
-                        operations.append(op_entry)
-                    
-                    op_stack.append(op_entry)
-                
-                j += 1
-            
-            # Store operations and add to domain reloads
-            reload_entry['operations'] = operations
-            domain_reloads.append(reload_entry)
-            
-            # Continue parsing from after the operations block
-            i = j
-        else:
-            i += 1
-                
-    # If we didn't find any domain reloads with the profiling header,
-    # look for fallback patterns
+                        domain_reloads[-1]['operations'].append(op_entry)
+
+                    operations['reload_id'].append(len(domain_reloads) - 1)
+                    operations['op_id'].append(op_id)
+                    operations['parent_id'].append(op_stack[-1][1] if op_stack else None)
+                    operations['depth'].append(len(op_stack))
+                    operations['name'].append(op_entry['name'])
+                    operations['time_ms'].append(op_entry['time_ms'])
+
+                    op_stack.append((op_entry, op_id))
+                recent_lines.append(line)
+                continue
+            block_lines = None
+
+        # Look for profiling header
+        if 'Domain Reload Profiling: ' in line:
+            evaluations += 1
+            profiling_match = PROFILING_HEADER_PATTERN.search(line)
+            if profiling_match:
+                matches += 1
+                timestamp_str = profiling_match.group(1)
+                profiling_time_ms = int(profiling_match.group(2))
+
+                # Use the profiling time as the reset time unless a more specific time precedes the header
+                reset_time, lookback_evaluations = _lookback_reset_time(recent_lines)
+                evaluations += lookback_evaluations
+
+                domain_reloads.append({
+                    'timestamp': _parse_timestamp(timestamp_str),
+                    'timestamp_str': timestamp_str if timestamp_str else f"Reload_{len(domain_reloads)}",
+                    'reset_time': reset_time if reset_time is not None else profiling_time_ms / 1000.0,
+                    'profiling_time_ms': profiling_time_ms,
+                    'operations': []
+                })
+                op_stack = []
+                block_lines = 0
+                fallback_matches = None
+
+        # Until a header is found, also collect reload times for the fallback
+        if fallback_matches is not None and ('Reload completed in ' in line or 'Finished resetting' in line):
+            for regex, found in zip(TIMESTAMPED_RELOAD_TIME_REGEXES, fallback_matches):
+                evaluations += 1
+                found.extend((match.group(1), match.group(2)) for match in regex.finditer(line))
+
+        recent_lines.append(line)
+
+    # If we didn't find any domain reloads with the profiling header, use the fallback patterns
     if not domain_reloads:
-        # Join the content for simpler pattern matching
-        full_content = '\n'.join(content)
-        
-        # Try each time pattern
-        for pattern in time_patterns:
-            complete_pattern = f'(?:(\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}\\.\\d+Z)\\|.*?\\|)?{pattern}'
-            simple_reloads = re.finditer(complete_pattern, full_content)
-            
-            for idx, match in enumerate(simple_reloads):
-                timestamp_str = match.group(1) if match.group(1) else None
-                reset_time = float(match.group(2))
-                
-                # Parse timestamp if available
-                timestamp = None
-                if timestamp_str:
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-                    except:
-                        pass
-                
+        for found in fallback_matches:
+            matches += len(found)
+            for idx, (timestamp_str, reset_time) in enumerate(found):
+                reset_time = float(reset_time)
                 domain_reloads.append({
-                    'timestamp': timestamp,
+                    'timestamp': _parse_timestamp(timestamp_str),
                     'timestamp_str': timestamp_str if timestamp_str else f"Reload_{idx}",
                     'reset_time': reset_time,
                     'profiling_time_ms': reset_time * 1000,  # Convert seconds to ms
                     'operations': []
                 })
-    
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches)
+
+    ops_df = pd.DataFrame(operations, columns=RELOAD_OPERATION_COLUMNS)
+    ops_df['parent_id'] = ops_df['parent_id'].astype('Int64')
+    return domain_reloads, ops_df
+
+
+@st.cache_data
+def parse_domain_reloads(log_file):
+    """Extract domain reload information from log file with proper timing extraction."""
+    domain_reloads, _ = _scan_domain_reloads(log_file)
     return domain_reloads
+
+
+@st.cache_data
+def parse_domain_reloads_with_operations(log_file):
+    """
+    Extract the domain reloads together with a flat table of every profiled operation across all reloads
+    (reload_id, op_id, parent_id, depth, name, time_ms), so operations can be aggregated with a groupby.
+    """
+    return _scan_domain_reloads(log_file)
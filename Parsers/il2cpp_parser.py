@@ -3,93 +3,95 @@ import streamlit as st
 
 from Utils import *
 
+# One pattern for every IL2CPP line, tried once per candidate line:
+#   EILPP assembly:   "  - EILPP : Unity.Transforms.Hybrid : : 153ms (~152ms)"
+#   EILPP subprocess: "    - EILPP : Unity.Transforms.Hybrid : WriteAssembly: 1ms"
+#   ILPostProcess:    "[ 896/1250  2s] ILPostProcess Library/Bee/.../Unity.Physics.dll"
+IL2CPP_LINE_PATTERN = re.compile(
+    r'\s+- EILPP\s*:\s*(?P<assembly>[\w\.]+)\s*:\s*'
+    r'(?::\s*(?P<total_ms>\d+)ms\s*\(~(?P<self_ms>\d+)ms\)|(?P<process>[\w]+):\s*(?P<time_ms>\d+)ms)'
+    r'|\[\s*(?:\d+/\d+\s+)?(?P<seconds>\d+)s\]\s+ILPostProcess\s+(?P<path>.*\.dll)'
+)
+
+ASSEMBLY_NAME_PATTERN = re.compile(r'[/\\]?([\w\.]+)\.dll')
+
+
+def extract_assembly_name(path):
+    """Extract assembly name from file path."""
+    match = ASSEMBLY_NAME_PATTERN.search(path)
+    return match.group(1) if match else path
+
+
+def _assembly_entry(assembly, steps):
+    return {
+        'assembly': assembly['assembly'],
+        'total_time_ms': assembly['total_time_ms'],
+        'self_time_ms': assembly['self_time_ms'],
+        'steps': steps
+    }
+
+
 @st.cache_data
 def parse_il2cpp_processing(log_file):
-    """Extract IL2CPP processing data from the log file."""
-    # Patterns for IL2CPP entries
-    patterns = [
-        # EILPP format 1
-        (r'\s+- EILPP\s*:\s*([\w\.]+)\s*:\s*:\s*(\d+)ms\s*\(~(\d+)ms\)',
-         lambda m: {'assembly': m.group(1), 'total_time_ms': int(m.group(2)), 'self_time_ms': int(m.group(3))}),
-        
-        # EILPP format 2 - subprocess
-        (r'\s+- EILPP\s*:\s*([\w\.]+)\s*:\s*([\w]+):\s*(\d+)ms',
-         lambda m: {'is_subprocess': True, 'assembly': m.group(1), 'process': m.group(2), 'time_ms': int(m.group(3))}),
-        
-        # ILPostProcess format - [index/total time] or [time]
-        (r'\[\s*(?:\d+/\d+\s+)?(\d+)s\]\s+ILPostProcess\s+(.*\.dll)',
-         lambda m: {'assembly': extract_assembly_name(m.group(2)), 'total_time_ms': int(m.group(1)) * 1000, 'self_time_ms': int(m.group(1)) * 1000, 'process': 'ILPostProcess'})
-    ]
-    
-    def extract_assembly_name(path):
-        """Extract assembly name from file path."""
-        match = re.search(r'[/\\]?([\w\.]+)\.dll', path)
-        return match.group(1) if match else path
-    
+    """
+    Extract IL2CPP processing data from the log file. Each entry has the assembly, total and self time,
+    and its subprocess steps in columnar form ({'process': [...], 'time_ms': [...]}).
+    """
     il2cpp_data = []
     current_assembly = None
-    assembly_steps = []
-    
-    # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            lines = file.readlines()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        lines = log_file.read().decode('utf-8', errors='ignore').splitlines()
-    
-    for line in lines:
-        # Try to match each pattern
-        for pattern, handler in patterns:
-            match = re.search(pattern, line)
-            if match:
-                result = handler(match)
-                
-                # Handle subprocess entries
-                if result.get('is_subprocess', False):
-                    if current_assembly and current_assembly['assembly'] == result['assembly']:
-                        assembly_steps.append({
-                            'assembly': result['assembly'],
-                            'process': result['process'],
-                            'time_ms': result['time_ms']
-                        })
-                    break
-                
-                # Handle main entries (save previous if exists)
-                if current_assembly:
-                    il2cpp_data.append({
-                        'assembly': current_assembly['assembly'],
-                        'total_time_ms': current_assembly['total_time_ms'],
-                        'self_time_ms': current_assembly.get('self_time_ms', current_assembly['total_time_ms']),
-                        'steps': assembly_steps
-                    })
-                
-                # If this is an ILPostProcess entry, add it directly
-                if result.get('process') == 'ILPostProcess':
-                    il2cpp_data.append({
-                        'assembly': result['assembly'],
-                        'total_time_ms': result['total_time_ms'],
-                        'self_time_ms': result['self_time_ms'],
-                        'process': 'ILPostProcess',
-                        'steps': []
-                    })
-                    current_assembly = None
-                    assembly_steps = []
-                else:
-                    # Start a new assembly
-                    current_assembly = result
-                    assembly_steps = []
-                break
-    
+    assembly_steps = None
+
+    line_count = 0
+    evaluations = 0
+    matches = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+        # Cheap substring check before the regex
+        if 'EILPP' not in line and 'ILPostProcess' not in line:
+            continue
+
+        evaluations += 1
+        match = IL2CPP_LINE_PATTERN.search(line)
+        if not match:
+            continue
+        matches += 1
+
+        # Subprocess steps belong to the assembly they follow
+        if match.group('process') is not None:
+            if current_assembly and current_assembly['assembly'] == match.group('assembly'):
+                assembly_steps['process'].append(match.group('process'))
+                assembly_steps['time_ms'].append(int(match.group('time_ms')))
+            continue
+
+        # Any other entry ends the previous assembly
+        if current_assembly:
+            il2cpp_data.append(_assembly_entry(current_assembly, assembly_steps))
+            current_assembly = None
+
+        if match.group('seconds') is not None:
+            # ILPostProcess entries have no steps and are added directly
+            time_ms = int(match.group('seconds')) * 1000
+            il2cpp_data.append({
+                'assembly': extract_assembly_name(match.group('path')),
+                'total_time_ms': time_ms,
+                'self_time_ms': time_ms,
+                'process': 'ILPostProcess',
+                'steps': {'process': [], 'time_ms': []}
+            })
+        else:
+            # Start a new assembly
+            current_assembly = {
+                'assembly': match.group('assembly'),
+                'total_time_ms': int(match.group('total_ms')),
+                'self_time_ms': int(match.group('self_ms'))
+            }
+            assembly_steps = {'process': [], 'time_ms': []}
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches)
+
     # Add the last assembly if exists
     if current_assembly:
-        il2cpp_data.append({
-            'assembly': current_assembly['assembly'],
-            'total_time_ms': current_assembly['total_time_ms'],
-            'self_time_ms': current_assembly.get('self_time_ms', current_assembly['total_time_ms']),
-            'steps': assembly_steps
-        })
-    
+        il2cpp_data.append(_assembly_entry(current_assembly, assembly_steps))
+
     return il2cpp_data
+
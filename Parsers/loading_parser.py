@@ -5,6 +5,31 @@ import streamlit as st
 from datetime import datetime
 from Utils import *
 
+# Text every loading entry contains; the entry pattern is only run on lines that have it
+LOADING_MARKER = '[Project] Loading completed in'
+
+def _find_loading_entries(loading_pattern, content):
+    """
+    Yield the matches of loading_pattern in content, like finditer, but only search the lines containing
+    the loading marker. A match never spans lines, so the results are the same without scanning all the text.
+    """
+    position = 0
+    while True:
+        marker = content.find(LOADING_MARKER, position)
+        if marker == -1:
+            return
+        line_start = content.rfind('\n', 0, marker) + 1
+        line_end = content.find('\n', marker)
+        if line_end == -1:
+            line_end = len(content)
+        match = loading_pattern.search(content, max(line_start, position), line_end)
+        if match is None:
+            # The marker isn't followed by a duration; look past it
+            position = marker + len(LOADING_MARKER)
+            continue
+        yield match
+        position = match.end()
+
 @st.cache_data
 def parse_loading_times(log_file):
     """Parse Unity project loading time data from log file."""
@@ -32,20 +57,15 @@ def parse_loading_times(log_file):
     loading_data = []
     
     # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            content = file.read()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        content = log_file.read().decode('utf-8', errors='ignore')
+    content = read_log_content(log_file)
     
     # Find all loading entries
-    loading_entries = re.finditer(loading_pattern, content, re.MULTILINE)
+    loading_entries = _find_loading_entries(re.compile(loading_pattern), content)
     counter = 0
     
     for entry_match in loading_entries:
+        # Each entry runs the init, scene opening and sub-component patterns over its block
+        record_parser_stats(matches=1, regex_evaluations=2 + len(subcomponent_patterns))
         timestamp_str = entry_match.group(1) if entry_match.lastindex >= 2 and entry_match.group(1) else f"Entry_{counter}"
         group_offset = 0 if timestamp_str.startswith("Entry_") else 0
         total_loading_time = float(entry_match.group(2))
@@ -90,4 +110,6 @@ def parse_loading_times(log_file):
         loading_data.append(entry_data)
         counter += 1
     
+    record_parser_stats(lines_scanned=count_log_lines(content), regex_evaluations=1)
+    
     return pd.DataFrame(loading_data) if loading_data else pd.DataFrame()
@@ -0,0 +1,565 @@
+import io
+import multiprocessing
+import os
+import time
+import pandas as pd
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from Utils import *
+from .asset_parser import parse_asset_imports
+from .assetpipeline_parser import parse_asset_pipeline_refresh_with_operations
+from .buildreport_parser import parse_build_reports
+from .domainreload_parser import parse_domain_reloads_with_operations
+from .il2cpp_parser import parse_il2cpp_processing
+from .loading_parser import parse_loading_times
+from .performance_parser import parse_performance_report
+from .playerbuild_parser import parse_player_build_info
+from .session_parser import parse_log_sessions, read_log_session
+from .shader_parser import parse_shader_log
+from .shadererrors_parser import SHADER_ISSUE_SAMPLE_LINES, parse_shader_errors_warnings
+from .timestampindex_parser import extract_log_window
+from .tundra_parser import associate_tundra_runs, parse_tundra_build_info
+from .utp_parser import index_utp_messages
+
+# Every data type enabled
+DEFAULT_PARSING_OPTIONS = {
+    'shader': True,
+    'imports': True,
+    'loading': True,
+    'build_report': True,
+    'pipeline': True,
+    'domain_reload': True,
+    'player_build': True,
+    'il2cpp': True,
+    'tundra': True,
+    'timestamp_gaps': True,
+    'performance_report': True,
+    'split_sessions': True
+}
+
+# Parser runs per parsing option, used to report progress as a fraction
+PARSER_RUNS_PER_OPTION = {
+    'shader': 2, 'imports': 1, 'loading': 1, 'build_report': 1, 'pipeline': 1, 'domain_reload': 1,
+    'player_build': 1, 'il2cpp': 1, 'tundra': 1, 'performance_report': 1
+}
+
+
+# Minimum time between two byte-level progress reports of a parser, in seconds
+PROGRESS_REPORT_INTERVAL = 0.2
+
+# Logs smaller than this parse their sessions one after the other: starting worker processes costs more
+SESSION_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Seconds between two checks for cancellation while sessions are parsed in parallel
+SESSION_POLL_INTERVAL = 0.2
+
+# Cached helpers a parser reads the log through; a partial result has to be cleared from them too
+PARSER_CACHED_HELPERS = {
+    parse_player_build_info: (index_utp_messages,)
+}
+
+
+def clear_partial_result(parser, log_file):
+    """Drop a result parsed under a budget from the parser caches, so a later full parse doesn't reuse it."""
+    for cached_function in (parser,) + PARSER_CACHED_HELPERS.get(parser, ()):
+        cached_function.clear(log_file)
+
+
+def empty_parsed_data():
+    """The parsed data of a log before any parser has run (every data type empty)."""
+    return {
+        'shader_df': pd.DataFrame(),
+        'shader_issues': {},
+        'import_df': pd.DataFrame(),
+        'loading_df': pd.DataFrame(),
+        'build_df': pd.DataFrame(),
+        'build_reports': [],
+        'total_build_size': None,
+        'total_build_unit': None,
+        'refresh_df': pd.DataFrame(),
+        'refresh_ops': None,
+        'player_build_info': [],
+        'il2cpp_data': [],
+        'domain_reloads': [],
+        'domain_reload_ops': None,
+        'has_domain_reloads': False,
+        'tundra_info': [],
+        'unity_version': None,
+        'log_header': {},
+        'section_times': {},
+        'overall_time': 0.0,
+        'performance_df': pd.DataFrame(),
+        'parser_stats': [],
+        'coverage': {},
+        'time_window': None,
+        'window_log': None,
+        'event_timeline': None
+    }
+
+
+def parse_log_data(log_file, parsing_options=None, progress=None, step_done=None, cancel_event=None):
+    """
+    Run the selected parsers over a log without any Streamlit UI and return the parsed data the app keeps
+    in session state. All callbacks are optional, so this also runs from the CLI, the service and workers:
+    - progress(fraction, message, **details) is called before each parser and while it reads the log,
+      with details stage, stage_bytes, total_bytes (None until known for compressed logs), throughput
+      (bytes per second) and eta_seconds
+    - step_done(step_name, parsed_data) is called after each data type with a copy of the data parsed so far
+    - once cancel_event (a threading.Event) is set, parsing stops with JobCancelled at the next chunk read
+    The time_budget_seconds and memory_budget_mb options bound the analysis: the time left is shared
+    equally by the remaining parsers, and a parser over its share (or once parsing has used more memory
+    than the budget) stops at a line boundary with the results so far. Data types parsed from only part of
+    the log are listed in parsed_data['coverage'] with the byte range covered.
+    With the split_sessions option, a log holding several Editor sessions is split at their banners and each
+    session is parsed on its own (in parallel worker processes for large logs, see parse_sessions_data).
+    The time_window option, a (start, end) pair of datetimes (either may be None), cuts the log to the lines
+    logged in that window before any parser runs; parsed_data['window_log'] holds the cut log, which views
+    reading the log themselves must use, and parsed_data['time_window'] its bounds and byte range.
+    parsed_data['event_timeline'] puts every timed event in one store (see build_event_timeline).
+    """
+    options = dict(DEFAULT_PARSING_OPTIONS)
+    options.update(parsing_options or {})
+    trace_memory = options.get('trace_memory', False)
+    time_window = options.get('time_window')
+    time_budget = options.get('time_budget_seconds')
+    memory_budget_mb = options.get('memory_budget_mb')
+
+    start_time_overall = time.time()
+    parsed_data = empty_parsed_data()
+    section_times = parsed_data['section_times']
+    parser_stats = parsed_data['parser_stats']
+    coverage = parsed_data['coverage']
+
+    deadline = start_time_overall + time_budget if time_budget else None
+    # The memory budget counts what parsing adds to the process (not enforced where RSS can't be read)
+    baseline_rss = current_rss_mb() if memory_budget_mb else None
+
+    total_runs = sum(runs for option, runs in PARSER_RUNS_PER_OPTION.items() if options.get(option))
+    completed_runs = 0
+    # Compressed logs report progress against their decompressed size once a parser has read them fully
+    total_bytes = uncompressed_log_size(log_file)
+    current_message = None
+
+    def check_cancelled():
+        if cancel_event is not None and cancel_event.is_set():
+            raise JobCancelled("Parsing was cancelled")
+
+    def report(message, section=None, stage_bytes=0, stage_seconds=0.0):
+        nonlocal current_message
+        current_message = message
+        if progress is None:
+            return
+        stage_fraction = min(stage_bytes / total_bytes, 1.0) if total_bytes else 0.0
+        fraction = (completed_runs + stage_fraction) / total_runs if total_runs else 0.0
+        elapsed = time.time() - start_time_overall
+        progress(
+            fraction, message,
+            stage=section,
+            stage_bytes=stage_bytes,
+            total_bytes=total_bytes,
+            throughput=stage_bytes / stage_seconds if stage_seconds > 0 else None,
+            eta_seconds=elapsed / fraction * (1.0 - fraction) if fraction > 0 else None
+        )
+
+    def finish(step_name):
+        if step_done is not None:
+            step_done(step_name, dict(parsed_data, section_times=dict(section_times), parser_stats=list(parser_stats),
+                                      coverage=dict(coverage)))
+
+    def run_parser(section, keys, parser, *args):
+        """
+        Run a parser with instrumentation and record its wall time and counters.
+        keys are the parsed_data entries built from its result, marked as partial if it stops early.
+        """
+        nonlocal completed_runs, total_bytes
+        check_cancelled()
+        stage_start = time.time()
+        last_report = stage_start
+
+        stop_reading = None
+        if deadline is not None or baseline_rss is not None:
+            # Every remaining parser gets the same share of the time left, so each data type covers part of the log
+            stage_deadline = None
+            if deadline is not None:
+                stage_deadline = stage_start + max(deadline - stage_start, 0.0) / max(total_runs - completed_runs, 1)
+
+            def stop_reading():
+                if stage_deadline is not None and time.time() >= stage_deadline:
+                    return True
+                return baseline_rss is not None and current_rss_mb() - baseline_rss >= memory_budget_mb
+
+        def on_read(bytes_read):
+            nonlocal last_report
+            check_cancelled()
+            now = time.time()
+            if now - last_report >= PROGRESS_REPORT_INTERVAL:
+                last_report = now
+                report(current_message, section, bytes_read, now - stage_start)
+
+        result, stats = run_instrumented(section, parser, *args, trace_memory=trace_memory, on_read=on_read,
+                                         stop_reading=stop_reading)
+        section_times[section] = stats['wall_seconds']
+        parser_stats.append(stats)
+        completed_runs += 1
+        if stats['truncated']:
+            clear_partial_result(parser, log_file)
+            for key in keys:
+                coverage[key] = {'start_byte': 0, 'end_byte': stats['covered_bytes'], 'total_bytes': total_bytes}
+        elif total_bytes is None and stats['bytes_read']:
+            total_bytes = stats['bytes_read']
+        return result
+
+    # Read the session header (Unity version, platform, command line) from the start of the log first
+    report("Reading Unity version...")
+    log_header = probe_log_header(log_file)
+    parsed_data['log_header'] = log_header
+    parsed_data['unity_version'] = log_header['unity_version']
+
+    if time_window:
+        # Seek to the window through the timestamp index; every parser then only reads the window
+        report("Finding the time window...")
+        window_start = time.time()
+        log_file, parsed_data['time_window'] = extract_log_window(log_file, *time_window)
+        parsed_data['window_log'] = log_file
+        section_times["Find Time Window"] = time.time() - window_start
+        total_bytes = uncompressed_log_size(log_file)
+
+    if options.get('split_sessions'):
+        report("Finding Editor sessions...")
+        split_start = time.time()
+        sessions = parse_log_sessions(log_file)
+        section_times["Split Sessions"] = time.time() - split_start
+        if len(sessions) > 1:
+            session_options = dict(options, split_sessions=False, time_window=None)
+            merged = parse_sessions_data(log_file, sessions, session_options, progress, step_done, cancel_event)
+            merged['time_window'] = parsed_data['time_window']
+            merged['window_log'] = parsed_data['window_log']
+            merged['section_times'].update(section_times)
+            merged['section_times']["Total Processing Time"] = merged['overall_time'] = time.time() - start_time_overall
+            return merged
+
+    if options['shader']:
+        report("Parsing shader compilation data...")
+        parsed_data['shader_df'] = run_parser("Parse Shader Log", ('shader_df',), parse_shader_log, log_file)
+        finish("Shader Compilation Data")
+
+        report("Parsing shader errors and warnings...")
+        parsed_data['shader_issues'] = run_parser("Parse Shader Issues", ('shader_issues',), parse_shader_errors_warnings, log_file)
+        finish("Shader Issues")
+
+    if options['imports']:
+        report("Parsing asset import data...")
+        parsed_data['import_df'] = run_parser("Parse Asset Imports", ('import_df',), parse_asset_imports, log_file)
+        finish("Asset Import Data")
+
+    if options['loading']:
+        report("Parsing project loading times...")
+        parsed_data['loading_df'] = run_parser("Parse Loading Times", ('loading_df',), parse_loading_times, log_file)
+        finish("Project Loading Times")
+
+    if options['build_report']:
+        report("Parsing build report data...")
+        build_reports = run_parser("Parse Build Report", ('build_df', 'build_reports'), parse_build_reports, log_file)
+        parsed_data['build_reports'] = build_reports
+        # The summary and the PDF report use the first build report
+        if build_reports:
+            parsed_data['build_df'] = build_reports[0]['build_df']
+            parsed_data['total_build_size'] = build_reports[0]['total_build_size']
+            parsed_data['total_build_unit'] = build_reports[0]['total_build_unit']
+        finish("Build Report Data")
+
+    if options['pipeline']:
+        report("Parsing asset pipeline refresh data...")
+        parsed_data['refresh_df'], parsed_data['refresh_ops'] = run_parser(
+            "Parse Asset Pipeline Refresh", ('refresh_df', 'refresh_ops'), parse_asset_pipeline_refresh_with_operations, log_file)
+        finish("Asset Pipeline Refresh Data")
+
+    if options['player_build']:
+        report("Parsing player build information...")
+        parsed_data['player_build_info'] = run_parser("Parse Player Build Info", ('player_build_info',), parse_player_build_info, log_file)
+        finish("Player Build Information")
+
+    if options['il2cpp']:
+        report("Parsing IL2CPP processing data...")
+        parsed_data['il2cpp_data'] = run_parser("Parse IL2CPP Processing", ('il2cpp_data',), parse_il2cpp_processing, log_file)
+        finish("IL2CPP Processing Data")
+
+    if options['tundra']:
+        report("Parsing Tundra build data...")
+        parsed_data['tundra_info'] = run_parser("Parse Tundra Build Info", ('tundra_info',), parse_tundra_build_info, log_file)
+        finish("Tundra Build Information")
+
+    if options['domain_reload']:
+        report("Parsing domain reload data...")
+        parsed_data['domain_reloads'], parsed_data['domain_reload_ops'] = run_parser(
+            "Parse Domain Reloads", ('domain_reloads', 'domain_reload_ops'), parse_domain_reloads_with_operations, log_file)
+        parsed_data['has_domain_reloads'] = bool(parsed_data['domain_reloads'])
+        finish("Domain Reload Data")
+
+    if options['performance_report']:
+        report("Parsing performance report data...")
+        parsed_data['performance_df'] = run_parser("Parse Performance Report", ('performance_df',), parse_performance_report, log_file)
+        finish("Performance Report Data")
+
+    # The size of a compressed log is only known once a parser has read all of it
+    for key_coverage in coverage.values():
+        if key_coverage['total_bytes'] is None:
+            key_coverage['total_bytes'] = total_bytes
+
+    # Each Tundra run belongs to a player build or a script compilation
+    parsed_data['tundra_info'] = associate_tundra_runs(parsed_data['tundra_info'], parsed_data['player_build_info'],
+                                                       parsed_data['refresh_df'])
+
+    # Every timed event in one store, for the timeline and time range queries
+    timeline_start = time.time()
+    parsed_data['event_timeline'] = build_event_timeline(parsed_data)
+    section_times["Build Event Timeline"] = time.time() - timeline_start
+
+    overall_time = time.time() - start_time_overall
+    section_times["Total Processing Time"] = overall_time
+    parsed_data['overall_time'] = overall_time
+    report("Parsing complete")
+
+    return parsed_data
+
+
+def _parse_session(source, session, parsing_options):
+    """Parse one session in a worker process; source is the path of a plain log or the session's bytes."""
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            file.seek(session['start_byte'])
+            source = file.read(session['end_byte'] - session['start_byte'])
+    return parse_log_data(io.BytesIO(source), parsing_options)
+
+
+def _offset_shader_issues(shader_issues, line_offset):
+    """Shader issues of a session with their line numbers counted from the start of the whole log."""
+    return {
+        kind: [dict(issue, first_line=issue['first_line'] + line_offset, last_line=issue['last_line'] + line_offset)
+               for issue in issues]
+        for kind, issues in shader_issues.items()
+    }
+
+
+def _offset_line_number(entry, line_offset):
+    """An entry of a session with its line number counted from the start of the whole log."""
+    if entry.get('line_number') is None:
+        return entry
+    return dict(entry, line_number=entry['line_number'] + line_offset)
+
+
+def _merge_shader_issues(session_issues):
+    """Group the issues of every session by shader and normalized message again, summing their counts."""
+    merged = {}
+    for shader_issues in session_issues:
+        for kind, issues in shader_issues.items():
+            grouped = merged.setdefault(kind, {})
+            for issue in issues:
+                key = (issue['shader_name'], issue['normalized_message'])
+                if key not in grouped:
+                    grouped[key] = dict(issue, samples=list(issue['samples']))
+                    continue
+                existing = grouped[key]
+                existing['count'] += issue['count']
+                existing['first_line'] = min(existing['first_line'], issue['first_line'])
+                existing['last_line'] = max(existing['last_line'], issue['last_line'])
+                existing['samples'].extend(issue['samples'][:max(SHADER_ISSUE_SAMPLE_LINES - len(existing['samples']), 0)])
+    return {kind: list(grouped.values()) for kind, grouped in merged.items()}
+
+
+def _merge_frames(frames):
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _merge_parser_stats(session_stats):
+    """One row per parser: counters summed over the sessions, the largest peak memory."""
+    merged = {}
+    for stats in session_stats:
+        for row in stats:
+            total = merged.get(row['parser'])
+            if total is None:
+                merged[row['parser']] = dict(row)
+                continue
+            for key in ('wall_seconds', 'bytes_read', 'decode_seconds', 'lines_scanned', 'regex_evaluations',
+                        'matches', 'rows_emitted'):
+                total[key] += row[key]
+            if row.get('peak_memory_mb') is not None:
+                total['peak_memory_mb'] = max(total.get('peak_memory_mb') or 0.0, row['peak_memory_mb'])
+            total['cache_hit'] = total['cache_hit'] and row['cache_hit']
+            total['truncated'] = total['truncated'] or row['truncated']
+    return list(merged.values())
+
+
+def merge_session_data(session_data, total_bytes):
+    """
+    Merge the parsed data of every session of a log into one set of results (the "all sessions" view):
+    tables and lists are concatenated in session order, domain reload ids renumbered across sessions and
+    shader issues grouped again. A data type parsed from only part of a session is partial in the merge too.
+    """
+    merged = empty_parsed_data()
+    if not session_data:
+        return merged
+    first = session_data[0]
+    merged['log_header'] = first['log_header']
+    merged['unity_version'] = first['unity_version']
+
+    for key in ('shader_df', 'import_df', 'loading_df', 'refresh_df'):
+        merged[key] = _merge_frames([data[key] for data in session_data])
+    for key in ('build_reports', 'il2cpp_data', 'domain_reloads'):
+        merged[key] = [entry for data in session_data for entry in data[key]]
+    # Player builds and Tundra runs are associated again over the whole log, by line numbers counted from its start
+    for key in ('player_build_info', 'tundra_info'):
+        merged[key] = [_offset_line_number(entry, data['session']['start_line']) for data in session_data for entry in data[key]]
+    merged['tundra_info'] = associate_tundra_runs(merged['tundra_info'], merged['player_build_info'], merged['refresh_df'])
+    merged['refresh_ops'] = _merge_frames([data['refresh_ops'] for data in session_data])
+
+    # Worker thread totals are kept on the import table
+    worker_stats = [data['import_df'].worker_stats for data in session_data if hasattr(data['import_df'], 'worker_stats')]
+    if worker_stats:
+        merged['import_df'].worker_stats = pd.concat(worker_stats).groupby('worker_id', as_index=False)[['imports', 'total_time']].sum()
+
+    # Domain reload operations point at reloads and operations by position, which restarts in every session
+    reload_ops = []
+    reload_count = 0
+    op_count = 0
+    for data in session_data:
+        ops = data['domain_reload_ops']
+        if ops is not None and not ops.empty:
+            ops = ops.copy()
+            ops['reload_id'] += reload_count
+            ops['op_id'] += op_count
+            ops['parent_id'] += op_count
+            op_count += len(ops)
+            reload_ops.append(ops)
+        reload_count += len(data['domain_reloads'])
+    merged['domain_reload_ops'] = pd.concat(reload_ops, ignore_index=True) if reload_ops else first['domain_reload_ops']
+
+    # Performance report dumps are numbered per session too
+    dumps = []
+    dump_count = 0
+    for data in session_data:
+        performance_df = data['performance_df']
+        if performance_df is not None and not performance_df.empty:
+            performance_df = performance_df.copy()
+            performance_df['dump_index'] += dump_count
+            dump_count = performance_df['dump_index'].max() + 1
+            dumps.append(performance_df)
+    merged['performance_df'] = pd.concat(dumps, ignore_index=True) if dumps else pd.DataFrame()
+    merged['has_domain_reloads'] = bool(merged['domain_reloads'])
+
+    merged['shader_issues'] = _merge_shader_issues(
+        _offset_shader_issues(data['shader_issues'], data['session']['start_line']) for data in session_data)
+
+    if merged['build_reports']:
+        merged['build_df'] = merged['build_reports'][0]['build_df']
+        merged['total_build_size'] = merged['build_reports'][0]['total_build_size']
+        merged['total_build_unit'] = merged['build_reports'][0]['total_build_unit']
+
+    # Section times add up the work done for every session
+    for data in session_data:
+        for section, seconds in data['section_times'].items():
+            merged['section_times'][section] = merged['section_times'].get(section, 0.0) + seconds
+    merged['parser_stats'] = _merge_parser_stats(data['parser_stats'] for data in session_data)
+
+    # Partial coverage: the bytes covered in every session, over the whole log
+    for key in {key for data in session_data for key in data['coverage']}:
+        covered = 0
+        for data in session_data:
+            session = data['session']
+            if key in data['coverage']:
+                covered += data['coverage'][key]['end_byte']
+            else:
+                covered += session['end_byte'] - session['start_byte']
+        merged['coverage'][key] = {'start_byte': 0, 'end_byte': covered, 'total_bytes': total_bytes}
+
+    merged['event_timeline'] = build_event_timeline(merged)
+    merged['sessions'] = session_data
+    return merged
+
+
+def parse_sessions_data(log_file, sessions, parsing_options, progress=None, step_done=None, cancel_event=None):
+    """
+    Parse every session of a log independently (see parse_log_sessions) and merge the results.
+    Large logs are parsed in parallel worker processes, one session each; each session's parsed data keeps
+    its session entry and, for logs not read from a path, the session's text as window_log for the views.
+    progress and step_done are called as each session finishes; cancel_event is checked meanwhile.
+    """
+    start_time = time.time()
+    total_bytes = sessions[-1]['end_byte']
+    results = {}
+    # Views that read the log themselves need each session's text; paths can be read again later
+    keep_text = not isinstance(log_file, str)
+
+    def session_done(session, parsed):
+        parsed['session'] = session
+        if keep_text:
+            parsed['window_log'] = io.BytesIO(read_log_session(log_file, session))
+        results[session['index']] = parsed
+        if progress is not None:
+            progress(len(results) / len(sessions), f"Parsed {len(results)} of {len(sessions)} sessions...")
+        if step_done is not None:
+            step_done(f"Session {session['index'] + 1}",
+                      merge_session_data([results[index] for index in sorted(results)], total_bytes))
+
+    def check_cancelled():
+        if cancel_event is not None and cancel_event.is_set():
+            raise JobCancelled("Parsing was cancelled")
+
+    if progress is not None:
+        progress(0.0, f"Parsing {len(sessions)} sessions...")
+
+    workers = min(len(sessions), os.cpu_count() or 1)
+    # Worker processes only pay off for big logs on machines with more than one core
+    if total_bytes < SESSION_PARALLEL_MIN_BYTES or workers < 2:
+        for session in sessions:
+            check_cancelled()
+
+            def session_progress(fraction, message=None, **details):
+                # The session's own ETA doesn't cover the sessions after it
+                progress((len(results) + fraction) / len(sessions),
+                         f"Session {session['index'] + 1} of {len(sessions)}: {message}", **dict(details, eta_seconds=None))
+
+            session_options = parsing_options
+            if parsing_options.get('time_budget_seconds'):
+                # One after the other, the sessions share the time budget left
+                remaining = parsing_options['time_budget_seconds'] - (time.time() - start_time)
+                session_options = dict(parsing_options, time_budget_seconds=max(remaining, 0.001) / (len(sessions) - len(results)))
+            parsed = parse_log_data(io.BytesIO(read_log_session(log_file, session)), session_options,
+                                    progress=session_progress if progress is not None else None,
+                                    cancel_event=cancel_event)
+            session_done(session, parsed)
+    else:
+        # Plain logs on disk are read by the workers themselves; others are sent session by session
+        plain_path = isinstance(log_file, str) and not is_compressed_log(log_file)
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        queued = iter(sessions)
+        pending = {}
+
+        def submit_next():
+            # A session is read when a worker is free for it, so at most one session per worker is in memory
+            session = next(queued, None)
+            if session is not None:
+                source = log_file if plain_path else read_log_session(log_file, session)
+                pending[executor.submit(_parse_session, source, session, parsing_options)] = session
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                check_cancelled()
+                done, _ = wait(pending, timeout=SESSION_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    session_done(pending.pop(future), future.result())
+                    submit_next()
+        finally:
+            # Sessions not started yet are dropped; running ones are left to finish in the background
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=not pending)
+
+    merged = merge_session_data([results[index] for index in sorted(results)], total_bytes)
+    merged['overall_time'] = time.time() - start_time
+    merged['section_times']["Total Processing Time"] = merged['overall_time']
+    return merged
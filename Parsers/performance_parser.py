@@ -1,93 +1,105 @@
 import re
 import pandas as pd
+import streamlit as st
+
+from Utils import *
+
+# Regex pattern to match performance report entries
+PERFORMANCE_PATTERN = re.compile(r'\[Performance\] (.*?)\s*:\s*(\d+) samples, Peak.\s*([\d.]+) (\w+) \((\d+\.\d+)x\), Avg.\s*([\d.]+) (\w+), Total. ([\d.]+) (\w+) \(([\d.]+)%\)')
+
+# Timestamp prefix of the line that introduces a dump (or of a [Performance] line itself)
+TIMESTAMP_PREFIX_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|')
+
+# Time units and how to convert them to microseconds (value * multiplier / divisor); unknown units are kept as is
+MICROSECOND_MULTIPLIERS = {'us': 1, 'ms': 1000, 's': 1000000}
+MICROSECOND_DIVISORS = {'ns': 1000}
+
+PERFORMANCE_COLUMNS = ['operation', 'category', 'operation_name', 'samples', 'peak_value', 'peak_unit', 'peak_factor',
+                       'avg_value', 'avg_unit', 'total_value', 'total_unit', 'percentage', 'dump_index', 'dump_timestamp_str']
+
+
+def _split_operation(operation):
+    """Extract category and operation name."""
+    parts = operation.split(':', 1)
+    if len(parts) > 1:
+        return parts[0].strip(), parts[1].strip()
+    # Try to extract category in another way
+    parts = operation.split('.', 1)
+    if len(parts) > 1:
+        return parts[0].strip(), parts[1].strip()
+    return "Other", operation.strip()
 
-def parse_performance_report(log_file):
-    """Parse Unity Performance Report entries from the log file."""
-    performance_data = []
-    
-    # Regex pattern to match performance report entries
-    pattern = re.compile(r'\[Performance\] (.*?)\s*:\s*(\d+) samples, Peak.\s*([\d.]+) (\w+) \((\d+\.\d+)x\), Avg.\s*([\d.]+) (\w+), Total. ([\d.]+) (\w+) \(([\d.]+)%\)')
-    
-    # Process content based on input type
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            process_lines(file, pattern, performance_data)
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        content = log_file.read().decode('utf-8', errors='ignore')
-        process_lines(content.splitlines(), pattern, performance_data)
-                
-    return pd.DataFrame(performance_data) if performance_data else pd.DataFrame()
-
-def process_lines(lines, pattern, performance_data):
-    """Process each line to extract performance data."""
-    for line in lines:
-        # Make sure line is a string
-        if isinstance(line, bytes):
-            line = line.decode('utf-8', errors='ignore')
-            
-        match = pattern.search(line)
-        if match:
-            operation = match.group(1)
-            samples = int(match.group(2))
-            peak_value = float(match.group(3))
-            peak_unit = match.group(4)
-            peak_factor = float(match.group(5))
-            avg_value = float(match.group(6))
-            avg_unit = match.group(7)
-            total_value = float(match.group(8))
-            total_unit = match.group(9)
-            percentage = float(match.group(10))
-            
-            # Convert units to microseconds for consistent comparison
-            peak_us = convert_to_microseconds(peak_value, peak_unit)
-            avg_us = convert_to_microseconds(avg_value, avg_unit)
-            total_us = convert_to_microseconds(total_value, total_unit)
-            
-            # Extract category and operation
-            parts = operation.split(':', 1)
-            if len(parts) > 1:
-                category = parts[0].strip()
-                operation_name = parts[1].strip()
-            else:
-                # Try to extract category in another way
-                parts = operation.split('.', 1)
-                if len(parts) > 1:
-                    category = parts[0].strip()
-                    operation_name = parts[1].strip()
-                else:
-                    category = "Other"
-                    operation_name = operation.strip()
-            
-            performance_data.append({
-                'operation': operation,
-                'category': category,
-                'operation_name': operation_name,
-                'samples': samples,
-                'peak_value': peak_value,
-                'peak_unit': peak_unit,
-                'peak_factor': peak_factor,
-                'avg_value': avg_value,
-                'avg_unit': avg_unit,
-                'total_value': total_value,
-                'total_unit': total_unit,
-                'percentage': percentage,
-                'peak_us': peak_us,
-                'avg_us': avg_us,
-                'total_us': total_us
-            })
 
 def convert_to_microseconds(value, unit):
-    """Convert various time units to microseconds for consistent comparison."""
-    if unit == 'ns':
-        return value / 1000  # nanoseconds to microseconds
-    elif unit == 'us':
-        return value  # already in microseconds
-    elif unit == 'ms':
-        return value * 1000  # milliseconds to microseconds
-    elif unit == 's':
-        return value * 1000000  # seconds to microseconds
-    else:
-        return value  # unknown unit, return as is
+    """Convert a time value (a number or a Series, with a matching unit or Series of units) to microseconds."""
+    if isinstance(unit, pd.Series):
+        return value * unit.map(MICROSECOND_MULTIPLIERS).fillna(1) / unit.map(MICROSECOND_DIVISORS).fillna(1)
+    return value * MICROSECOND_MULTIPLIERS.get(unit, 1) / MICROSECOND_DIVISORS.get(unit, 1)
+
+
+@st.cache_data
+def parse_performance_report(log_file):
+    """
+    Parse Unity Performance Report entries from the log file. The log may print the report several times;
+    each contiguous run of [Performance] lines is one dump, and every row is tagged with its dump_index and
+    the dump_timestamp_str of the line that introduced it (None without timestamps).
+    """
+    columns = {column: [] for column in PERFORMANCE_COLUMNS}
+
+    dump_index = -1
+    dump_timestamp_str = None
+    in_dump = False
+    previous_line = ''
+
+    line_count = 0
+    evaluations = 0
+    matches = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+        match = None
+        if '[Performance] ' in line:
+            evaluations += 1
+            match = PERFORMANCE_PATTERN.search(line)
+
+        if not match:
+            in_dump = False
+            previous_line = line
+            continue
+        matches += 1
+
+        # The first entry of a run starts a new dump
+        if not in_dump:
+            in_dump = True
+            dump_index += 1
+            evaluations += 1
+            timestamp_match = TIMESTAMP_PREFIX_PATTERN.match(previous_line) or TIMESTAMP_PREFIX_PATTERN.match(line)
+            dump_timestamp_str = timestamp_match.group(1) if timestamp_match else None
+
+        operation = match.group(1)
+        category, operation_name = _split_operation(operation)
+        columns['operation'].append(operation)
+        columns['category'].append(category)
+        columns['operation_name'].append(operation_name)
+        columns['samples'].append(int(match.group(2)))
+        columns['peak_value'].append(float(match.group(3)))
+        columns['peak_unit'].append(match.group(4))
+        columns['peak_factor'].append(float(match.group(5)))
+        columns['avg_value'].append(float(match.group(6)))
+        columns['avg_unit'].append(match.group(7))
+        columns['total_value'].append(float(match.group(8)))
+        columns['total_unit'].append(match.group(9))
+        columns['percentage'].append(float(match.group(10)))
+        columns['dump_index'].append(dump_index)
+        columns['dump_timestamp_str'].append(dump_timestamp_str)
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches)
+
+    if not matches:
+        return pd.DataFrame()
+
+    performance_df = pd.DataFrame(columns, columns=PERFORMANCE_COLUMNS)
+    # Convert units to microseconds for consistent comparison, a whole column at a time
+    performance_df['peak_us'] = convert_to_microseconds(performance_df['peak_value'], performance_df['peak_unit'])
+    performance_df['avg_us'] = convert_to_microseconds(performance_df['avg_value'], performance_df['avg_unit'])
+    performance_df['total_us'] = convert_to_microseconds(performance_df['total_value'], performance_df['total_unit'])
+    return performance_df
@@ -0,0 +1,187 @@
+import io
+import math
+import random
+import time
+
+from Utils import *
+from .asset_parser import parse_asset_imports
+from .assetpipeline_parser import parse_asset_pipeline_refresh
+from .domainreload_parser import parse_domain_reloads
+from .shader_parser import parse_shader_log
+
+# Number of evenly spaced chunks parsed by the quick look
+QUICK_LOOK_SAMPLES = 64
+
+# Size of each sampled chunk (extended to the end of its last line)
+QUICK_LOOK_CHUNK_SIZE = 256 * 1024
+
+# Two-sided 95% confidence (normal approximation, fine for the default sample count)
+QUICK_LOOK_CONFIDENCE_Z = 1.96
+
+# Estimated metrics: (key, label, parsing option, parsed data key, summary total, kind). Totals come from
+# performance_summary_totals, counts from the number of rows. Rare events such as builds and project
+# loads are left out: a few entries in a whole log can't be extrapolated from samples.
+QUICK_LOOK_METRICS = [
+    ('import_time', "Total Asset Import Time", 'imports', 'import_df', 'import', 'time'),
+    ('import_count', "Asset Imports", 'imports', 'import_df', None, 'count'),
+    ('shader_time', "Total Shader Processing Time", 'shader', 'shader_df', 'shader', 'time'),
+    ('shader_count', "Shader Compilations", 'shader', 'shader_df', None, 'count'),
+    ('refresh_time', "Total Pipeline Refresh Time", 'pipeline', 'refresh_df', 'refresh', 'time'),
+    ('refresh_count', "Pipeline Refreshes", 'pipeline', 'refresh_df', None, 'count'),
+    ('domain_reload_time', "Total Domain Reload Time", 'domain_reload', 'domain_reloads', 'domain_reload', 'time'),
+    ('domain_reload_count', "Domain Reloads", 'domain_reload', 'domain_reloads', None, 'count'),
+]
+
+# Line-local parsers run on each sample, by the parsed data key they produce
+QUICK_LOOK_PARSERS = {
+    'import_df': parse_asset_imports,
+    'shader_df': parse_shader_log,
+    'refresh_df': parse_asset_pipeline_refresh,
+    'domain_reloads': parse_domain_reloads,
+}
+
+
+def _read_line_aligned(stream, start, chunk_size):
+    """Read about chunk_size bytes from start, beginning after the first line break and ending at a line end."""
+    stream.seek(start)
+    if start > 0:
+        # Skip the rest of the line the chunk starts in; it belongs to the previous stratum
+        stream.readline()
+    data = stream.read(chunk_size)
+    if data and not data.endswith(b'\n' if isinstance(data, bytes) else '\n'):
+        data += stream.readline()
+    return data.encode('utf-8') if isinstance(data, str) else data
+
+
+def _sample_positions(log_size, sample_count, chunk_size, seed):
+    """One chunk start per stratum (equal slices of the log), at a random offset inside its stratum."""
+    rng = random.Random(seed)
+    stratum_size = log_size / sample_count
+    positions = []
+    for index in range(sample_count):
+        stratum_start = int(index * stratum_size)
+        slack = max(int(stratum_size) - chunk_size, 0)
+        positions.append(stratum_start + rng.randint(0, slack))
+    return positions
+
+
+def _sample_values(sample, keys):
+    """Parse one sample with the selected parsers and return the value of every metric in it."""
+    parsed = {key: QUICK_LOOK_PARSERS[key].__wrapped__(io.BytesIO(sample)) for key in keys}
+    totals = performance_summary_totals(parsed)
+    values = {}
+    for metric, _, _, key, total, kind in QUICK_LOOK_METRICS:
+        if key not in parsed:
+            continue
+        if kind == 'count':
+            values[metric] = len(parsed[key])
+        else:
+            values[metric] = float(totals[total] or 0.0)
+    return values
+
+
+def estimate_log_totals(log_file, parsing_options=None, sample_count=QUICK_LOOK_SAMPLES,
+                        chunk_size=QUICK_LOOK_CHUNK_SIZE, seed=0):
+    """
+    Quick look at a log without parsing all of it: split the log into sample_count equal strata, parse one
+    line-aligned chunk of about chunk_size bytes from each with the line-local parsers, and extrapolate the
+    Performance Summary totals and counts with a 95% confidence interval. Only about
+    sample_count * chunk_size bytes are read, whatever the size of the log; smaller logs are parsed whole
+    and the result is exact.
+    Returns {'log_bytes', 'sampled_bytes', 'sample_count', 'exact', 'elapsed_seconds', 'estimates'} where
+    estimates maps each metric to {'label', 'kind', 'estimate', 'low', 'high', 'observed'}.
+    Compressed logs can't be read at arbitrary offsets, so they raise ValueError.
+    """
+    start_time = time.time()
+    options = dict(parsing_options or {})
+    keys = {key for _, _, option, key, _, _ in QUICK_LOOK_METRICS if options.get(option, True)}
+
+    log_size = uncompressed_log_size(log_file)
+    if log_size is None:
+        raise ValueError("The quick look needs an uncompressed log: compressed logs can't be sampled without reading them whole.")
+
+    if isinstance(log_file, str):
+        stream = open(log_file, 'rb')
+    else:
+        stream = log_file
+    try:
+        exact = sample_count * chunk_size >= log_size
+        if exact:
+            stream.seek(0)
+            data = stream.read()
+            samples = [data.encode('utf-8') if isinstance(data, str) else data]
+        else:
+            samples = [_read_line_aligned(stream, position, chunk_size)
+                       for position in _sample_positions(log_size, sample_count, chunk_size, seed)]
+    finally:
+        if isinstance(log_file, str):
+            stream.close()
+        else:
+            stream.seek(0)
+
+    sampled_bytes = sum(len(sample) for sample in samples)
+    stratum_size = log_size / len(samples)
+    # Each sample's values scaled up to its whole stratum; their sum estimates the log total
+    stratum_totals = {metric: [] for metric, _, option, _, _, _ in QUICK_LOOK_METRICS if options.get(option, True)}
+    observed = {metric: 0.0 for metric in stratum_totals}
+    for sample in samples:
+        values = _sample_values(sample, keys) if sample else {}
+        scale = stratum_size / len(sample) if sample else 0.0
+        for metric in stratum_totals:
+            value = values.get(metric, 0.0)
+            observed[metric] += value
+            stratum_totals[metric].append(value * scale)
+
+    # Finite population correction: the sampled share of the log is known exactly
+    sampled_fraction = min(sampled_bytes / log_size, 1.0) if log_size else 1.0
+    estimates = {}
+    for metric, label, _, _, _, kind in QUICK_LOOK_METRICS:
+        if metric not in stratum_totals:
+            continue
+        scaled = stratum_totals[metric]
+        estimate = sum(scaled)
+        if exact or len(scaled) < 2:
+            margin = 0.0
+        else:
+            mean = estimate / len(scaled)
+            variance = sum((value - mean) ** 2 for value in scaled) / (len(scaled) - 1)
+            margin = QUICK_LOOK_CONFIDENCE_Z * math.sqrt(len(scaled) * (1.0 - sampled_fraction) * variance)
+        estimates[metric] = {
+            'label': label,
+            'kind': kind,
+            'estimate': observed[metric] if exact else estimate,
+            # The log holds at least what the samples contain
+            'low': observed[metric] if exact else max(estimate - margin, observed[metric]),
+            'high': observed[metric] if exact else estimate + margin,
+            'observed': observed[metric]
+        }
+
+    return {
+        'log_bytes': log_size,
+        'sampled_bytes': sampled_bytes,
+        'sample_count': len(samples),
+        'exact': exact,
+        'elapsed_seconds': time.time() - start_time,
+        'estimates': estimates
+    }
+
+
+def format_quick_look_value(value, kind):
+    """Format an estimated total (seconds) or count for display."""
+    return format_time(value) if kind == 'time' else f"{value:,.0f}"
+
+
+def format_quick_look_report(quick_look):
+    """Format the quick look estimates as a plain text table for CLI output."""
+    header = f"{'Metric':<32} {'Estimate':>28} {'95% Interval':>60}"
+    lines = [header, "-" * len(header)]
+    for estimate in quick_look['estimates'].values():
+        interval = f"{format_quick_look_value(estimate['low'], estimate['kind'])} - " \
+                   f"{format_quick_look_value(estimate['high'], estimate['kind'])}"
+        lines.append(f"{estimate['label']:<32} {format_quick_look_value(estimate['estimate'], estimate['kind']):>28} {interval:>60}")
+    if quick_look['exact']:
+        lines.append(f"The log is small enough to be parsed whole ({quick_look['log_bytes'] / (1024 * 1024):.1f} MB): these totals are exact.")
+    else:
+        lines.append(f"Estimated from {quick_look['sample_count']} samples ({quick_look['sampled_bytes'] / (1024 * 1024):.1f} MB "
+                     f"of {quick_look['log_bytes'] / (1024 * 1024):.1f} MB) in {quick_look['elapsed_seconds']:.1f}s.")
+    return "\n".join(lines)
@@ -0,0 +1,95 @@
+import re
+import streamlit as st
+
+from Utils import *
+
+# Every Editor session starts its log with this banner (see probe_log_header)
+SESSION_BANNER_MARKER = b"Built from "
+SESSION_BANNER_PATTERN = re.compile(rb"Built from ['\"]([^'\"\n]+)['\"] branch; Version is ['\"]([^'\"\n]+)['\"]")
+SESSION_PREFIX_PATTERN = re.compile(rb'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\|[^|\n]*\|$')
+
+
+def _banner_lines(buffer):
+    """Yield (line start, match) for every session banner line in a buffer of complete lines."""
+    position = buffer.find(SESSION_BANNER_MARKER)
+    while position != -1:
+        line_start = buffer.rfind(b'\n', 0, position) + 1
+        prefix = buffer[line_start:position]
+        # The banner starts its line, after the timestamp prefix if there is one
+        if not prefix or SESSION_PREFIX_PATTERN.match(prefix):
+            match = SESSION_BANNER_PATTERN.match(buffer, position)
+            if match:
+                yield line_start, match
+        position = buffer.find(SESSION_BANNER_MARKER, position + len(SESSION_BANNER_MARKER))
+
+
+@st.cache_data
+def parse_log_sessions(log_file):
+    """
+    Find the Editor sessions of a log (concatenated or CI-aggregated logs hold several) in one scan for the
+    "Built from ... Version is" banner each session starts with. Returns one entry per session with
+    index, start_byte, end_byte, start_line (0-based), unity_version and branch. Anything before the first
+    banner belongs to the first session; a log without banners is a single session.
+    Offsets count decompressed bytes for compressed logs.
+    """
+    sessions = []
+    stream, close = open_log_stream(log_file)
+    try:
+        base = 0        # offset of the start of buffer
+        base_line = 0   # line number of the start of buffer
+        buffer = b''
+        while True:
+            chunk = stream.read(LOG_CHUNK_SIZE)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            record_parser_stats(bytes_read=len(chunk))
+            buffer += chunk
+            # Only complete lines are searched; the partial last line is carried over
+            complete = buffer.rfind(b'\n') + 1
+            for line_start, match in _banner_lines(buffer[:complete]):
+                sessions.append({
+                    'index': len(sessions),
+                    'start_byte': base + line_start,
+                    'start_line': base_line + buffer.count(b'\n', 0, line_start),
+                    'branch': match.group(1).decode('utf-8', errors='replace'),
+                    'unity_version': match.group(2).decode('utf-8', errors='replace')
+                })
+            base_line += buffer.count(b'\n', 0, complete)
+            base += complete
+            buffer = buffer[complete:]
+        if buffer:
+            for line_start, match in _banner_lines(buffer):
+                sessions.append({
+                    'index': len(sessions),
+                    'start_byte': base + line_start,
+                    'start_line': base_line,
+                    'branch': match.group(1).decode('utf-8', errors='replace'),
+                    'unity_version': match.group(2).decode('utf-8', errors='replace')
+                })
+        total_bytes = base + len(buffer)
+    finally:
+        close()
+
+    if not sessions:
+        sessions.append({'index': 0, 'start_byte': 0, 'start_line': 0, 'branch': None, 'unity_version': None})
+    # The first session also holds whatever was logged before its banner
+    sessions[0]['start_byte'] = 0
+    sessions[0]['start_line'] = 0
+    for session, following in zip(sessions, sessions[1:] + [None]):
+        session['end_byte'] = following['start_byte'] if following else total_bytes
+
+    record_parser_stats(rows_emitted=len(sessions))
+    return sessions
+
+
+def read_log_session(log_file, session):
+    """The bytes of one session of a log (an entry of parse_log_sessions)."""
+    stream, close = open_log_stream(log_file)
+    try:
+        stream.seek(session['start_byte'])
+        data = stream.read(session['end_byte'] - session['start_byte'])
+    finally:
+        close()
+    return data.encode('utf-8') if isinstance(data, str) else data
@@ -5,13 +5,41 @@ import pandas as pd
 from Utils.data_helpers import extract_float
 from Utils import *
 
+# Start of a shader compilation entry; an entry runs until the next line with one
+COMPILING_SHADER_PATTERN = re.compile(r'Compiling (shader|compute shader)')
+
+def split_shader_entries(lines):
+    """
+    Split log lines into shader compilation entries. Each entry starts at the last "Compiling shader" or
+    "Compiling compute shader" of a line and runs until the next line containing one. The text before
+    the first entry is kept as well when it mentions Compiling.
+    """
+    entries = []
+    current = []
+    lines_scanned = 0
+    regex_evaluations = 0
+    for line in lines:
+        lines_scanned += 1
+        if 'Compiling' in line:
+            regex_evaluations += 1
+            last_match = None
+            for last_match in COMPILING_SHADER_PATTERN.finditer(line):
+                pass
+            if last_match is not None:
+                entries.append('\n'.join(current))
+                current = [line[last_match.start():]]
+                continue
+        current.append(line)
+    entries.append('\n'.join(current))
+    
+    record_parser_stats(lines_scanned=lines_scanned, regex_evaluations=regex_evaluations)
+    return [entry.strip() for entry in entries if entry.strip() and 'Compiling' in entry]
+
 @st.cache_data    
 def parse_shader_log(log_file_path):
-    content = read_log_content(log_file_path)
-    
-    # Split into individual shader compilation entries - improve the pattern
-    entries = re.split(r'(?=.*?Compiling (shader|compute shader))', content)
-    entries = [entry.strip() for entry in entries if entry.strip() and 'Compiling' in entry]
+    # Split into individual shader compilation entries while streaming the log
+    entries = split_shader_entries(iter_log_lines(log_file_path))
+    record_parser_stats(matches=len(entries))
     
     # Debug count
     print(f"Found {len(entries)} shader compilation entries")
@@ -3,43 +3,78 @@ import streamlit as st
 
 from Utils import *
 
+ERROR_PATTERN = re.compile(r"Shader error in '([^']+)': (.*)")
+WARNING_PATTERN = re.compile(r"Shader warning in '([^']+)': (.*)")
+
+# Standalone numbers (line numbers, counts) are ignored when grouping identical messages
+MESSAGE_NUMBER_PATTERN = re.compile(r'\b\d+\b')
+
+# Raw log lines kept per unique issue
+SHADER_ISSUE_SAMPLE_LINES = 5
+
+
+def normalize_shader_message(message):
+    """Return the message with standalone numbers replaced, so repeats of one issue group together."""
+    return MESSAGE_NUMBER_PATTERN.sub('N', message)
+
+
+def _add_issue(issues, shader_name, message, line, line_number):
+    """Count one occurrence of an issue, creating its entry on the first one."""
+    normalized = normalize_shader_message(message)
+    issue = issues.get((shader_name, normalized))
+    if issue is None:
+        issues[(shader_name, normalized)] = {
+            'shader_name': shader_name,
+            'message': message,
+            'normalized_message': normalized,
+            'count': 1,
+            'first_line': line_number,
+            'last_line': line_number,
+            'samples': [line]
+        }
+        return
+    issue['count'] += 1
+    issue['last_line'] = line_number
+    if len(issue['samples']) < SHADER_ISSUE_SAMPLE_LINES:
+        issue['samples'].append(line)
+
+
 @st.cache_data
 def parse_shader_errors_warnings(log_file):
-    """Extract shader errors and warnings from the log file."""
-    error_pattern = r"Shader error in '([^']+)': (.*)"
-    warning_pattern = r"Shader warning in '([^']+)': (.*)"
-    
-    shader_issues = {
-        'errors': [],
-        'warnings': []
+    """
+    Extract shader errors and warnings from the log file, aggregated while reading by shader and normalized
+    message. Each unique issue has the first message seen, its count, the first and last line numbers and up
+    to SHADER_ISSUE_SAMPLE_LINES raw lines, so repeated messages don't add a row each.
+    """
+    errors = {}
+    warnings = {}
+
+    line_count = 0
+    evaluations = 0
+    matches = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+        if "Shader error in '" in line:
+            # Check for shader errors
+            evaluations += 1
+            error_match = ERROR_PATTERN.search(line)
+            if error_match:
+                matches += 1
+                _add_issue(errors, error_match.group(1), error_match.group(2).strip(), line, line_count)
+                continue
+
+        if "Shader warning in '" in line:
+            # Check for shader warnings
+            evaluations += 1
+            warning_match = WARNING_PATTERN.search(line)
+            if warning_match:
+                matches += 1
+                _add_issue(warnings, warning_match.group(1), warning_match.group(2).strip(), line, line_count)
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=matches,
+                        rows_emitted=len(errors) + len(warnings))
+
+    return {
+        'errors': list(errors.values()),
+        'warnings': list(warnings.values())
     }
-    
-    # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            lines = file.readlines()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        lines = log_file.read().decode('utf-8', errors='ignore').splitlines()
-    
-    for line in lines:
-        # Check for shader errors
-        error_match = re.search(error_pattern, line)
-        if error_match:
-            shader_issues['errors'].append({
-                'shader_name': error_match.group(1),
-                'message': error_match.group(2).strip()
-            })
-            continue
-        
-        # Check for shader warnings
-        warning_match = re.search(warning_pattern, line)
-        if warning_match:
-            shader_issues['warnings'].append({
-                'shader_name': warning_match.group(1),
-                'message': warning_match.group(2).strip()
-            })
-    
-    return shader_issues
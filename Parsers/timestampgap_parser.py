@@ -2,6 +2,22 @@ from datetime import datetime
 import io 
 import re
 
+import numpy as np
+
+from Utils import *
+
+# Share of a gap a timed operation has to cover to be held responsible for it
+GAP_MIN_COVERAGE = 0.5
+
+# Operations recognized from the last line logged before a gap, for the ones the event timeline can't place
+# (imports on worker threads and shader compilations are logged without a timestamped duration)
+GAP_LINE_OPERATIONS = [
+    # Imports logged on one line with their duration were already over
+    ('Asset Import', re.compile(r'Start importing (.+?) using (?!.* in \d+\.\d+ seconds)')),
+    ('Shader Compilation', re.compile(r'Compiling (?:compute )?shader ("[^"]+"(?: pass "[^"]+")?)')),
+    ('Domain Reload', re.compile(r'(Begin MonoManager ReloadAssembly|Reloading assemblies.*)')),
+]
+
 def parse_timestamp_gaps(log_file_path, threshold_seconds=60):
     """
     Extract lines from the log file where time between consecutive logged lines exceeds threshold_seconds.
@@ -15,6 +31,7 @@ def parse_timestamp_gaps(log_file_path, threshold_seconds=60):
     """
     # Regular expression to match timestamps at the beginning of lines
     timestamp_pattern = r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|'
+    timestamp_regex = re.compile(timestamp_pattern)
     
     gaps = []
     prev_timestamp = None
@@ -24,19 +41,10 @@ def parse_timestamp_gaps(log_file_path, threshold_seconds=60):
     # Keep a buffer of recent lines for context (5 = 4 context lines + current line)
     context_buffer = []
     
-    # Handle both file paths and BytesIO objects
-    if isinstance(log_file_path, (io.BytesIO, io.StringIO)):
-        # It's an in-memory file object
-        if isinstance(log_file_path, io.BytesIO):
-            # Convert bytes to string
-            content = log_file_path.getvalue().decode('utf-8', errors='ignore')
-            file_lines = content.splitlines()
-        else:
-            # It's already a StringIO
-            file_lines = log_file_path.getvalue().splitlines()
-            
-        for i, line in enumerate(file_lines):
-            line_number = i + 1
+    # Handle both file paths and BytesIO/StringIO objects
+    try:
+        for line in iter_log_lines(log_file_path):
+            line_number += 1
             line_with_nl = line + "\n"  # Add newline character back
             
             # Maintain a rolling buffer of the last 5 lines (4 context + current)
@@ -45,7 +53,7 @@ def parse_timestamp_gaps(log_file_path, threshold_seconds=60):
             context_buffer.append(line_with_nl)
             
             # Check if this line has a timestamp
-            match = re.match(timestamp_pattern, line)
+            match = timestamp_regex.match(line)
             if match:
                 # Process timestamp logic
                 timestamp_str = match.group(1)
@@ -74,50 +82,57 @@ def parse_timestamp_gaps(log_file_path, threshold_seconds=60):
                 except ValueError:
                     # If timestamp parsing fails, just continue
                     pass
-    else:
-        # It's a file path
-        try:
-            with open(log_file_path, 'r', errors='ignore') as file:
-                for i, line in enumerate(file):
-                    line_number = i + 1
-                    
-                    # Maintain a rolling buffer of the last 5 lines (4 context + current)
-                    if len(context_buffer) >= 5:
-                        context_buffer.pop(0)
-                    context_buffer.append(line)
-                    
-                    # Check if this line has a timestamp
-                    match = re.match(timestamp_pattern, line)
-                    if match:
-                        timestamp_str = match.group(1)
-                        
-                        try:
-                            current_timestamp = datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-                            
-                            # If we have a previous timestamp, check the gap
-                            if prev_timestamp:
-                                time_diff = (current_timestamp - prev_timestamp).total_seconds()
-                                
-                                if time_diff >= threshold_seconds:
-                                    gaps.append({
-                                        'prev_timestamp': prev_timestamp,
-                                        'current_timestamp': current_timestamp,
-                                        'time_diff_seconds': time_diff,
-                                        'prev_line': prev_line,
-                                        'current_line': line,
-                                        'prev_line_number': line_number - 1,
-                                        'current_line_number': line_number,
-                                        'context_before': context_buffer[:-1] if len(context_buffer) > 1 else []  # All lines except current
-                                    })
-                            
-                            # Update for next iteration
-                            prev_timestamp = current_timestamp
-                            prev_line = line
-                        except ValueError:
-                            # If timestamp parsing fails, just continue
-                            pass
-        except Exception as e:
-            print(f"Error opening log file: {e}")
+    except Exception as e:
+        print(f"Error opening log file: {e}")
+    
+    record_parser_stats(lines_scanned=line_number, regex_evaluations=line_number, rows_emitted=len(gaps))
     
     # Sort gaps by duration (largest first)
-    return sorted(gaps, key=lambda x: x['time_diff_seconds'], reverse=True)
\ No newline at end of file
+    return sorted(gaps, key=lambda x: x['time_diff_seconds'], reverse=True)
+
+def _line_operation(line):
+    """The operation started by a log line, as (kind, label), or None."""
+    for kind, pattern in GAP_LINE_OPERATIONS:
+        match = pattern.search(line or "")
+        if match:
+            return kind, match.group(1)
+    return None
+
+
+def attribute_timestamp_gaps(gaps, event_timeline):
+    """
+    Label each gap with the operation most likely responsible for it. The gaps are joined with the event
+    timeline (see build_event_timeline and timeline_interval_join): the timed operation covering most of the
+    gap wins, the most specific one on ties, if it covers at least GAP_MIN_COVERAGE of the gap. Other gaps
+    go to the operation started by the last line logged before them, if it is one of GAP_LINE_OPERATIONS.
+    Returns the gaps with 'operation' set to {'kind', 'label', 'start', 'end', 'coverage', 'source'} or None;
+    coverage is the share of the gap the operation covers (None when found from the last line).
+    """
+    if not gaps:
+        return []
+    positions, overlaps = timeline_interval_join(event_timeline, [gap['prev_timestamp'] for gap in gaps],
+                                                 [gap['current_timestamp'] for gap in gaps])
+    durations = np.asarray([gap['time_diff_seconds'] for gap in gaps], dtype=float)
+    coverage = np.minimum(np.divide(overlaps / 1e9, durations, out=np.ones(len(gaps)), where=durations > 0), 1.0)
+    found = np.flatnonzero((positions >= 0) & (coverage >= GAP_MIN_COVERAGE))
+    # Details of the operations found, converted in bulk rather than gap by gap
+    chosen = positions[found]
+    kinds = np.asarray(TIMELINE_EVENT_KINDS, dtype=object)[event_timeline['kind'][chosen]]
+    starts = event_timeline['start'][chosen].view('datetime64[ns]').astype('datetime64[us]').tolist()
+    ends = event_timeline['end'][chosen].view('datetime64[ns]').astype('datetime64[us]').tolist()
+    operations = {
+        index: {'kind': kind, 'label': label, 'start': start, 'end': end, 'coverage': float(coverage[index]),
+                'source': 'timeline'}
+        for index, kind, label, start, end in zip(found.tolist(), kinds, event_timeline['label'][chosen], starts, ends)
+    }
+
+    attributed = []
+    for index, gap in enumerate(gaps):
+        operation = operations.get(index)
+        if operation is None:
+            line_operation = _line_operation(gap.get('prev_line'))
+            if line_operation:
+                operation = {'kind': line_operation[0], 'label': line_operation[1], 'start': None, 'end': None,
+                             'coverage': None, 'source': 'last line'}
+        attributed.append(dict(gap, operation=operation))
+    return attributed
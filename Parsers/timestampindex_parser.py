@@ -0,0 +1,183 @@
+import bisect
+import io
+import re
+import streamlit as st
+
+from datetime import datetime, time as time_of_day, timedelta
+from Utils import *
+
+# Distance between two entries of the timestamp index
+TIMESTAMP_INDEX_INTERVAL = 64 * 1024
+
+# Timestamped lines start with "2024-05-01T10:00:00.123Z|<thread>|"
+INDEX_TIMESTAMP_PATTERN = re.compile(rb'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+)Z\|', re.MULTILINE)
+INDEX_TIMESTAMP_TEXT_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+)Z\|', re.MULTILINE)
+
+
+def _timestamp_pattern(data):
+    return INDEX_TIMESTAMP_PATTERN if isinstance(data, bytes) else INDEX_TIMESTAMP_TEXT_PATTERN
+
+
+def _parse_index_timestamp(value):
+    if isinstance(value, bytes):
+        value = value.decode('ascii')
+    # strptime takes at most 6 fractional digits
+    return datetime.strptime(value[:26], '%Y-%m-%dT%H:%M:%S.%f')
+
+
+@st.cache_data
+def parse_timestamp_index(log_file, interval=TIMESTAMP_INDEX_INTERVAL):
+    """
+    Sparse timestamp-to-offset index of a log: about every interval bytes, the offset of the first timestamped
+    line at or after that point and its timestamp. Timestamps are made non-decreasing so they can be
+    binary searched. Offsets count decompressed bytes for compressed logs.
+    Returns {'offsets', 'timestamps', 'total_bytes'}; the lists are empty for logs without timestamps.
+    """
+    offsets = []
+    timestamps = []
+    stream, close = open_log_stream(log_file)
+    try:
+        base = 0            # offset of the start of buffer
+        buffer = None       # complete lines are searched, the partial last line is carried over
+        next_entry = 0      # offset from which the next entry is searched
+        while True:
+            chunk = stream.read(LOG_CHUNK_SIZE)
+            if not chunk:
+                break
+            record_parser_stats(bytes_read=len(chunk))
+            buffer = chunk if buffer is None else buffer + chunk
+            complete = buffer.rfind(b'\n' if isinstance(buffer, bytes) else '\n') + 1
+            pattern = _timestamp_pattern(buffer)
+            while next_entry < base + complete:
+                match = pattern.search(buffer, max(next_entry - base, 0), complete)
+                if match is None:
+                    break
+                timestamp = _parse_index_timestamp(match.group(1))
+                if timestamps and timestamp < timestamps[-1]:
+                    timestamp = timestamps[-1]
+                offsets.append(base + match.start())
+                timestamps.append(timestamp)
+                next_entry = (base + match.start()) // interval * interval + interval
+            base += complete
+            buffer = buffer[complete:]
+
+        # The last line may have no line break
+        if buffer and next_entry <= base:
+            match = _timestamp_pattern(buffer).match(buffer)
+            if match:
+                timestamp = _parse_index_timestamp(match.group(1))
+                offsets.append(base)
+                timestamps.append(max(timestamp, timestamps[-1]) if timestamps else timestamp)
+        total_bytes = base + (len(buffer) if buffer else 0)
+    finally:
+        close()
+
+    record_parser_stats(rows_emitted=len(offsets))
+    return {'offsets': offsets, 'timestamps': timestamps, 'total_bytes': total_bytes}
+
+
+def _find_timestamped_line(log_file, from_offset, to_offset, predicate):
+    """
+    Offset of the first timestamped line in [from_offset, to_offset) whose timestamp satisfies predicate,
+    or None. from_offset must be the start of a line; to_offset None scans to the end of the log.
+    """
+    stream, close = open_log_stream(log_file)
+    try:
+        stream.seek(from_offset)
+        offset = from_offset
+        while to_offset is None or offset < to_offset:
+            line = stream.readline()
+            if not line:
+                break
+            match = _timestamp_pattern(line).match(line)
+            if match and predicate(_parse_index_timestamp(match.group(1))):
+                return offset
+            offset += len(line)
+    finally:
+        close()
+    return None
+
+
+def find_log_window(log_file, start_time=None, end_time=None, index=None):
+    """
+    Byte range (start_byte, end_byte) of the lines logged between start_time and end_time (None for open
+    ends), found by binary searching the timestamp index and scanning at most the lines between two entries.
+    Untimestamped lines go with the timestamped line before them (multi-line messages, call stacks): the range
+    starts at the first line stamped at or after start_time and ends before the first line stamped after end_time.
+    """
+    if index is None:
+        index = parse_timestamp_index(log_file)
+    offsets, timestamps, total_bytes = index['offsets'], index['timestamps'], index['total_bytes']
+
+    start_byte = 0
+    if start_time is not None:
+        entry = bisect.bisect_left(timestamps, start_time)
+        if entry > 0:
+            limit = offsets[entry] if entry < len(offsets) else None
+            found = _find_timestamped_line(log_file, offsets[entry - 1], limit, lambda timestamp: timestamp >= start_time)
+            start_byte = found if found is not None else (limit if limit is not None else total_bytes)
+
+    end_byte = total_bytes
+    if end_time is not None:
+        entry = bisect.bisect_right(timestamps, end_time)
+        limit = offsets[entry] if entry < len(offsets) else None
+        found = _find_timestamped_line(log_file, offsets[entry - 1] if entry > 0 else 0, limit,
+                                       lambda timestamp: timestamp > end_time)
+        end_byte = found if found is not None else (limit if limit is not None else total_bytes)
+
+    return start_byte, max(end_byte, start_byte)
+
+
+def extract_log_window(log_file, start_time=None, end_time=None):
+    """
+    Cut a log down to the lines logged between start_time and end_time, so every parser only reads that window.
+    Returns (window log as a BytesIO, {'start', 'end', 'start_byte', 'end_byte', 'total_bytes'}).
+    Raises ValueError for logs without timestamps and for windows without any lines.
+    """
+    index = parse_timestamp_index(log_file)
+    if not index['timestamps']:
+        raise ValueError("This log has no timestamps, so it can't be cut to a time window. "
+                         "Enable Preferences -> General -> Timestamp Editor log entries in Unity.")
+    start_byte, end_byte = find_log_window(log_file, start_time, end_time, index)
+    if end_byte <= start_byte:
+        raise ValueError(f"No log lines between {start_time or 'the start'} and {end_time or 'the end'} "
+                         f"(the log covers {index['timestamps'][0]} to {index['timestamps'][-1]}).")
+
+    stream, close = open_log_stream(log_file)
+    try:
+        stream.seek(start_byte)
+        data = stream.read(end_byte - start_byte)
+    finally:
+        close()
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    window = {
+        'start': start_time,
+        'end': end_time,
+        'start_byte': start_byte,
+        'end_byte': end_byte,
+        'total_bytes': index['total_bytes']
+    }
+    return io.BytesIO(data), window
+
+
+def resolve_window_time(value, reference):
+    """
+    Turn a window bound typed by the user into a datetime: either a full ISO date and time
+    (2024-05-01T10:00, 2024-05-01 10:00:30) or a time of day (10:00) on the day of the reference timestamp
+    (the start of the log), or the day after if that time is earlier than the reference.
+    Raises ValueError for anything else.
+    """
+    value = value.strip().rstrip('Z')
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        clock = time_of_day.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"'{value}' is not a date and time (2024-05-01T10:00) or a time of day (10:00)")
+    resolved = datetime.combine(reference.date(), clock)
+    return resolved + timedelta(days=1) if resolved < reference else resolved
+
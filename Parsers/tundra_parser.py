@@ -1,33 +1,123 @@
 import re
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+from datetime import datetime
 from Utils import *
 
+TUNDRA_PATTERN = re.compile(
+    r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?'
+    r'\*\*\* Tundra build success \((\d+\.\d+) seconds - (\d+:\d+:\d+)\), (\d+) items updated, (\d+) evaluated'
+)
+
+# A script compilation refresh may start this many seconds after the Tundra run it follows
+SCRIPT_COMPILATION_MAX_DELAY = 30.0
+
+
+def _parse_timestamp(timestamp_str):
+    if not timestamp_str:
+        return None
+    try:
+        return datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S.%fZ')
+    except ValueError:
+        return None
+
+
 @st.cache_data
 def parse_tundra_build_info(log_file):
-    """Extract Tundra build information from the log file."""
-    tundra_pattern = r'\*\*\* Tundra build success \((\d+\.\d+) seconds - (\d+:\d+:\d+)\), (\d+) items updated, (\d+) evaluated'
-    
+    """
+    Extract Tundra build information from the log file. Each run keeps its 1-based line number and, for
+    timestamped logs, the timestamp of its success line (the end of the run).
+    """
     tundra_info = []
-    
+
     # Handle both file path strings and file-like objects
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            lines = file.readlines()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        lines = log_file.read().decode('utf-8', errors='ignore').splitlines()
-    
+    lines = iter_log_lines(log_file)
+
+    line_count = 0
+    evaluations = 0
     for line in lines:
-        match = re.search(tundra_pattern, line)
+        line_count += 1
+        if 'Tundra build success' not in line:
+            continue
+        evaluations += 1
+        match = TUNDRA_PATTERN.search(line)
         if match:
+            timestamp_str = match.group(1)
             tundra_info.append({
-                'build_time_seconds': float(match.group(1)),
-                'build_time_formatted': match.group(2),
-                'items_updated': int(match.group(3)),
-                'items_evaluated': int(match.group(4))
+                'line_number': line_count,
+                'timestamp': _parse_timestamp(timestamp_str),
+                'timestamp_str': timestamp_str,
+                'build_time_seconds': float(match.group(2)),
+                'build_time_formatted': match.group(3),
+                'items_updated': int(match.group(4)),
+                'items_evaluated': int(match.group(5))
             })
-    
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=len(tundra_info))
+
     return tundra_info
+
+
+def associate_tundra_runs(tundra_info, player_build_info, refresh_df=None):
+    """
+    Tell which player build or script compilation each Tundra run was for, with sorted as-of joins instead
+    of comparing every run with every build. A run belongs to the first PlayerBuildInfo message logged after
+    it if it ended while that build ran; other runs compiled scripts, and are matched with the next
+    asset pipeline refresh initiated by ScriptCompilation that started at most SCRIPT_COMPILATION_MAX_DELAY
+    seconds after they ended. Without timestamps nothing tells a build's runs from the compilations before it,
+    so such runs are left unassigned. Returns new run entries with context ('Player Build', 'Script Compilation'
+    or None), player_build (position in player_build_info, or None) and refresh_id (or None).
+    """
+    if not tundra_info:
+        return []
+    runs = pd.DataFrame({
+        'run': range(len(tundra_info)),
+        'line_number': [run.get('line_number') for run in tundra_info],
+        'end': pd.to_datetime([run.get('timestamp') for run in tundra_info])
+    })
+    runs['player_build'] = pd.NA
+    runs['refresh_id'] = None
+
+    # Player builds: the next build message in the log, if the run ended after the build started
+    builds = pd.DataFrame({
+        'player_build': range(len(player_build_info or [])),
+        'line_number': [build.get('line_number') for build in player_build_info or []],
+        'build_start': pd.to_datetime([build.get('timestamp') for build in player_build_info or []])
+                       - pd.to_timedelta([build.get('total_duration_sec') or 0.0 for build in player_build_info or []], unit='s')
+    }).dropna(subset=['line_number', 'build_start'])
+    numbered = runs.dropna(subset=['line_number', 'end'])
+    if not builds.empty and not numbered.empty:
+        joined = pd.merge_asof(
+            numbered[['run', 'line_number', 'end']].astype({'line_number': 'int64'}).sort_values('line_number'),
+            builds.astype({'line_number': 'int64'}).sort_values('line_number'),
+            on='line_number', direction='forward'
+        )
+        joined = joined[joined['player_build'].notna() & (joined['end'] >= joined['build_start'])]
+        runs.loc[joined['run'].to_numpy(), 'player_build'] = joined['player_build'].to_numpy()
+
+    # Script compilations: the next refresh initiated by ScriptCompilation, running or starting shortly after
+    if refresh_df is not None and not refresh_df.empty and 'initiator' in refresh_df.columns:
+        refreshes = refresh_df[(refresh_df['initiator'] == 'ScriptCompilation') & refresh_df['timestamp'].notna()]
+        refreshes = pd.DataFrame({
+            'end': pd.to_datetime(refreshes['timestamp']),
+            'refresh_start': pd.to_datetime(refreshes['timestamp']) - pd.to_timedelta(refreshes['total_time'], unit='s'),
+            'refresh': refreshes['refresh_id'].to_numpy()
+        }).sort_values('end')
+        compiles = runs[runs['player_build'].isna() & runs['end'].notna()]
+        if not refreshes.empty and not compiles.empty:
+            joined = pd.merge_asof(compiles[['run', 'end']].sort_values('end'), refreshes, on='end', direction='forward')
+            joined = joined[joined['refresh'].notna()
+                            & (joined['refresh_start'] - joined['end'] <= pd.Timedelta(seconds=SCRIPT_COMPILATION_MAX_DELAY))]
+            runs.loc[joined['run'].to_numpy(), 'refresh_id'] = joined['refresh'].to_numpy()
+
+    contexts = np.where(runs['player_build'].notna(), 'Player Build',
+                        np.where(runs['end'].notna(), 'Script Compilation', None))
+    return [
+        dict(run,
+             context=context,
+             player_build=int(player_build) if pd.notna(player_build) else None,
+             refresh_id=refresh_id)
+        for run, context, player_build, refresh_id in zip(tundra_info, contexts, runs['player_build'], runs['refresh_id'])
+    ]
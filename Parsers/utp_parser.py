@@ -0,0 +1,84 @@
+import json
+import re
+import pandas as pd
+import streamlit as st
+
+from Utils import *
+
+# Marker of a Unity Test Protocol (utp) message line
+UTP_MARKER = '##utp:'
+
+# A utp line with its optional timestamp prefix, for lines that don't start with the marker
+UTP_LINE_PATTERN = re.compile(r'(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\|.*?\|)?##utp:(.*?)$')
+
+# Sniffs the message type when "type" is the first key of the payload, without decoding the JSON
+UTP_TYPE_PATTERN = re.compile(r'\{\s*"type"\s*:\s*"([^"\\]*)"')
+
+# Columns of the utp message index
+UTP_INDEX_COLUMNS = ['line_number', 'timestamp_str', 'type', 'payload']
+
+
+@st.cache_data
+def index_utp_messages(log_file):
+    """
+    Index every ##utp: message of the log in one streaming pass: line number, timestamp, message type and
+    the raw JSON payload. The type is read from the start of the payload, so nothing is decoded here;
+    messages whose type can't be sniffed get type None. Use decode_utp_messages to decode the types a view needs.
+    """
+    index = {column: [] for column in UTP_INDEX_COLUMNS}
+
+    line_count = 0
+    evaluations = 0
+    for line in iter_log_lines(log_file):
+        line_count += 1
+        if UTP_MARKER not in line:
+            continue
+
+        if line.startswith(UTP_MARKER):
+            timestamp_str = None
+            payload = line[len(UTP_MARKER):]
+        else:
+            evaluations += 1
+            line_match = UTP_LINE_PATTERN.search(line)
+            timestamp_str = line_match.group(1)
+            payload = line_match.group(2)
+        if not payload:
+            continue
+
+        evaluations += 1
+        type_match = UTP_TYPE_PATTERN.match(payload)
+
+        index['line_number'].append(line_count)
+        index['timestamp_str'].append(timestamp_str)
+        index['type'].append(type_match.group(1) if type_match else None)
+        index['payload'].append(payload)
+
+    record_parser_stats(lines_scanned=line_count, regex_evaluations=evaluations, matches=len(index['payload']))
+    return pd.DataFrame(index, columns=UTP_INDEX_COLUMNS)
+
+
+def decode_utp_messages(utp_index, message_types):
+    """
+    Decode the messages of the given types from a utp index, in log order. Returns a list of dicts with
+    line_number, timestamp_str, type and the decoded data. Invalid JSON is skipped.
+    """
+    message_types = set(message_types)
+    # Messages with an unknown type have to be decoded to find out
+    candidates = utp_index[utp_index['type'].isin(message_types) | utp_index['type'].isna()]
+
+    messages = []
+    for line_number, timestamp_str, message_type, payload in zip(
+            candidates['line_number'], candidates['timestamp_str'], candidates['type'], candidates['payload']):
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(data, dict) or data.get('type') not in message_types:
+            continue
+        messages.append({
+            'line_number': line_number,
+            'timestamp_str': timestamp_str if isinstance(timestamp_str, str) else None,
+            'type': data['type'],
+            'data': data
+        })
+    return messages
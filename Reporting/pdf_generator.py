@@ -1,8 +1,9 @@
+import heapq
+
 import pandas as pd
 
 from datetime import datetime
 from io import BytesIO
-from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
@@ -10,8 +11,49 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 
 from Utils import *
-def generate_pdf_report(log_file_path, parsing_data):
-    """Generate a PDF report with key findings from the log analysis."""
+
+# Rows of each top-N table in the report
+REPORT_TOP_ASSEMBLIES = 5
+REPORT_TOP_OPERATIONS = 15
+REPORT_TOP_CATEGORIES = 10
+REPORT_TOP_PEAK_FACTOR = 10
+
+# Parsed results the report is built from; the report cache is keyed by their digests
+REPORT_DATA_KEYS = (
+    'shader_df', 'import_df', 'loading_df', 'build_df', 'refresh_df', 'player_build_info',
+    'il2cpp_data', 'domain_reloads', 'unity_version', 'total_build_size', 'total_build_unit',
+    'performance_df', 'parser_stats', 'coverage', 'time_window', 'session'
+)
+
+def prepare_report_tables(parsing_data):
+    """Pre-aggregate the top-N tables of the report, selecting the top rows instead of sorting whole frames."""
+    il2cpp_data = parsing_data.get('il2cpp_data') or []
+    performance_df = parsing_data.get('performance_df')
+    
+    tables = {
+        'top_assemblies': heapq.nlargest(REPORT_TOP_ASSEMBLIES, il2cpp_data, key=lambda entry: entry['total_time_ms']),
+        'top_operations': None,
+        'top_categories': None,
+        'top_peak_factor': None
+    }
+    if performance_df is None or performance_df.empty:
+        return tables
+    
+    tables['top_operations'] = performance_df.nlargest(REPORT_TOP_OPERATIONS, 'total_us')
+    tables['top_peak_factor'] = performance_df.nlargest(REPORT_TOP_PEAK_FACTOR, 'peak_factor')
+    if 'category' in performance_df.columns:
+        tables['top_categories'] = performance_df.groupby('category', sort=False).agg(
+            total_time_us=('total_us', 'sum'),
+            operation_count=('operation', 'count'),
+            sample_count=('samples', 'sum')
+        ).reset_index().nlargest(REPORT_TOP_CATEGORIES, 'total_time_us')
+    return tables
+
+def generate_pdf_report(log_file_path, parsing_data, progress_callback=None):
+    """
+    Generate a PDF report with key findings from the log analysis.
+    progress_callback, if given, is called with the fraction of the document laid out (0 to 1).
+    """
     shader_df = parsing_data.get('shader_df', pd.DataFrame())
     import_df = parsing_data.get('import_df', pd.DataFrame())
     loading_df = parsing_data.get('loading_df', pd.DataFrame())
@@ -24,6 +66,10 @@ def generate_pdf_report(log_file_path, parsing_data):
     total_build_size = parsing_data.get('total_build_size')
     total_build_unit = parsing_data.get('total_build_unit')
     performance_df = parsing_data.get('performance_df', pd.DataFrame())
+    parser_stats = parsing_data.get('parser_stats', [])
+    # Data types parsed from only part of the log (time or memory budget)
+    coverage = parsing_data.get('coverage') or {}
+    tables = prepare_report_tables(parsing_data)
 
     # Create a buffer for the PDF
     buffer = BytesIO()
@@ -88,6 +134,10 @@ def generate_pdf_report(log_file_path, parsing_data):
         except (TypeError, AttributeError):
             pass
     elements.append(Paragraph(f"Log File: {log_file_name}", normal_style))
+    if parsing_data.get('time_window'):
+        elements.append(Paragraph(f"Time Window: {format_time_window(parsing_data['time_window'])}", normal_style))
+    if parsing_data.get('session'):
+        elements.append(Paragraph(f"Editor Session: {format_log_session(parsing_data['session'])}", normal_style))
     
     elements.append(Spacer(1, 0.25*inch))
     
@@ -96,40 +146,55 @@ def generate_pdf_report(log_file_path, parsing_data):
     # Add missing data warnings section
     elements.append(Paragraph("Log Analysis Coverage", heading_style))
     
-    # Check which data types are available/missing
+    # Check which data types are available/missing; partially parsed ones are listed separately
     missing_data = []
-    if shader_df.empty or 'compilation_seconds' not in shader_df.columns:
+    if 'shader_df' not in coverage and (shader_df.empty or 'compilation_seconds' not in shader_df.columns):
         missing_data.append("Shader compilation data could not be found in Editor.log")
     
-    if import_df.empty:
+    if 'import_df' not in coverage and import_df.empty:
         missing_data.append("Asset import data could not be found in Editor.log")
     
-    if loading_df.empty:
+    if 'loading_df' not in coverage and loading_df.empty:
         missing_data.append("Project loading time data could not be found in Editor.log")
     
-    if build_df.empty:
+    if 'build_df' not in coverage and build_df.empty:
         missing_data.append("Build report data could not be found in Editor.log")
     
-    if refresh_df.empty:
+    if 'refresh_df' not in coverage and refresh_df.empty:
         missing_data.append("Asset pipeline refresh data could not be found in Editor.log")
     
-    if not player_build_info:
+    if 'player_build_info' not in coverage and not player_build_info:
         missing_data.append("Player build performance data could not be found in Editor.log")
     
-    if not il2cpp_data:
+    if 'il2cpp_data' not in coverage and not il2cpp_data:
         missing_data.append("IL2CPP processing data could not be found in Editor.log")
     
-    if not domain_reloads:
+    if 'domain_reloads' not in coverage and not domain_reloads:
         missing_data.append("Domain reload data could not be found in Editor.log")
     
+    partial_data = []
+    for key, description in (('shader_df', "Shader compilation data"), ('import_df', "Asset import data"),
+                             ('loading_df', "Project loading time data"), ('build_df', "Build report data"),
+                             ('refresh_df', "Asset pipeline refresh data"), ('player_build_info', "Player build performance data"),
+                             ('il2cpp_data', "IL2CPP processing data"), ('domain_reloads', "Domain reload data"),
+                             ('performance_df', "Performance report data")):
+        if key in coverage:
+            partial_data.append(f"{description}: {format_partial_coverage(coverage[key])}")
+    
     # Add missing data warnings to the PDF
     if missing_data:
         elements.append(Paragraph("The following data types were not found:", normal_style))
         for item in missing_data:
             elements.append(Paragraph(f"• {item}", warning_style))
-    else:
+    elif not partial_data:
         elements.append(Paragraph("✓ All expected data types were found in the log file.", normal_style))
     
+    if partial_data:
+        elements.append(Paragraph("Parsing stopped at its time or memory budget. These data types only cover part of the log, "
+                                  "so sections computed from them are marked (partial):", normal_style))
+        for item in partial_data:
+            elements.append(Paragraph(f"• {item}", warning_style))
+    
     elements.append(Spacer(1, 0.25*inch))
     
     # Add summary section
@@ -138,35 +203,38 @@ def generate_pdf_report(log_file_path, parsing_data):
     # Calculate key metrics for summary
     summary_data = []
     
+    def partial_label(label, key):
+        return f"{label} (partial)" if key in coverage else label
+    
     # Player Build time
     if player_build_info:
         total_build_time = sum(entry.get('total_duration_sec', 0) for entry in player_build_info)
-        summary_data.append(["Total Build Time", format_time(total_build_time)])
+        summary_data.append([partial_label("Total Build Time", 'player_build_info'), format_time(total_build_time)])
     
     # Project Loading time
     if not loading_df.empty and 'total_loading_time' in loading_df.columns:
         total_loading_time = loading_df['total_loading_time'].sum()
-        summary_data.append(["Total Loading Time", format_time(total_loading_time)])
+        summary_data.append([partial_label("Total Loading Time", 'loading_df'), format_time(total_loading_time)])
     
     # Domain Reloads time
     if domain_reloads:
         total_reload_time = sum((reload.get('reset_time', 0) or 0) for reload in domain_reloads)
-        summary_data.append(["Total Domain Reload Time", format_time(total_reload_time)])
+        summary_data.append([partial_label("Total Domain Reload Time", 'domain_reloads'), format_time(total_reload_time)])
     
     # Asset Pipeline Refresh time
     if not refresh_df.empty and 'total_time' in refresh_df.columns:
         total_refresh_time = refresh_df['total_time'].sum()
-        summary_data.append(["Total Pipeline Refresh Time", format_time(total_refresh_time)])
+        summary_data.append([partial_label("Total Pipeline Refresh Time", 'refresh_df'), format_time(total_refresh_time)])
     
     # Asset Import time
     if not import_df.empty and 'import_time_seconds' in import_df.columns:
         total_import_time = import_df['import_time_seconds'].sum()
-        summary_data.append(["Total Asset Import Time", format_time(total_import_time)])
+        summary_data.append([partial_label("Total Asset Import Time", 'import_df'), format_time(total_import_time)])
     
     # Shader Compilation time
     if not shader_df.empty and 'compilation_seconds' in shader_df.columns:
         total_shader_time = shader_df['compilation_seconds'].sum()
-        summary_data.append(["Total Shader Compilation Time", format_time(total_shader_time)])
+        summary_data.append([partial_label("Total Shader Compilation Time", 'shader_df'), format_time(total_shader_time)])
     
     # Add summary table if we have data
     if summary_data:
@@ -198,7 +266,7 @@ def generate_pdf_report(log_file_path, parsing_data):
     # [... All other sections remain unchanged ...]
     
     # IL2CPP PROCESSING SECTION
-    elements.append(Paragraph("IL2CPP Processing Analysis", heading_style))
+    elements.append(Paragraph(partial_label("IL2CPP Processing Analysis", 'il2cpp_data'), heading_style))
     if il2cpp_data:
         # Calculate summary metrics
         total_assemblies = len(il2cpp_data)
@@ -234,8 +302,7 @@ def generate_pdf_report(log_file_path, parsing_data):
         # Add top 5 assemblies by processing time
         elements.append(Paragraph("Top 5 Assemblies by IL2CPP Processing Time", subheading_style))
         
-        # Sort assemblies by processing time
-        sorted_data = sorted(il2cpp_data, key=lambda x: x['total_time_ms'], reverse=True)[:5]
+        sorted_data = tables['top_assemblies']
         
         if sorted_data:
             # Create header row
@@ -270,7 +337,7 @@ def generate_pdf_report(log_file_path, parsing_data):
     
     # PERFORMANCE REPORT SECTION
     if performance_df is not None and not performance_df.empty:
-        elements.append(Paragraph("Performance Report Analysis", heading_style))
+        elements.append(Paragraph(partial_label("Performance Report Analysis", 'performance_df'), heading_style))
         elements.append(Spacer(1, 0.25*inch))
         
         # Performance summary metrics
@@ -309,13 +376,7 @@ def generate_pdf_report(log_file_path, parsing_data):
         # Top slowest operations
         elements.append(Paragraph("Top 15 Slowest Operations (by Total Time)", subheading_style))
         
-        # Sort and get top operations
-        sorted_df = performance_df.sort_values('total_us', ascending=False)
-        top_n = min(15, len(sorted_df))
-        top_operations = sorted_df.head(top_n)
-        
-        # Convert time to seconds for display
-        top_operations['total_s'] = top_operations['total_us'] / 1000000
+        top_operations = tables['top_operations']
         
         # Create table for top operations
         if not top_operations.empty:
@@ -326,20 +387,20 @@ def generate_pdf_report(log_file_path, parsing_data):
             operations_table_data[0] = [wrap_cell_text(cell) for cell in operations_table_data[0]]
             
             # Add top operations
-            for _, row in top_operations.iterrows():
+            for row in top_operations.itertuples(index=False):
                 # Format values for display
-                operation = (row['operation'][:45] + '...') if len(row['operation']) > 48 else row['operation']
-                avg_s = row['avg_us'] / 1000000
-                peak_s = row['peak_us'] / 1000000
-                total_s = row['total_s']
+                operation = (row.operation[:45] + '...') if len(row.operation) > 48 else row.operation
+                avg_s = row.avg_us / 1000000
+                peak_s = row.peak_us / 1000000
+                total_s = row.total_us / 1000000
                 
                 operations_table_data.append([
                     wrap_cell_text(operation),
-                    wrap_cell_text(str(row['samples'])),
+                    wrap_cell_text(str(row.samples)),
                     wrap_cell_text(f"{avg_s:.6f}"),
                     wrap_cell_text(f"{peak_s:.6f}"),
                     wrap_cell_text(f"{total_s:.6f}"),
-                    wrap_cell_text(f"{row['percentage']:.2f}%")
+                    wrap_cell_text(f"{row.percentage:.2f}%")
                 ])
             
             operations_table = Table(operations_table_data, colWidths=[2*inch, 0.6*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.5*inch])
@@ -359,20 +420,10 @@ def generate_pdf_report(log_file_path, parsing_data):
         elements.append(Spacer(1, 0.25*inch))
         
         # Category breakdown (if available)
-        if 'category' in performance_df.columns:
+        if tables['top_categories'] is not None:
             elements.append(Paragraph("Performance by Category", subheading_style))
             
-            category_df = performance_df.groupby('category').agg(
-                total_time_us=('total_us', 'sum'),
-                operation_count=('operation', 'count'),
-                sample_count=('samples', 'sum')
-            ).reset_index().sort_values('total_time_us', ascending=False)
-            
-            # Convert time to seconds
-            category_df['total_time_s'] = category_df['total_time_us'] / 1000000
-            
-            # Limit to top 10 categories
-            top_categories = category_df.head(10)
+            top_categories = tables['top_categories']
             
             if not top_categories.empty:
                 # Create header row
@@ -382,15 +433,15 @@ def generate_pdf_report(log_file_path, parsing_data):
                 categories_table_data[0] = [wrap_cell_text(cell) for cell in categories_table_data[0]]
                 
                 # Add top categories
-                for _, row in top_categories.iterrows():
+                for row in top_categories.itertuples(index=False):
                     # Truncate category name if too long
-                    category = (row['category'][:42] + '...') if len(row['category']) > 45 else row['category']
+                    category = (row.category[:42] + '...') if len(row.category) > 45 else row.category
                     
                     categories_table_data.append([
                         wrap_cell_text(category),
-                        wrap_cell_text(str(row['operation_count'])),
-                        wrap_cell_text(str(row['sample_count'])),
-                        wrap_cell_text(f"{row['total_time_s']:.6f}")
+                        wrap_cell_text(str(row.operation_count)),
+                        wrap_cell_text(str(row.sample_count)),
+                        wrap_cell_text(f"{row.total_time_us / 1000000:.6f}")
                     ])
                 
                 categories_table = Table(categories_table_data, colWidths=[3*inch, 1*inch, 1*inch, 1.5*inch])
@@ -412,8 +463,7 @@ def generate_pdf_report(log_file_path, parsing_data):
         # High peak factor operations
         elements.append(Paragraph("Top 10 Operations with Highest Peak Factor", subheading_style))
         
-        # Get operations with highest peak factor
-        factor_sorted = performance_df.sort_values('peak_factor', ascending=False).head(10)
+        factor_sorted = tables['top_peak_factor']
         
         if not factor_sorted.empty:
             # Create header row
@@ -423,18 +473,18 @@ def generate_pdf_report(log_file_path, parsing_data):
             factor_table_data[0] = [wrap_cell_text(cell) for cell in factor_table_data[0]]
             
             # Add rows
-            for _, row in factor_sorted.iterrows():
+            for row in factor_sorted.itertuples(index=False):
                 # Truncate operation name if too long
-                operation = (row['operation'][:42] + '...') if len(row['operation']) > 45 else row['operation']
+                operation = (row.operation[:42] + '...') if len(row.operation) > 45 else row.operation
                 
                 # Convert values to seconds
-                avg_s = row['avg_us'] / 1000000
-                peak_s = row['peak_us'] / 1000000
+                avg_s = row.avg_us / 1000000
+                peak_s = row.peak_us / 1000000
                 
                 factor_table_data.append([
                     wrap_cell_text(operation),
-                    wrap_cell_text(str(row['samples'])),
-                    wrap_cell_text(f"{row['peak_factor']:.2f}x"),
+                    wrap_cell_text(str(row.samples)),
+                    wrap_cell_text(f"{row.peak_factor:.2f}x"),
                     wrap_cell_text(f"{avg_s:.6f}"),
                     wrap_cell_text(f"{peak_s:.6f}")
                 ])
@@ -463,6 +513,56 @@ def generate_pdf_report(log_file_path, parsing_data):
         elements.append(Spacer(1, 0.1*inch))
         elements.append(Paragraph('Note: A high peak factor indicates inconsistent performance across runs.', note_style))
 
+    # PARSER INSTRUMENTATION SECTION
+    if parser_stats:
+        elements.append(Spacer(1, 0.5*inch))
+        elements.append(Paragraph("Parser Instrumentation", heading_style))
+        elements.append(Spacer(1, 0.1*inch))
+        
+        # Create header row
+        stats_table_data = [["Parser", "Time (s)", "MB Read", "Lines", "Regex Evals", "Matches", "Rows", "Peak MB"]]
+        stats_table_data[0] = [wrap_cell_text(cell) for cell in stats_table_data[0]]
+        
+        for stats in parser_stats:
+            peak = f"{stats['peak_memory_mb']:.1f}" if stats.get('peak_memory_mb') is not None else "-"
+            name = stats['parser'].replace("Parse ", "") + (" (cached)" if stats.get('cache_hit') else "")
+            stats_table_data.append([
+                wrap_cell_text(name),
+                wrap_cell_text(f"{stats['wall_seconds']:.3f}"),
+                wrap_cell_text(f"{stats['bytes_read'] / (1024 * 1024):.1f}"),
+                wrap_cell_text(str(stats['lines_scanned'])),
+                wrap_cell_text(str(stats['regex_evaluations'])),
+                wrap_cell_text(str(stats['matches'])),
+                wrap_cell_text(str(stats['rows_emitted'])),
+                wrap_cell_text(peak)
+            ])
+        
+        stats_table = Table(stats_table_data, colWidths=[1.6*inch, 0.6*inch, 0.6*inch, 0.7*inch, 0.8*inch, 0.6*inch, 0.5*inch, 0.5*inch])
+        stats_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        elements.append(stats_table)
+
+    # Report layout progress as the share of flowables placed on pages
+    if progress_callback is not None:
+        flowable_count = {'total': len(elements)}
+        
+        def on_progress(kind, value):
+            if kind == 'SIZE_EST':
+                flowable_count['total'] = max(value, 1)
+            elif kind == 'PROGRESS':
+                progress_callback(min(value / flowable_count['total'], 1.0))
+        
+        doc.setProgressCallBack(on_progress)
+    
     # Build the PDF
     doc.build(elements)
     
@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+DEFAULT_SERVER_URL = 'http://127.0.0.1:8765'
+
+# Seconds between two status requests while waiting for a job
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def _request_json(request):
+    """Send a request and decode the JSON answer; error answers are returned too, with their status."""
+    try:
+        with urlopen(request) as response:
+            return response.status, json.load(response)
+    except HTTPError as e:
+        return e.code, json.load(e)
+
+
+def submit_log(log_path, server_url=DEFAULT_SERVER_URL, options=None, time_budget=None, memory_budget_mb=None):
+    """
+    Upload a log (streamed from disk) and return (HTTP status, job). options is a list of parsing option names;
+    with a time or memory budget the service stops parsing at it and returns partial results.
+    """
+    query = []
+    if options:
+        query.append(f"options={quote(','.join(options))}")
+    if time_budget:
+        query.append(f"time_budget={time_budget}")
+    if memory_budget_mb:
+        query.append(f"memory_budget_mb={memory_budget_mb}")
+    url = f"{server_url.rstrip('/')}/jobs"
+    if query:
+        url += '?' + '&'.join(query)
+    with open(log_path, 'rb') as file:
+        request = Request(url, data=file, method='POST', headers={
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(os.path.getsize(log_path))
+        })
+        return _request_json(request)
+
+
+def get_job(job_id, server_url=DEFAULT_SERVER_URL):
+    """Return (HTTP status, job) for a submitted job."""
+    return _request_json(Request(f"{server_url.rstrip('/')}/jobs/{job_id}"))
+
+
+def get_result(job_id, server_url=DEFAULT_SERVER_URL):
+    """Return (HTTP status, analysis) for a finished job, or the job itself if it isn't finished."""
+    return _request_json(Request(f"{server_url.rstrip('/')}/jobs/{job_id}/result"))
+
+
+def wait_for_result(job_id, server_url=DEFAULT_SERVER_URL, poll_interval=DEFAULT_POLL_INTERVAL, timeout=None,
+                    on_progress=None):
+    """Poll a job until it finishes and return its analysis. Raises RuntimeError if it fails, TimeoutError on timeout."""
+    started = time.time()
+    while True:
+        status, job = get_job(job_id, server_url)
+        if status != 200:
+            raise RuntimeError(job.get('error', f"Unexpected status {status}"))
+        if job['status'] == 'done':
+            break
+        if job['status'] == 'failed':
+            raise RuntimeError(job['error'])
+        if on_progress is not None:
+            on_progress(job)
+        if timeout is not None and time.time() - started > timeout:
+            raise TimeoutError(f"Job {job_id} did not finish within {timeout} seconds")
+        time.sleep(poll_interval)
+
+    status, result = get_result(job_id, server_url)
+    if status != 200:
+        raise RuntimeError(result.get('error', f"Unexpected status {status}"))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send an Editor.log to the local analysis service and print the JSON result")
+    parser.add_argument("log_file", help="Path to the Unity Editor log (optionally compressed)")
+    parser.add_argument("--server", help="URL of the analysis service", default=DEFAULT_SERVER_URL)
+    parser.add_argument("--options", help="Only run these parsing options (e.g. shader imports)", nargs='*')
+    parser.add_argument("--time-budget", help="Stop parsing after this many seconds and return partial results", type=float)
+    parser.add_argument("--memory-budget-mb", help="Stop parsing once it has used this much memory (MB)", type=float)
+    parser.add_argument("--timeout", help="Give up after this many seconds", type=float)
+    parser.add_argument("--output", "-o", help="Write the JSON result to this path instead of stdout", type=str)
+    args = parser.parse_args(argv)
+
+    status, job = submit_log(args.log_file, args.server, args.options, args.time_budget, args.memory_budget_mb)
+    if status not in (200, 202):
+        print(f"Error: {job.get('error', status)}", file=sys.stderr)
+        return 1
+
+    def show_progress(job):
+        print(f"\r{job['status']}: {job['progress'] * 100:5.1f}% {job['message'] or ''}".ljust(80), end='', file=sys.stderr)
+
+    try:
+        result = wait_for_result(job['job_id'], args.server, timeout=args.timeout, on_progress=show_progress)
+    except (RuntimeError, TimeoutError) as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(result, file, indent=2)
+        print(f"Result saved to: {args.output}", file=sys.stderr)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
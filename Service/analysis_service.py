@@ -0,0 +1,373 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Allow running as "python Service/analysis_service.py" from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Service.analysis_worker import run_analysis_job
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Logs analyzed at the same time, each in its own process
+DEFAULT_WORKERS = 2
+
+# Jobs waiting for a worker before new uploads are refused
+DEFAULT_QUEUE_SIZE = 16
+
+# Address space limit of each worker process
+DEFAULT_MEMORY_LIMIT_MB = 4096
+
+DEFAULT_MAX_UPLOAD_MB = 4096
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'editor_log_analysis')
+
+# Size of the pieces an upload is read and hashed in
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Parsing options a client can turn on with ?options=a,b,c (all are on by default)
+SERVICE_PARSING_OPTIONS = ['shader', 'imports', 'loading', 'build_report', 'pipeline', 'domain_reload',
+                           'player_build', 'il2cpp', 'tundra', 'performance_report']
+
+
+def public_job(job):
+    """The fields of a job that are returned to clients."""
+    return {key: value for key, value in job.items() if not key.startswith('_')}
+
+
+def parse_options_query(value):
+    """Turn the options query parameter into parsing options. Raises ValueError for unknown names."""
+    if not value:
+        return {option: True for option in SERVICE_PARSING_OPTIONS}
+    selected = {name.strip() for name in value.split(',') if name.strip()}
+    unknown = selected - set(SERVICE_PARSING_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown parsing options: {', '.join(sorted(unknown))}")
+    return {option: option in selected for option in SERVICE_PARSING_OPTIONS}
+
+
+def parse_budget_query(query):
+    """Read the time_budget and memory_budget_mb query parameters as parsing options. Raises ValueError for bad values."""
+    budgets = {}
+    for parameter, option in (('time_budget', 'time_budget_seconds'), ('memory_budget_mb', 'memory_budget_mb')):
+        value = query.get(parameter, [''])[0]
+        if not value:
+            continue
+        try:
+            budget = float(value)
+        except ValueError:
+            raise ValueError(f"{parameter} must be a number")
+        if budget <= 0:
+            raise ValueError(f"{parameter} must be positive")
+        budgets[option] = budget
+    return budgets
+
+
+def result_key(content_digest, parsing_options):
+    """Key of a result in the cache: the same log analyzed with the same options has the same key."""
+    enabled = ','.join(option for option in SERVICE_PARSING_OPTIONS if parsing_options.get(option))
+    # A result parsed under a budget may be partial, so it's only shared with requests for the same budget
+    budgets = ','.join(str(parsing_options.get(option) or '') for option in ('time_budget_seconds', 'memory_budget_mb'))
+    return hashlib.sha256(f"{content_digest}:{enabled}:{budgets}".encode()).hexdigest()
+
+
+class AnalysisService:
+    """
+    Job queue and worker pool behind the HTTP API. Each job runs parse_log_data in a fresh process with a
+    memory limit; results are JSON files in a content-addressed cache, so a log that was already analyzed
+    with the same options is answered from the cache without queueing anything.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, workers=DEFAULT_WORKERS, queue_size=DEFAULT_QUEUE_SIZE,
+                 memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, max_upload_mb=DEFAULT_MAX_UPLOAD_MB):
+        self.results_dir = os.path.join(cache_dir, 'results')
+        self.uploads_dir = os.path.join(cache_dir, 'uploads')
+        os.makedirs(self.results_dir, exist_ok=True)
+        os.makedirs(self.uploads_dir, exist_ok=True)
+
+        self.memory_limit_mb = memory_limit_mb
+        self.max_upload_bytes = max_upload_mb * 1024 * 1024
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.pending = queue.Queue(maxsize=queue_size)
+
+        self.context = multiprocessing.get_context('spawn')
+        self.messages = self.context.Queue()
+        self.threads = [threading.Thread(target=self._read_messages, name="analysis-messages", daemon=True)]
+        self.threads += [threading.Thread(target=self._work, name=f"analysis-worker-{index}", daemon=True)
+                         for index in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def result_path(self, job_id):
+        return os.path.join(self.results_dir, f"{job_id}.json")
+
+    def _new_job(self, job_id, status, **fields):
+        job = {
+            'job_id': job_id,
+            'status': status,  # 'queued', 'running', 'done' or 'failed'
+            'progress': 1.0 if status == 'done' else 0.0,
+            'message': None,
+            'error': None,
+            'submitted': time.time(),
+            'started': None,
+            'finished': None
+        }
+        job.update(fields)
+        return job
+
+    def get_job(self, job_id):
+        """Return a copy of a job, or a finished job for a result that is only in the cache, or None."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                return public_job(job)
+        if os.path.exists(self.result_path(job_id)):
+            return self._new_job(job_id, 'done')
+        return None
+
+    def counts(self):
+        with self.lock:
+            statuses = [job['status'] for job in self.jobs.values()]
+        return {status: statuses.count(status) for status in ('queued', 'running', 'done', 'failed')}
+
+    def receive_upload(self, stream, length):
+        """Stream an upload to disk while hashing it. Returns (path, sha256 hex digest)."""
+        digest = hashlib.sha256()
+        file_descriptor, path = tempfile.mkstemp(dir=self.uploads_dir, suffix='.part')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                remaining = length
+                while remaining > 0:
+                    chunk = stream.read(min(UPLOAD_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ConnectionError("The upload ended before Content-Length bytes were received")
+                    digest.update(chunk)
+                    file.write(chunk)
+                    remaining -= len(chunk)
+        except BaseException:
+            os.remove(path)
+            raise
+        return path, digest.hexdigest()
+
+    def submit(self, upload_path, content_digest, parsing_options):
+        """
+        Queue an uploaded log, or answer from the cache or an identical job already in progress.
+        Returns the job; raises queue.Full when too many jobs are waiting.
+        """
+        job_id = result_key(content_digest, parsing_options)
+        with self.lock:
+            job = self.jobs.get(job_id)
+            reuse = job is not None and job['status'] in ('queued', 'running', 'done')
+            if not reuse and os.path.exists(self.result_path(job_id)):
+                job = self.jobs[job_id] = self._new_job(job_id, 'done')
+                reuse = True
+            if reuse:
+                os.remove(upload_path)
+                return public_job(job)
+
+            log_path = os.path.join(self.uploads_dir, f"{job_id}.log")
+            os.replace(upload_path, log_path)
+            job = self._new_job(job_id, 'queued', _log_path=log_path, _options=parsing_options)
+            try:
+                self.pending.put_nowait(job_id)
+            except queue.Full:
+                os.remove(log_path)
+                raise
+            self.jobs[job_id] = job
+            return public_job(job)
+
+    def _work(self):
+        """Worker thread: run queued jobs one at a time, each in a new process."""
+        while True:
+            job_id = self.pending.get()
+            with self.lock:
+                job = self.jobs[job_id]
+                job['status'] = 'running'
+                job['started'] = time.time()
+                job['message'] = "Starting worker..."
+
+            process = self.context.Process(
+                target=run_analysis_job,
+                args=(job_id, job['_log_path'], job['_options'], self.result_path(job_id), self.memory_limit_mb, self.messages),
+                name=f"analysis-{job_id[:12]}"
+            )
+            process.start()
+            process.join()
+
+            with self.lock:
+                job['finished'] = time.time()
+                if process.exitcode == 0 and os.path.exists(self.result_path(job_id)):
+                    job['status'] = 'done'
+                    job['progress'] = 1.0
+                    job['message'] = None
+                else:
+                    job['status'] = 'failed'
+                    if job['error'] is None:
+                        # Killed without reporting anything, usually for running out of memory
+                        job['error'] = f"The worker process exited with code {process.exitcode}"
+            try:
+                os.remove(job['_log_path'])
+            except OSError:
+                pass
+
+    def _read_messages(self):
+        """Apply progress and error messages sent by the worker processes."""
+        while True:
+            job_id, kind, payload = self.messages.get()
+            with self.lock:
+                job = self.jobs.get(job_id)
+                if job is None:
+                    continue
+                if kind == 'progress' and job['status'] == 'running':
+                    job['progress'], message = payload
+                    if message is not None:
+                        job['message'] = message
+                elif kind == 'error':
+                    job['error'] = payload
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /jobs[?options=shader,imports]   upload a log (raw body, optionally compressed); returns the job
+         [&time_budget=30&memory_budget_mb=512]  stop parsing at a budget and return partial results
+    GET  /jobs/<id>                       job status and progress
+    GET  /jobs/<id>/result                JSON analysis of a finished job
+    GET  /health                          service status
+    """
+
+    server_version = "EditorLogAnalysis/1.0"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_error_json(self, status, message):
+        self.send_json(status, {'error': message})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/jobs':
+            self.send_error_json(404, "Not found")
+            return
+
+        try:
+            query = parse_qs(url.query)
+            parsing_options = parse_options_query(query.get('options', [''])[0])
+            parsing_options.update(parse_budget_query(query))
+        except ValueError as e:
+            self.send_error_json(400, str(e))
+            return
+
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self.send_error_json(411, "Content-Length is required")
+            return
+        length = int(length)
+        if length <= 0:
+            self.send_error_json(400, "The request body must contain the log")
+            return
+        if length > self.service.max_upload_bytes:
+            self.send_error_json(413, f"Logs larger than {self.service.max_upload_bytes // (1024 * 1024)} MB are not accepted")
+            return
+
+        upload_path, content_digest = self.service.receive_upload(self.rfile, length)
+        try:
+            job = self.service.submit(upload_path, content_digest, parsing_options)
+        except queue.Full:
+            self.send_error_json(503, "Too many jobs are waiting, try again later")
+            return
+        self.send_json(200 if job['status'] == 'done' else 202, job)
+
+    def do_GET(self):
+        parts = [part for part in urlparse(self.path).path.split('/') if part]
+        if parts == ['health']:
+            self.send_json(200, {'status': 'ok', 'jobs': self.service.counts()})
+            return
+        if len(parts) not in (2, 3) or parts[0] != 'jobs' or (len(parts) == 3 and parts[2] != 'result'):
+            self.send_error_json(404, "Not found")
+            return
+
+        job = self.service.get_job(parts[1])
+        if job is None:
+            self.send_error_json(404, "Unknown job")
+            return
+        if len(parts) == 2:
+            self.send_json(200, job)
+            return
+
+        if job['status'] == 'failed':
+            self.send_json(500, job)
+            return
+        if job['status'] != 'done':
+            self.send_json(409, job)
+            return
+
+        # Stream the cached result file
+        path = self.service.result_path(job['job_id'])
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(os.path.getsize(path)))
+        self.end_headers()
+        with open(path, 'rb') as file:
+            while True:
+                chunk = file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, **service_options):
+    """Create the HTTP server and its AnalysisService (call serve_forever() to run it)."""
+    server = ThreadingHTTPServer((host, port), AnalysisRequestHandler)
+    server.daemon_threads = True
+    server.service = AnalysisService(**service_options)
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP service that analyzes uploaded Editor.log files")
+    parser.add_argument("--host", help="Interface to listen on", default=DEFAULT_HOST)
+    parser.add_argument("--port", help="Port to listen on", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", help="Logs analyzed in parallel", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--queue-size", help="Jobs allowed to wait for a worker", type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument("--memory-limit-mb", help="Memory limit of each worker process (0 for none)", type=int,
+                        default=DEFAULT_MEMORY_LIMIT_MB)
+    parser.add_argument("--max-upload-mb", help="Largest log accepted", type=int, default=DEFAULT_MAX_UPLOAD_MB)
+    parser.add_argument("--cache-dir", help="Where uploads and results are stored", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, cache_dir=args.cache_dir, workers=args.workers,
+                           queue_size=args.queue_size, memory_limit_mb=args.memory_limit_mb,
+                           max_upload_mb=args.max_upload_mb)
+    print(f"Serving log analysis on http://{args.host}:{server.server_address[1]} (results in {args.cache_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
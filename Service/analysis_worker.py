@@ -0,0 +1,100 @@
+import json
+import math
+import os
+import traceback
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # resource is not available on Windows
+    resource = None
+
+
+def to_json_compatible(value):
+    """Convert parsed data (frames, numpy values, datetimes, nested dicts and lists) to plain JSON values."""
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient='records', date_format='iso', default_handler=str))
+    if isinstance(value, pd.Series):
+        return to_json_compatible(value.tolist())
+    if isinstance(value, dict):
+        return {str(key): to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_compatible(item) for item in value]
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def analysis_to_json(parsed_data):
+    """Build the JSON document returned by the service from the result of parse_log_data."""
+    return {
+        'unity_version': parsed_data['unity_version'],
+        'log_header': to_json_compatible(parsed_data['log_header']),
+        'overall_time': parsed_data['overall_time'],
+        'section_times': to_json_compatible(parsed_data['section_times']),
+        'parser_stats': to_json_compatible(parsed_data['parser_stats']),
+        'coverage': to_json_compatible(parsed_data['coverage']),
+        # Editor sessions of a concatenated log, each parsed separately; the data is their merge
+        'sessions': [to_json_compatible(data['session']) for data in parsed_data.get('sessions') or []],
+        'data': {
+            key: to_json_compatible(parsed_data[key]) for key in (
+                'shader_df', 'shader_issues', 'import_df', 'loading_df', 'build_reports', 'refresh_df',
+                'refresh_ops', 'player_build_info', 'il2cpp_data', 'tundra_info', 'domain_reloads',
+                'domain_reload_ops', 'performance_df'
+            )
+        }
+    }
+
+
+def set_memory_limit(limit_mb):
+    """Cap the address space of the current process. Returns False where limits aren't supported."""
+    if resource is None or not limit_mb:
+        return False
+    limit = int(limit_mb * 1024 * 1024)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    return True
+
+
+def run_analysis_job(job_id, log_path, parsing_options, result_path, memory_limit_mb, messages):
+    """
+    Entry point of a worker process: parse one log and write the JSON result to result_path.
+    Progress and errors are sent to the service as (job_id, kind, payload) tuples on the messages queue.
+    """
+    def progress(fraction, message=None, **details):
+        messages.put((job_id, 'progress', (fraction, message)))
+
+    # The first message starts the queue's feeder thread, which can't be started once memory is capped
+    progress(0.0, "Starting...")
+    set_memory_limit(memory_limit_mb)
+
+    try:
+        # Imported here so the service process itself doesn't load the parsers
+        from Parsers import parse_log_data
+
+        parsed_data = parse_log_data(log_path, parsing_options, progress=progress)
+        progress(1.0, "Writing result...")
+
+        temp_path = result_path + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(analysis_to_json(parsed_data), file)
+        # Results appear in the cache atomically
+        os.replace(temp_path, result_path)
+    except MemoryError:
+        messages.put((job_id, 'error', f"Out of memory (the per-job limit is {memory_limit_mb} MB)"))
+        raise SystemExit(1)
+    except Exception as e:
+        traceback.print_exc()
+        messages.put((job_id, 'error', f"{type(e).__name__}: {e}"))
+        raise SystemExit(1)
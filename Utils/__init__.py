@@ -1,4 +1,9 @@
-
+from .background_jobs import *
+from .chart_helpers import *
 from .data_helpers import *
+from .event_timeline import *
+from .instrumentation import *
+from .log_header import *
+from .log_source import *
+from .render_cache import *
 from .ui_helpers import *
-
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import streamlit as st
+
+# How often a view waiting on a background job refreshes its progress, in seconds
+JOB_POLL_INTERVAL = 0.5
+
+
+class JobCancelled(Exception):
+    """Raised inside a background job to stop it once it has been cancelled."""
+
+
+def start_background_job(name, func, *args, cancellable=False, **kwargs):
+    """
+    Run func(*args, progress=callback, **kwargs) in a daemon thread and track it in session state under name.
+    The callback takes (fraction, message=None, **details); details (e.g. bytes read, ETA) are kept as the
+    job's details. The returned job dict is updated by the thread: progress, message, details, done, result,
+    error and cancelled. The thread must not call Streamlit functions.
+    A cancellable job also gets cancel_event=threading.Event(); it should check it regularly and raise
+    JobCancelled once it is set (see cancel_background_job).
+    """
+    job = {
+        'progress': 0.0,
+        'message': None,
+        'details': {},
+        'done': False,
+        'result': None,
+        'error': None,
+        'cancelled': False,
+        'cancel_event': threading.Event(),
+        'started': time.time()
+    }
+    if cancellable:
+        kwargs['cancel_event'] = job['cancel_event']
+
+    def report_progress(fraction, message=None, **details):
+        job['progress'] = max(0.0, min(float(fraction), 1.0))
+        if message is not None:
+            job['message'] = message
+        if details:
+            job['details'] = details
+
+    def run():
+        try:
+            job['result'] = func(*args, progress=report_progress, **kwargs)
+        except JobCancelled:
+            job['cancelled'] = True
+        except Exception as e:
+            job['error'] = e
+        finally:
+            job['done'] = True
+
+    job['thread'] = threading.Thread(target=run, name=f"background-{name}", daemon=True)
+    if 'background_jobs' not in st.session_state:
+        st.session_state.background_jobs = {}
+    st.session_state.background_jobs[name] = job
+    job['thread'].start()
+    return job
+
+
+def get_background_job(name):
+    """Return the job started under name in this session, or None."""
+    return st.session_state.get('background_jobs', {}).get(name)
+
+
+def clear_background_job(name):
+    """Forget a job once its result has been collected."""
+    st.session_state.get('background_jobs', {}).pop(name, None)
+
+
+def cancel_background_job(name):
+    """Ask a running job to stop. Returns False if there is no such job or it has already finished."""
+    job = get_background_job(name)
+    if job is None or job['done']:
+        return False
+    job['cancel_event'].set()
+    return True
+
+
+def show_job_progress(name, text="Working..."):
+    """
+    Draw a progress bar for a running job that refreshes itself without rerunning the rest of the page,
+    then rerun the app once the job has finished so its result can be collected.
+    """
+    def progress_bar():
+        job = get_background_job(name)
+        if job is None or job['done']:
+            st.rerun()
+        st.progress(job['progress'], text=job['message'] or text)
+
+    if hasattr(st, 'fragment'):
+        st.fragment(progress_bar, run_every=JOB_POLL_INTERVAL)()
+    else:
+        # Older Streamlit versions: poll with full reruns
+        progress_bar()
+        time.sleep(JOB_POLL_INTERVAL)
+        st.rerun()
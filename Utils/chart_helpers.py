@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Maximum number of points a single line/scatter chart sends to the browser
+CHART_POINT_BUDGET = 5000
+
+# Maximum number of bars in charts that draw one bar per row
+CHART_CATEGORY_BUDGET = 200
+
+# Scatter series with more points than this are drawn with WebGL instead of SVG
+WEBGL_POINT_THRESHOLD = 1000
+
+
+def _as_numeric(values):
+    """Convert a column (numbers or datetimes) to a float array for downsampling."""
+    series = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.astype('int64').to_numpy(dtype=float)
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+
+
+def histogram_figure(values, nbins=50, x_label=None, height=400):
+    """
+    Bin values with NumPy and plot the bin counts, so only nbins bars are sent to the browser
+    instead of every raw value (px.histogram serializes the whole column).
+    """
+    values = _as_numeric(values)
+    values = values[np.isfinite(values)]
+    if len(values):
+        counts, edges = np.histogram(values, bins=nbins)
+    else:
+        counts, edges = np.zeros(0, dtype=int), np.zeros(1)
+
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]) if len(counts) else None,
+        hovertemplate="%{customdata[0]:.4g} - %{customdata[1]:.4g}<br>count=%{y}<extra></extra>"
+    ))
+    fig.update_layout(height=height, bargap=0, xaxis_title=x_label, yaxis_title="count")
+    return fig
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Select threshold point indices with Largest-Triangle-Three-Buckets, which keeps the visual
+    shape of a line (peaks and dips) far better than taking every nth point.
+    x must be sorted.
+    """
+    x = _as_numeric(x)
+    y = _as_numeric(y)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    y = np.nan_to_num(y)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # The first and last points are always kept; the rest are split into threshold - 2 buckets
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        if end >= n - 1:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+
+        # Keep the point of this bucket forming the largest triangle with the previous pick and the next bucket's average
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, buckets):
+    """
+    Keep the minimum and maximum of each of buckets equal slices of y (plus the first and last point).
+    Cheaper than LTTB and guarantees that every spike survives, which suits bar and timeline charts.
+    """
+    y = np.nan_to_num(_as_numeric(y))
+    n = len(y)
+    if buckets <= 0 or 2 * buckets >= n:
+        return np.arange(n)
+
+    size = n // buckets
+    trimmed = y[:size * buckets].reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    picks = [offsets + trimmed.argmin(axis=1), offsets + trimmed.argmax(axis=1), [0, n - 1]]
+    if size * buckets < n:
+        tail = y[size * buckets:]
+        picks.append([size * buckets + int(tail.argmin()), size * buckets + int(tail.argmax())])
+    return np.unique(np.concatenate(picks))
+
+
+def downsample_frame(df, x, y, budget=CHART_POINT_BUDGET, method='lttb', group=None):
+    """
+    Reduce a frame to at most about budget rows before plotting, per series when group is given.
+    method is 'lttb' for line charts or 'minmax' for bars and timelines.
+    """
+    if len(df) <= budget:
+        return df
+
+    def reduce(frame, frame_budget):
+        frame = frame.sort_values(x)
+        if method == 'minmax':
+            indices = minmax_indices(frame[y], frame_budget // 2)
+        else:
+            indices = lttb_indices(frame[x], frame[y], frame_budget)
+        return frame.iloc[indices]
+
+    if group is None:
+        return reduce(df, budget)
+
+    groups = df.groupby(group, sort=False)
+    # Share the budget between series in proportion to their size
+    parts = [reduce(frame, max(3, int(budget * len(frame) / len(df)))) for _, frame in groups]
+    return pd.concat(parts)
+
+
+def top_rows(df, budget=CHART_CATEGORY_BUDGET):
+    """Return the first budget rows of an already sorted frame and the number of rows left out."""
+    if len(df) <= budget:
+        return df, 0
+    return df.head(budget), len(df) - budget
+
+
+def use_webgl(fig, threshold=WEBGL_POINT_THRESHOLD):
+    """Redraw scatter/line traces with more than threshold points using WebGL (scattergl)."""
+    traces = []
+    converted = False
+    for trace in fig.data:
+        if trace.type == 'scatter' and trace.x is not None and len(trace.x) > threshold:
+            trace_json = trace.to_plotly_json()
+            trace_json.pop('type', None)
+            # Properties scattergl doesn't support (e.g. spline lines) are dropped
+            trace = go.Scattergl(trace_json, skip_invalid=True)
+            converted = True
+        traces.append(trace)
+    if converted:
+        fig.data = []
+        fig.add_traces(traces)
+    return fig
@@ -1,8 +1,15 @@
-import base64
+import codecs
 import re
 import io
 import argparse
 import os
+import time
+
+from .instrumentation import record_parser_stats, parser_reading_limited, parser_should_stop_reading, mark_parser_truncated
+from .log_source import open_log_stream
+
+# Size of the chunks read when streaming a log file
+LOG_CHUNK_SIZE = 1024 * 1024
 
 def convert_to_mb(value, unit):
     """Convert a size value to MB"""
@@ -28,32 +35,178 @@ def format_time(seconds):
     minutes = seconds / 60
     return f"{seconds:.2f}s ({minutes:.1f} minutes)"
 
-def get_download_link(buffer, filename):
-    """Generate a link to download the specified file."""
-    b64 = base64.b64encode(buffer.getvalue()).decode()
-    return f'<a href="data:application/pdf;base64,{b64}" download="{filename}">Download {filename}</a>'    
-   
 def read_log_content(log_file):
-    """Read content from either a file path or a file-like object."""
-    if isinstance(log_file, str):
-        # It's a file path
-        with open(log_file, 'r', errors='ignore') as file:
-            return file.read()
-    else:
-        # It's a file-like object (BytesIO)
-        log_file.seek(0)
-        return log_file.read().decode('utf-8', errors='ignore')
-
-def check_log_data_completeness(log_file_path, shader_df, import_df, loading_df, build_df, refresh_df, player_build_info, unity_version):
-    """Check which data elements are present or missing in the log file."""
+    """
+    Read content from either a file path or a file-like object.
+    Compressed logs (gzip, xz, zstd, bzip2, zip) are decompressed transparently.
+    """
+    stream, close = open_log_stream(log_file)
+    try:
+        if parser_reading_limited():
+            data = _read_within_budget(stream)
+        else:
+            data = stream.read()
+    finally:
+        close()
+    
+    if isinstance(data, str):
+        # Already text (StringIO)
+        record_parser_stats(bytes_read=len(data))
+        return data
+    
+    start_time = time.perf_counter()
+    content = data.decode('utf-8', errors='ignore')
+    record_parser_stats(bytes_read=len(data), decode_seconds=time.perf_counter() - start_time)
+    return content
+
+def _read_within_budget(stream):
+    """Read a stream in chunks until the parser's budget is used up, then cut at the last complete line."""
+    chunks = []
+    truncated = False
+    chunk = stream.read(LOG_CHUNK_SIZE)
+    while chunk:
+        # Checked only while there is more to read, so a log read to the end is never partial
+        if parser_should_stop_reading():
+            truncated = True
+            break
+        chunks.append(chunk)
+        chunk = stream.read(LOG_CHUNK_SIZE)
+    
+    data = ''.join(chunks) if chunks and isinstance(chunks[0], str) else b''.join(chunks)
+    if truncated:
+        data = data[:data.rfind('\n' if isinstance(data, str) else b'\n') + 1]
+        mark_parser_truncated(len(data))
+    return data
+
+def count_log_lines(content):
+    """Count the lines in decoded log content."""
+    if not content:
+        return 0
+    return content.count('\n') + (0 if content.endswith('\n') else 1)
+
+def read_log_lines(log_file):
+    """Read a log from a file path or file-like object as a list of lines (without line endings)."""
+    return read_log_content(log_file).splitlines()
+
+def iter_log_lines(log_file, chunk_size=LOG_CHUNK_SIZE):
+    """
+    Stream lines (without line endings) from a file path or file-like object.
+    Reads the log in chunks so the whole file never has to be held in memory;
+    compressed logs are decompressed chunk by chunk as they are read.
+    """
+    file, close = open_log_stream(log_file)
+    
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    remainder = ''
+    consumed = 0
+    try:
+        data = file.read(chunk_size)
+        while data:
+            # Over its time or memory budget, a parser stops at the last complete line it has read;
+            # checked only while there is more to read, so a log read to the end is never partial
+            if parser_should_stop_reading():
+                if isinstance(file, io.TextIOBase):
+                    mark_parser_truncated(consumed - len(remainder))
+                else:
+                    pending = len(decoder.getstate()[0])
+                    mark_parser_truncated(consumed - pending - len(remainder.encode('utf-8')))
+                return
+            consumed += len(data)
+            
+            if isinstance(data, str):
+                text = data
+                record_parser_stats(bytes_read=len(data))
+            else:
+                start_time = time.perf_counter()
+                text = decoder.decode(data)
+                record_parser_stats(bytes_read=len(data), decode_seconds=time.perf_counter() - start_time)
+            
+            lines = (remainder + text).split('\n')
+            # The last piece may be an incomplete line, keep it for the next chunk
+            remainder = lines.pop()
+            for line in lines:
+                yield line[:-1] if line.endswith('\r') else line
+            data = file.read(chunk_size)
+        
+        remainder += decoder.decode(b'', final=True)
+        if remainder:
+            yield remainder[:-1] if remainder.endswith('\r') else remainder
+    finally:
+        close()
+
+def performance_summary_totals(parsed_data):
+    """
+    Totals shown in the Performance Summary, in seconds (None when the data type has no entries).
+    parsed_data only needs the data types to sum up; missing ones count as empty.
+    """
+    player_build_info = parsed_data.get('player_build_info') or []
+    loading_df = parsed_data.get('loading_df')
+    domain_reloads = parsed_data.get('domain_reloads') or []
+    refresh_df = parsed_data.get('refresh_df')
+    import_df = parsed_data.get('import_df')
+    shader_df = parsed_data.get('shader_df')
+    
+    totals = {'build': None, 'loading': None, 'domain_reload': None, 'refresh': None, 'import': None, 'shader': None}
+    if player_build_info:
+        totals['build'] = sum(entry.get('total_duration_sec', 0) for entry in player_build_info)
+    if loading_df is not None and not loading_df.empty and 'total_loading_time' in loading_df.columns:
+        totals['loading'] = loading_df['total_loading_time'].sum()
+    if domain_reloads:
+        totals['domain_reload'] = sum((reload.get('reset_time', 0) or 0) for reload in domain_reloads)
+    if refresh_df is not None and not refresh_df.empty and 'total_time' in refresh_df.columns:
+        totals['refresh'] = refresh_df['total_time'].sum()
+    if import_df is not None and not import_df.empty and 'import_time_seconds' in import_df.columns:
+        totals['import'] = import_df['import_time_seconds'].sum()
+    if shader_df is not None and not shader_df.empty:
+        if 'total_seconds' in shader_df.columns:
+            totals['shader'] = shader_df['total_seconds'].sum()
+        elif 'compilation_seconds' in shader_df.columns:
+            # Fallback to compilation_seconds if total_seconds is not available
+            totals['shader'] = shader_df['compilation_seconds'].sum()
+    return totals
+
+def format_partial_coverage(coverage):
+    """Describe the part of the log a partially parsed data type covers (an entry of parsed_data['coverage'])."""
+    if coverage.get('total_bytes'):
+        return f"partial coverage ({coverage['end_byte'] / coverage['total_bytes'] * 100:.1f}% of log)"
+    return f"partial coverage (first {coverage['end_byte'] / (1024 * 1024):.1f} MB of log)"
+
+def format_time_window(window):
+    """Describe the window a log was cut to (parsed_data['time_window'])."""
+    start = window['start'].strftime('%Y-%m-%d %H:%M:%S') if window['start'] else "start of log"
+    end = window['end'].strftime('%Y-%m-%d %H:%M:%S') if window['end'] else "end of log"
+    size_mb = (window['end_byte'] - window['start_byte']) / (1024 * 1024)
+    return f"{start} – {end} ({size_mb:.1f} MB of {window['total_bytes'] / (1024 * 1024):.1f} MB)"
+
+def format_log_session(session):
+    """Describe one Editor session of a log (an entry of parse_log_sessions)."""
+    size_mb = (session['end_byte'] - session['start_byte']) / (1024 * 1024)
+    details = [f"Session {session['index'] + 1}",
+               f"Unity {session['unity_version']}" if session.get('unity_version') else None,
+               f"{size_mb:.1f} MB"]
+    return " · ".join(detail for detail in details if detail)
+
+def check_log_data_completeness(log_file_path, shader_df, import_df, loading_df, build_df, refresh_df, player_build_info, unity_version, log_header=None, coverage=None):
+    """
+    Check which data elements are present or missing in the log file. log_header is the result of probe_log_header;
+    coverage lists the data types parsed from only part of the log, which are reported as partial instead of missing.
+    """
     issues = []
+    coverage = coverage or {}
+    
+    def partial(key, description):
+        """Report a data type cut short by the parsing budget; returns False if it covers the whole log."""
+        if key not in coverage:
+            return False
+        issues.append(f"❗ {description}: {format_partial_coverage(coverage[key])}. Parsing stopped at its time or memory budget. ❗")
+        return True
     
     # Check if Unity version is available
     if unity_version is None:
         issues.append("❗ Unity version information not found in the log.")
     
-    # Check for timestamp information
-    has_timestamps = True
+    # Check for timestamp information, from the log header when it was probed
+    has_timestamps = not (log_header and log_header.get('has_timestamps') is False)
     
     # Check if any dataframes have timestamp data
     if not shader_df.empty and ('timestamp' not in shader_df.columns or shader_df['timestamp'].isna().all()):
@@ -71,104 +224,64 @@ def check_log_data_completeness(log_file_path, shader_df, import_df, loading_df,
         issues.append("❗ Timestamp information is missing or incomplete. Time-based analysis may be limited. \n You can enable TimeStamps in Unity Editor -> Preferences -> General -> Timestamp Editor log entries ❗")
     
     # Check for shader compilation data
-    if shader_df.empty:
+    if partial('shader_df', "Shader compilation data"):
+        pass
+    elif shader_df.empty:
         issues.append("❗ No shader compilation data found.  Looks like no shaders were compiled in this Editor session. ❗")
     elif 'compilation_seconds' not in shader_df.columns:
         issues.append("❗ Shader compilation time data is missing. Shader performance analysis will be limited. ❗")
     
     # Check for asset import data
-    if import_df.empty:
+    if not partial('import_df', "Asset import data") and import_df.empty:
         issues.append("❗ No asset import data found.  Looks like no assets were imported in this Editor session ❗")
     
     # Check for project loading data
-    if loading_df.empty:
+    if not partial('loading_df', "Project loading data") and loading_df.empty:
         issues.append("❗ No project loading time data found.  This is very unusual ❗")
     
     # Check for build report data
-    if build_df.empty:
+    if not partial('build_df', "Build report data") and build_df.empty:
         issues.append("❗ No build report data found.  Looks like this Editor session didn't complete a Build ❗")
     
     # Check for asset pipeline refresh data
-    if refresh_df.empty:
+    if not partial('refresh_df', "Asset pipeline refresh data") and refresh_df.empty:
         issues.append("❗ No asset pipeline refresh data found.  Looks like the Asset Pipeline was never refreshed in this Editor Session ❗")
     
     # Check for player build info
-    if not player_build_info:
+    if not partial('player_build_info', "Player build performance data") and not player_build_info:
         issues.append("❗ No player build performance data found.  Looks like this Editor session didn't complete a Build ❗")
     
-    return issues
-
-def extract_unity_version(log_file_path):
-    """
-    Extract Unity version info from the log file.
-    Works with both file paths and file-like objects (BytesIO/StringIO).
-    """
-    version_pattern = r"Version is ['\"]([^'\"]+)['\"]"
+    # Data types without a completeness check of their own
+    for key, description in (('shader_issues', "Shader errors and warnings"), ('il2cpp_data', "IL2CPP processing data"),
+                             ('tundra_info', "Tundra build data"), ('domain_reloads', "Domain reload data"),
+                             ('performance_df', "Performance report data")):
+        partial(key, description)
     
-    try:
-        # Handle both file paths and BytesIO/StringIO objects
-        if isinstance(log_file_path, (io.BytesIO, io.StringIO)):
-            # Reset position to start of file
-            log_file_path.seek(0)
-            
-            if isinstance(log_file_path, io.BytesIO):
-                # Convert bytes to string
-                content = log_file_path.getvalue().decode('utf-8', errors='ignore')
-                lines = content.splitlines()
-            else:
-                # It's already a StringIO
-                lines = log_file_path.getvalue().splitlines()
-                
-            for line in lines:
-                if "Built from" in line and "Version is" in line:
-                    match = re.search(version_pattern, line)
-                    if match:
-                        return match.group(1)
-        else:
-            # It's a file path
-            with open(log_file_path, 'r', errors='ignore') as file:
-                for line in file:
-                    if "Built from" in line and "Version is" in line:
-                        match = re.search(version_pattern, line)
-                        if match:
-                            return match.group(1)
-                            
-    except Exception as e:
-        print(f"Error extracting Unity version: {e}")
-    
-    # Try again with a more relaxed pattern if initial search fails
-    try:
-        if isinstance(log_file_path, (io.BytesIO, io.StringIO)):
-            log_file_path.seek(0)
-            content = log_file_path.read().decode('utf-8', errors='ignore') if isinstance(log_file_path, io.BytesIO) else log_file_path.read()
-            
-            # Look for any line with Unity version pattern
-            broader_pattern = r"\d{4}\.\d+\.\d+[fb]\d+"
-            match = re.search(broader_pattern, content)
-            if match:
-                return match.group(0)
-        else:
-            with open(log_file_path, 'r', errors='ignore') as file:
-                content = file.read()
-                broader_pattern = r"\d{4}\.\d+\.\d+[fb]\d+"
-                match = re.search(broader_pattern, content)
-                if match:
-                    return match.group(0)
-    except Exception as e:
-        print(f"Error in secondary Unity version extraction: {e}")
-    
-    return None
-
+    return issues
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Unity Build Log Analyzer")
     
     # Main log file argument (required)
-    parser.add_argument("log_file", help="Path to Unity Editor log file", type=str)
+    parser.add_argument("log_file", help="Path to Unity Editor log file (.log/.txt, or compressed .gz/.xz/.zst/.bz2/.zip)", type=str)
     
     # Output path for PDF report (optional)
     parser.add_argument("--output", "-o", help="Output path for PDF report (optional)", type=str)
     
+    # Record peak memory per parser (slower)
+    parser.add_argument("--trace-memory", help="Record peak memory allocated by each parser using tracemalloc", action="store_true")
+    
+    # Budgets for a quick, partial analysis of large logs
+    parser.add_argument("--time-budget", help="Stop parsing after about this many seconds and report partial results", type=float)
+    parser.add_argument("--memory-budget-mb", help="Stop parsing once it has used this much additional memory (MB) and report partial results", type=float)
+    
+    # Only analyze the lines logged in a time window
+    parser.add_argument("--start", help="Start of the time window to analyze: a date and time (2024-05-01T10:00) or a time of day (10:00) on the log's first day", type=str)
+    parser.add_argument("--end", help="End of the time window to analyze (same formats as --start)", type=str)
+    
+    # Estimate the totals from samples of the log instead of parsing it
+    parser.add_argument("--quick-look", help="Print totals estimated from evenly spaced samples of the log (with 95%% intervals) and exit", action="store_true")
+    
     args = parser.parse_args()
     
     # Normalize paths to handle any platform-specific issues
@@ -0,0 +1,256 @@
+import numpy as np
+import pandas as pd
+
+# Kinds of timed events, in the order their rows are drawn in the timeline
+TIMELINE_EVENT_KINDS = (
+    'Project Loading', 'Player Build', 'Player Build Step', 'Domain Reload', 'Asset Pipeline Refresh', 'Asset Import',
+    'Timestamp Gap'
+)
+
+# Subtrees of at most 2**TIMELINE_SCAN_LEVEL events are scanned instead of descended into
+TIMELINE_SCAN_LEVEL = 3
+
+
+def _as_nanoseconds(timestamps):
+    """Convert timestamps (datetimes, Timestamps or a datetime column) to int64 nanoseconds, NaT as INT64 min."""
+    series = timestamps if isinstance(timestamps, pd.Series) else pd.Series(list(timestamps), dtype=object)
+    return pd.to_datetime(series, errors='coerce').to_numpy(dtype='datetime64[ns]').view('int64')
+
+
+def _logged_events(kind, ends, durations, labels):
+    """
+    Events reported by one log line each once they are over: the line's timestamp is the end of the event
+    and its duration (seconds) gives the start. Events without a timestamp can't be placed and are dropped,
+    but keep their position in the source data as entity id.
+    """
+    end = _as_nanoseconds(ends)
+    duration = np.nan_to_num(np.asarray(durations, dtype=float), nan=0.0).clip(min=0.0)
+    keep = end != np.iinfo(np.int64).min
+    entity = np.flatnonzero(keep)
+    end = end[keep]
+    return {
+        'start': end - (duration[keep] * 1e9).astype('int64'),
+        'end': end,
+        'kind': np.full(len(entity), TIMELINE_EVENT_KINDS.index(kind), dtype='int8'),
+        'entity': entity,
+        'line': np.full(len(entity), -1, dtype='int64'),
+        'label': np.asarray(labels, dtype=object)[keep] if len(entity) else np.empty(0, dtype=object)
+    }
+
+
+def _column(df, name, default=None):
+    return df[name] if name in df.columns else pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+def _index_max_end(start, end):
+    """
+    Augment start-sorted intervals with an implicit interval tree (as in cgranges): the events form a
+    complete binary search tree by position, the node at position i sits at the level given by the number
+    of trailing one bits of i, and max_end[i] is the largest end in its subtree. Returns (max_end, root level).
+    """
+    count = len(start)
+    max_end = end.copy()
+    if count == 0:
+        return max_end, -1
+    # The last leaf (even position) bounds the subtrees that reach past the last event
+    last_i = (count - 1) & ~1
+    last = int(max_end[last_i])
+    level = 1
+    while 1 << level <= count:
+        half = 1 << (level - 1)
+        nodes = np.arange((half << 1) - 1, count, half << 2)
+        left = max_end[nodes - half]
+        right_positions = nodes + half
+        # A right subtree past the last event holds the events of the last complete subtree at most
+        right = np.where(right_positions < count, max_end[np.minimum(right_positions, count - 1)], last)
+        max_end[nodes] = np.maximum(max_end[nodes], np.maximum(left, right))
+        last_i = last_i - half if (last_i >> level) & 1 else last_i + half
+        if last_i < count and max_end[last_i] > last:
+            last = int(max_end[last_i])
+        level += 1
+    return max_end, level - 1
+
+
+def build_event_timeline(parsed_data, gaps=None):
+    """
+    Put every timed event of the parsed data (project loadings, player builds, domain reloads, pipeline
+    refreshes, asset imports and, if given, timestamp gaps from parse_timestamp_gaps) into one store of
+    NumPy arrays sorted by start time, with an interval index for timeline_overlapping and timeline_running_at.
+    Times are int64 nanoseconds. entity is the event's position in its source data (for example the row of
+    import_df, or the build of a player build step); line is the 1-based log line of the event where the parser records it, -1 otherwise.
+    Shader compilations have no timestamps and are left out.
+    """
+    parts = []
+    loading_df = parsed_data.get('loading_df')
+    if loading_df is not None and not loading_df.empty:
+        parts.append(_logged_events('Project Loading', _column(loading_df, 'timestamp'),
+                                    _column(loading_df, 'total_loading_time', 0.0), ["Project loading"] * len(loading_df)))
+    player_build_info = parsed_data.get('player_build_info') or []
+    if player_build_info:
+        parts.append(_logged_events('Player Build', [entry.get('timestamp') for entry in player_build_info],
+                                    [entry.get('total_duration_sec') for entry in player_build_info],
+                                    [f"{entry.get('phase') or 'Player'} build" for entry in player_build_info]))
+        # Build steps run one after the other from the start of their build
+        for build_index, entry in enumerate(player_build_info):
+            steps = entry.get('steps') or []
+            if not entry.get('timestamp') or not steps:
+                continue
+            durations = np.asarray([(step.get('duration') or 0) * 1e6 for step in steps]).astype('int64')
+            build_start = _as_nanoseconds([entry['timestamp']])[0] - int((entry.get('total_duration_sec') or 0) * 1e9)
+            starts = build_start + np.concatenate(([0], np.cumsum(durations)[:-1]))
+            parts.append({
+                'start': starts,
+                'end': starts + durations,
+                'kind': np.full(len(steps), TIMELINE_EVENT_KINDS.index('Player Build Step'), dtype='int8'),
+                'entity': np.full(len(steps), build_index, dtype='int64'),
+                'line': np.full(len(steps), -1, dtype='int64'),
+                'label': np.asarray([step.get('description') or "Build step" for step in steps], dtype=object)
+            })
+    domain_reloads = parsed_data.get('domain_reloads') or []
+    if domain_reloads:
+        parts.append(_logged_events('Domain Reload', [reload.get('timestamp') for reload in domain_reloads],
+                                    [reload.get('reset_time') for reload in domain_reloads],
+                                    ["Domain reload"] * len(domain_reloads)))
+    refresh_df = parsed_data.get('refresh_df')
+    if refresh_df is not None and not refresh_df.empty:
+        parts.append(_logged_events('Asset Pipeline Refresh', _column(refresh_df, 'timestamp'),
+                                    _column(refresh_df, 'total_time', 0.0), _column(refresh_df, 'initiator', "Refresh").fillna("Refresh")))
+    import_df = parsed_data.get('import_df')
+    if import_df is not None and not import_df.empty:
+        parts.append(_logged_events('Asset Import', _column(import_df, 'timestamp'),
+                                    _column(import_df, 'import_time_seconds', 0.0), _column(import_df, 'asset_path', "")))
+    if gaps:
+        parts.append({
+            'start': _as_nanoseconds([gap['prev_timestamp'] for gap in gaps]),
+            'end': _as_nanoseconds([gap['current_timestamp'] for gap in gaps]),
+            'kind': np.full(len(gaps), TIMELINE_EVENT_KINDS.index('Timestamp Gap'), dtype='int8'),
+            'entity': np.arange(len(gaps)),
+            'line': np.asarray([gap['prev_line_number'] for gap in gaps], dtype='int64'),
+            'label': np.asarray([f"No log output for {gap['time_diff_seconds']:.0f}s"
+                                 + (f" during {gap['operation']['label']}" if gap.get('operation') else "")
+                                 for gap in gaps], dtype=object)
+        })
+
+    fields = ('start', 'end', 'kind', 'entity', 'line', 'label')
+    empty = {'start': np.empty(0, 'int64'), 'end': np.empty(0, 'int64'), 'kind': np.empty(0, 'int8'),
+             'entity': np.empty(0, 'int64'), 'line': np.empty(0, 'int64'), 'label': np.empty(0, dtype=object)}
+    timeline = {field: np.concatenate([empty[field]] + [part[field] for part in parts]) for field in fields}
+    order = np.argsort(timeline['start'], kind='stable')
+    timeline = {field: values[order] for field, values in timeline.items()}
+    timeline['max_end'], timeline['root_level'] = _index_max_end(timeline['start'], timeline['end'])
+    return timeline
+
+
+def timeline_overlapping(timeline, start_time, end_time):
+    """
+    Positions (sorted by start) of the events overlapping [start_time, end_time], bounds included, found
+    by descending the interval index: O(log n + k) for k events found. Times are datetimes or nanoseconds.
+    """
+    start_time = pd.Timestamp(start_time).value if not isinstance(start_time, (int, np.integer)) else int(start_time)
+    end_time = pd.Timestamp(end_time).value if not isinstance(end_time, (int, np.integer)) else int(end_time)
+    starts, ends, max_end = timeline['start'], timeline['end'], timeline['max_end']
+    count = len(starts)
+    found = []
+    if count == 0:
+        return np.empty(0, dtype='int64')
+
+    # (node position, level, whether its left subtree has been visited)
+    stack = [((1 << timeline['root_level']) - 1, timeline['root_level'], False)]
+    while stack:
+        node, level, left_done = stack.pop()
+        if level <= TIMELINE_SCAN_LEVEL:
+            # Small subtree: scan its events in start order
+            first = node >> level << level
+            last = min(first + (1 << (level + 1)) - 1, count)
+            stop = first + int(np.searchsorted(starts[first:last], end_time, side='right'))
+            hits = np.flatnonzero(ends[first:stop] >= start_time)
+            if len(hits):
+                found.append(hits + first)
+        elif not left_done:
+            stack.append((node, level, True))
+            child = node - (1 << (level - 1))
+            # Past the last event the left child still holds events; otherwise skip it when it ends too early
+            if child >= count or max_end[child] >= start_time:
+                stack.append((child, level - 1, False))
+        elif node < count and starts[node] <= end_time:
+            if ends[node] >= start_time:
+                found.append(np.array([node]))
+            stack.append((node + (1 << (level - 1)), level - 1, False))
+    return np.sort(np.concatenate(found)) if found else np.empty(0, dtype='int64')
+
+
+def timeline_interval_join(timeline, starts, ends, kinds=None):
+    """
+    Sorted-interval join of intervals that don't overlap each other (such as timestamp gaps) with the events
+    of a timeline: for each interval [starts[i], ends[i]] (datetimes or nanoseconds), the position of the
+    event covering most of it, the shortest such event on ties (an import rather than the refresh it runs in),
+    or -1 when no event overlaps it. Only events of the given kinds (all but timestamp gaps by default) count.
+    Intervals are sorted once and each event finds the run of intervals its range covers by binary search,
+    so the join costs O((n + m) log m) plus the number of overlapping pairs. Returns (positions, overlaps in ns).
+    """
+    starts, ends = np.asarray(starts), np.asarray(ends)
+    if not np.issubdtype(starts.dtype, np.integer):
+        starts, ends = _as_nanoseconds(list(starts)), _as_nanoseconds(list(ends))
+    positions = np.full(len(starts), -1, dtype='int64')
+    overlaps = np.zeros(len(starts), dtype='int64')
+    if kinds is None:
+        kinds = [kind for kind in TIMELINE_EVENT_KINDS if kind != 'Timestamp Gap']
+    events = np.flatnonzero(np.isin(timeline['kind'], [TIMELINE_EVENT_KINDS.index(kind) for kind in kinds]))
+    if not len(starts) or not len(events):
+        return positions, overlaps
+
+    order = np.argsort(starts, kind='stable')
+    sorted_starts, sorted_ends = starts[order], ends[order]
+    event_starts, event_ends = timeline['start'][events], timeline['end'][events]
+    # Intervals don't overlap, so their ends are sorted too: an event meets a contiguous run of them
+    first = np.searchsorted(sorted_ends, event_starts, side='left')
+    last = np.searchsorted(sorted_starts, event_ends, side='right')
+    counts = np.maximum(last - first, 0)
+    pair_event = np.repeat(np.arange(len(events)), counts)
+    pair_interval = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+    pair_overlap = (np.minimum(event_ends[pair_event], sorted_ends[pair_interval])
+                    - np.maximum(event_starts[pair_event], sorted_starts[pair_interval]))
+
+    # Best pair of each interval, with grouped reductions instead of sorting the pairs:
+    # the largest overlap, then the shortest event, then the latest starting one
+    best_overlap = np.zeros(len(starts), dtype='int64')
+    np.maximum.at(best_overlap, pair_interval, pair_overlap)
+    best = (pair_overlap > 0) & (pair_overlap == best_overlap[pair_interval])
+    pair_event, pair_interval, pair_overlap = pair_event[best], pair_interval[best], pair_overlap[best]
+    pair_duration = event_ends[pair_event] - event_starts[pair_event]
+    shortest = np.full(len(starts), np.iinfo(np.int64).max, dtype='int64')
+    np.minimum.at(shortest, pair_interval, pair_duration)
+    best = pair_duration == shortest[pair_interval]
+    # Pairs are in event order, so of equal pairs the last one assigned wins
+    positions[order[pair_interval[best]]] = events[pair_event[best]]
+    overlaps[order[pair_interval[best]]] = pair_overlap[best]
+    return positions, overlaps
+
+
+def timeline_running_at(timeline, moment):
+    """Positions of the events running at a moment (a datetime or nanoseconds)."""
+    return timeline_overlapping(timeline, moment, moment)
+
+
+def timeline_span(timeline):
+    """(start of the first event, end of the last) as Timestamps, or None for an empty timeline."""
+    if not len(timeline['start']):
+        return None
+    return pd.Timestamp(int(timeline['start'][0])), pd.Timestamp(int(timeline['max_end'].max()))
+
+
+def timeline_events_frame(timeline, positions=None):
+    """The events at positions (all of them by default) as a DataFrame, one row per event."""
+    if positions is None:
+        positions = np.arange(len(timeline['start']))
+    start = pd.to_datetime(timeline['start'][positions])
+    end = pd.to_datetime(timeline['end'][positions])
+    return pd.DataFrame({
+        'kind': np.asarray(TIMELINE_EVENT_KINDS, dtype=object)[timeline['kind'][positions]] if len(positions) else [],
+        'label': timeline['label'][positions],
+        'start': start,
+        'end': end,
+        'duration_seconds': (timeline['end'][positions] - timeline['start'][positions]) / 1e9,
+        'entity': timeline['entity'][positions],
+        'line': timeline['line'][positions]
+    })
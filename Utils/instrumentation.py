@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+
+# Counters of the parser currently running on this thread (None when not instrumented)
+_active = threading.local()
+
+PARSER_STAT_COLUMNS = [
+    ('parser', 'Parser'),
+    ('wall_seconds', 'Wall Time (s)'),
+    ('bytes_read', 'Bytes Read'),
+    ('decode_seconds', 'Decode Time (s)'),
+    ('lines_scanned', 'Lines Scanned'),
+    ('regex_evaluations', 'Regex Evaluations'),
+    ('matches', 'Matches'),
+    ('rows_emitted', 'Rows Emitted'),
+    ('peak_memory_mb', 'Peak Memory (MB)'),
+]
+
+
+def new_parser_stats(name):
+    """Create an empty set of instrumentation counters for a parser."""
+    return {
+        'parser': name,
+        'wall_seconds': 0.0,
+        'bytes_read': 0,
+        'decode_seconds': 0.0,
+        'lines_scanned': 0,
+        'regex_evaluations': 0,
+        'matches': 0,
+        'rows_emitted': 0,
+        'peak_memory_mb': None,
+        'cache_hit': False,
+        'truncated': False,
+        'covered_bytes': None
+    }
+
+
+def current_parser_stats():
+    """Return the counters of the parser running on this thread, if any."""
+    return getattr(_active, 'stats', None)
+
+
+def record_parser_stats(**counts):
+    """Add to the counters of the active parser. Does nothing when no parser is instrumented."""
+    stats = getattr(_active, 'stats', None)
+    if stats is None:
+        return
+    for key, value in counts.items():
+        stats[key] = stats.get(key, 0) + value
+    # Report read progress to whoever is watching this parser; the listener may raise to stop it
+    if 'bytes_read' in counts and getattr(_active, 'on_read', None) is not None:
+        _active.on_read(stats['bytes_read'])
+
+
+def parser_reading_limited():
+    """True when the active parser has a read budget, so readers must check parser_should_stop_reading."""
+    return getattr(_active, 'stop_reading', None) is not None
+
+
+def parser_should_stop_reading():
+    """True once the active parser has used up its time or memory budget (see instrument_parser)."""
+    stop_reading = getattr(_active, 'stop_reading', None)
+    return stop_reading is not None and stop_reading()
+
+
+def mark_parser_truncated(covered_bytes):
+    """Record that the active parser stopped early and only covered the first covered_bytes of the log."""
+    stats = getattr(_active, 'stats', None)
+    if stats is not None:
+        stats['truncated'] = True
+        stats['covered_bytes'] = covered_bytes
+
+
+def current_rss_mb():
+    """Resident memory of this process in MB, or None where it can't be read (no /proc and no psutil)."""
+    try:
+        with open('/proc/self/statm') as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+@contextmanager
+def instrument_parser(name, trace_memory=False, on_read=None, stop_reading=None):
+    """
+    Collect instrumentation counters for everything run inside the block.
+    on_read(bytes_read) is called with the running total each time the parser reads a chunk of the log.
+    stop_reading() is checked before each chunk while the log has more to read; once it returns True the log readers stop at the last
+    complete line, so the parser returns results for the part of the log it has read.
+    """
+    stats = new_parser_stats(name)
+    previous = getattr(_active, 'stats', None)
+    previous_on_read = getattr(_active, 'on_read', None)
+    previous_stop_reading = getattr(_active, 'stop_reading', None)
+    _active.stats = stats
+    _active.on_read = on_read
+    _active.stop_reading = stop_reading
+
+    started_tracing = False
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+
+    start_time = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats['wall_seconds'] = time.perf_counter() - start_time
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            stats['peak_memory_mb'] = peak / (1024 * 1024)
+            if started_tracing:
+                tracemalloc.stop()
+        # A cached parser returns without reading the log at all
+        stats['cache_hit'] = stats['bytes_read'] == 0 and stats['lines_scanned'] == 0 and not stats['truncated']
+        _active.stats = previous
+        _active.on_read = previous_on_read
+        _active.stop_reading = previous_stop_reading
+
+
+def run_instrumented(name, parser, *args, trace_memory=False, on_read=None, stop_reading=None, **kwargs):
+    """Run a parser inside instrument_parser and return (result, stats)."""
+    with instrument_parser(name, trace_memory=trace_memory, on_read=on_read, stop_reading=stop_reading) as stats:
+        result = parser(*args, **kwargs)
+    if not stats['rows_emitted']:
+        try:
+            stats['rows_emitted'] = len(result[0] if isinstance(result, tuple) else result)
+        except TypeError:
+            pass
+    return result, stats
+
+
+def format_parser_stats_report(parser_stats):
+    """Format parser instrumentation counters as a plain text table for CLI output."""
+    if not parser_stats:
+        return "No parser instrumentation data available."
+
+    header = f"{'Parser':<40} {'Time (s)':>9} {'MB Read':>9} {'Decode (s)':>10} {'Lines':>10} " \
+             f"{'Regex Evals':>12} {'Matches':>9} {'Rows':>8} {'Peak MB':>8}"
+    lines = [header, "-" * len(header)]
+    for stats in parser_stats:
+        peak = f"{stats['peak_memory_mb']:.1f}" if stats.get('peak_memory_mb') is not None else "-"
+        name = stats['parser'] + (" (cached)" if stats.get('cache_hit') else "") + (" (partial)" if stats.get('truncated') else "")
+        lines.append(
+            f"{name:<40} {stats['wall_seconds']:>9.3f} {stats['bytes_read'] / (1024 * 1024):>9.1f} "
+            f"{stats['decode_seconds']:>10.3f} {stats['lines_scanned']:>10} {stats['regex_evaluations']:>12} "
+            f"{stats['matches']:>9} {stats['rows_emitted']:>8} {peak:>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,131 @@
+import re
+
+from .data_helpers import iter_log_lines
+
+# Text read from the start of the log to find the session header (version, OS, command line)
+LOG_HEADER_PROBE_SIZE = 256 * 1024
+
+# How far to keep looking for the Unity version when it isn't in the header
+LOG_HEADER_FALLBACK_SIZE = 8 * 1024 * 1024
+
+# Small chunks, so probing a large log only reads what it needs
+LOG_HEADER_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of lines read as command line arguments
+MAX_COMMAND_LINE_LINES = 100
+
+VERSION_PATTERN = re.compile(r"Version is ['\"]([^'\"]+)['\"]")
+BRANCH_PATTERN = re.compile(r"Built from ['\"]([^'\"]+)['\"] branch")
+BROAD_VERSION_PATTERN = re.compile(r"\d{4}\.\d+\.\d+[fb]\d+")
+PLATFORM_PATTERN = re.compile(r"OS: ['\"]([^'\"]+)['\"]")
+TIMESTAMP_PREFIX_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\|[^|]*\|')
+
+
+def _strip_timestamp(line):
+    match = TIMESTAMP_PREFIX_PATTERN.match(line)
+    return (line[match.end():], True) if match else (line, False)
+
+
+def parse_command_line_flags(arguments):
+    """Map each -flag of a command line (lower case, without the dash) to the value after it, or True."""
+    flags = {}
+    for index, argument in enumerate(arguments):
+        if not argument.startswith('-'):
+            continue
+        following = arguments[index + 1] if index + 1 < len(arguments) else None
+        flags[argument.lstrip('-').lower()] = following if following is not None and not following.startswith('-') else True
+    return flags
+
+
+def probe_log_header(log_file, probe_size=LOG_HEADER_PROBE_SIZE, fallback_size=LOG_HEADER_FALLBACK_SIZE):
+    """
+    Read the session header at the start of a log: Unity version and branch, OS, command line and whether
+    lines carry timestamps. Only the first probe_size characters are examined; if the version isn't there,
+    reading continues up to fallback_size characters and stops as soon as it is found.
+    Works with file paths and file-like objects, compressed or not.
+    """
+    header = {
+        'unity_version': None,
+        'branch': None,
+        'platform': None,
+        'command_line': [],
+        'flags': {},
+        'batch_mode': False,
+        'has_timestamps': None
+    }
+    broad_version = None
+    command_line = None  # list while reading the arguments
+
+    consumed = 0
+    timestamped_lines = 0
+    header_lines = 0
+    for line in iter_log_lines(log_file, chunk_size=LOG_HEADER_CHUNK_SIZE):
+        # Stop early once everything the header provides has been read
+        if header['unity_version'] and header['platform'] and header['command_line'] and command_line is None:
+            break
+        consumed += len(line) + 1
+        in_header = consumed <= probe_size
+        if not in_header and (header['unity_version'] or consumed > fallback_size):
+            break
+
+        text, timestamped = _strip_timestamp(line)
+
+        if in_header and text.strip():
+            header_lines += 1
+            timestamped_lines += timestamped
+
+            # Arguments follow "COMMAND LINE ARGUMENTS:" one per line, until the next logged message
+            if command_line is not None:
+                if timestamped or len(command_line) >= MAX_COMMAND_LINE_LINES or ': ' in text:
+                    command_line = None
+                else:
+                    command_line.append(text.strip())
+                    continue
+            if text.startswith('COMMAND LINE ARGUMENTS:') or text.startswith('Command Line:'):
+                command_line = header['command_line']
+                # Older Editors print the whole command line after the colon
+                inline = text.split(':', 1)[1].strip()
+                if inline:
+                    command_line.extend(inline.split())
+                continue
+
+            if header['platform'] is None and text.startswith('OS: '):
+                platform_match = PLATFORM_PATTERN.match(text)
+                if platform_match:
+                    header['platform'] = platform_match.group(1)
+                    continue
+
+        if header['unity_version'] is None and "Built from" in text and "Version is" in text:
+            version_match = VERSION_PATTERN.search(text)
+            if version_match:
+                header['unity_version'] = version_match.group(1)
+                branch_match = BRANCH_PATTERN.search(text)
+                header['branch'] = branch_match.group(1) if branch_match else None
+                continue
+
+        if broad_version is None:
+            broad_match = BROAD_VERSION_PATTERN.search(line)
+            if broad_match:
+                broad_version = broad_match.group(0)
+
+    # Fall back to the first version-like string if there is no version banner
+    if header['unity_version'] is None:
+        header['unity_version'] = broad_version
+
+    if header_lines:
+        header['has_timestamps'] = timestamped_lines > 0
+    header['flags'] = parse_command_line_flags(header['command_line'])
+    header['batch_mode'] = 'batchmode' in header['flags']
+    return header
+
+
+def extract_unity_version(log_file_path):
+    """
+    Extract Unity version info from the log file.
+    Works with both file paths and file-like objects (BytesIO/StringIO), compressed or not.
+    """
+    try:
+        return probe_log_header(log_file_path)['unity_version']
+    except Exception as e:
+        print(f"Error extracting Unity version: {e}")
+    return None
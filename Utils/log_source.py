@@ -0,0 +1,149 @@
+import bz2
+import gzip
+import lzma
+import os
+import zipfile
+
+# zstd support is optional: use the zstandard package if it is installed,
+# or the standard library module on Python 3.14+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from compression import zstd as stdlib_zstd
+except ImportError:
+    stdlib_zstd = None
+
+# File extensions accepted for compressed logs (used by the uploader and the CLI)
+COMPRESSED_LOG_EXTENSIONS = ['gz', 'xz', 'zst', 'zip', 'bz2']
+LOG_FILE_EXTENSIONS = ['txt', 'log'] + COMPRESSED_LOG_EXTENSIONS
+
+# Magic numbers at the start of each supported compressed format
+GZIP_MAGIC = b'\x1f\x8b'
+XZ_MAGIC = b'\xfd7zXZ\x00'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZIP_MAGIC = b'PK\x03\x04'
+BZIP2_MAGIC = b'BZh'
+
+
+def detect_log_compression(header):
+    """Return the compression format for the first bytes of a log, or None for plain text."""
+    if header.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if header.startswith(XZ_MAGIC):
+        return 'xz'
+    if header.startswith(ZSTD_MAGIC):
+        return 'zstd'
+    if header.startswith(ZIP_MAGIC):
+        return 'zip'
+    if header.startswith(BZIP2_MAGIC):
+        return 'bzip2'
+    return None
+
+
+def zstd_available():
+    return zstandard is not None or stdlib_zstd is not None
+
+
+def select_zip_member(archive):
+    """Pick the log file inside a zip archive: the first .log/.txt member, otherwise the largest file."""
+    members = [info for info in archive.infolist() if not info.is_dir()]
+    if not members:
+        raise ValueError("The zip archive does not contain any files.")
+    for info in members:
+        if os.path.splitext(info.filename)[1].lower() in ('.log', '.txt'):
+            return info
+    return max(members, key=lambda info: info.file_size)
+
+
+def open_log_stream(log_file):
+    """
+    Open a log as a binary stream, transparently decompressing gzip, xz, zstd, bzip2 and zip inputs.
+    Accepts a file path or a file-like object (BytesIO). Returns (stream, close) where close()
+    releases anything opened here; the caller's own file object is never closed.
+    """
+    if isinstance(log_file, str):
+        raw = open(log_file, 'rb')
+        owns_raw = True
+    else:
+        raw = log_file
+        raw.seek(0)
+        owns_raw = False
+
+    header = raw.read(8)
+    raw.seek(0)
+    # StringIO and other text streams can't be compressed
+    compression = detect_log_compression(header) if isinstance(header, bytes) else None
+
+    opened = []
+    try:
+        if compression is None:
+            stream = raw
+        elif compression == 'gzip':
+            stream = gzip.GzipFile(fileobj=raw, mode='rb')
+        elif compression == 'xz':
+            stream = lzma.LZMAFile(raw, mode='rb')
+        elif compression == 'bzip2':
+            stream = bz2.BZ2File(raw, mode='rb')
+        elif compression == 'zstd':
+            if zstandard is not None:
+                stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=False)
+            elif stdlib_zstd is not None:
+                stream = stdlib_zstd.ZstdFile(raw, mode='rb')
+            else:
+                raise ValueError("This log is zstd-compressed. Install the 'zstandard' package to read it.")
+        else:
+            archive = zipfile.ZipFile(raw)
+            opened.append(archive)
+            stream = archive.open(select_zip_member(archive))
+        if stream is not raw:
+            opened.append(stream)
+    except Exception:
+        if owns_raw:
+            raw.close()
+        raise
+
+    def close():
+        for item in reversed(opened):
+            item.close()
+        if owns_raw:
+            raw.close()
+
+    return stream, close
+
+
+def is_compressed_log(log_file):
+    """Check whether a log path or file-like object holds compressed data."""
+    if isinstance(log_file, str):
+        with open(log_file, 'rb') as file:
+            header = file.read(8)
+    else:
+        log_file.seek(0)
+        header = log_file.read(8)
+        log_file.seek(0)
+    return isinstance(header, bytes) and detect_log_compression(header) is not None
+
+
+def uncompressed_log_size(log_file):
+    """
+    Size of a plain text log (path or file-like object) as counted by the parsers' bytes_read, or None
+    for compressed logs, whose decompressed size is only known once they have been read.
+    """
+    if is_compressed_log(log_file):
+        return None
+    if isinstance(log_file, str):
+        return os.path.getsize(log_file)
+    log_file.seek(0, os.SEEK_END)
+    size = log_file.tell()
+    log_file.seek(0)
+    return size
+
+
+def strip_log_extension(filename):
+    """Remove the log and compression extensions from a file name (Editor.log.gz -> Editor)."""
+    base_name, ext = os.path.splitext(filename)
+    if ext.lstrip('.').lower() in COMPRESSED_LOG_EXTENSIONS:
+        base_name, ext = os.path.splitext(base_name)
+    return base_name
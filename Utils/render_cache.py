@@ -0,0 +1,172 @@
+import functools
+import hashlib
+import pickle
+import sys
+
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.io as pio
+import streamlit as st
+
+from plotly.basedatatypes import BaseFigure
+
+# Memory budget of the memoized views of one session; least recently used views are evicted first
+RENDER_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Maximum number of parsed results whose digest is remembered per session
+RENDER_CACHE_MAX_ENTRIES = 256
+
+# st.fragment (Streamlit 1.37+) lets a widget rerun only the view it belongs to;
+# older versions fall back to rerunning the whole script
+render_fragment = getattr(st, 'fragment', None) or (lambda func: func)
+
+# Widget values and other small arguments are used as cache keys directly
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _session_store(name):
+    if name not in st.session_state:
+        st.session_state[name] = {}
+    return st.session_state[name]
+
+
+def compute_digest(data):
+    """Compute a content digest for parsed data (DataFrames, lists and dicts of entries)."""
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.DataFrame):
+        hasher.update(repr(list(data.columns)).encode())
+        try:
+            hasher.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+            return hasher.hexdigest()
+        except TypeError:
+            # Columns holding lists or dicts can't be hashed by pandas
+            pass
+    try:
+        hasher.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        hasher.update(repr(data).encode())
+    return hasher.hexdigest()
+
+
+def data_digest(data):
+    """
+    Return the digest of a parsed result, computing it only once per object.
+    Parsed results live in session state for the whole session, so they are hashed by identity first.
+    """
+    if isinstance(data, _SCALAR_TYPES):
+        return data
+    if isinstance(data, tuple) and all(isinstance(item, _SCALAR_TYPES) for item in data):
+        return data
+
+    digests = _session_store('data_digests')
+    entry = digests.get(id(data))
+    # Keep a reference to the object so its id can't be reused while the digest is stored
+    if entry is None or entry[0] is not data:
+        if len(digests) >= RENDER_CACHE_MAX_ENTRIES:
+            digests.clear()
+        entry = (data, compute_digest(data))
+        digests[id(data)] = entry
+    return entry[1]
+
+
+class _SerializedFigure:
+    """A Plotly figure stored as JSON, so cached figures are immutable and their size is known."""
+    __slots__ = ('json',)
+
+    def __init__(self, figure):
+        self.json = pio.to_json(figure, validate=False)
+
+
+def _freeze(value):
+    """Serialize every figure inside a builder result (figures, dicts, lists and tuples of them)."""
+    if isinstance(value, BaseFigure):
+        return _SerializedFigure(value)
+    if isinstance(value, dict):
+        return {key: _freeze(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Rebuild the figures of a frozen builder result; every call returns fresh figure objects."""
+    if isinstance(value, _SerializedFigure):
+        return pio.from_json(value.json)
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_thaw(item) for item in value)
+    return value
+
+
+def _estimate_size(value):
+    """Approximate the memory held by a frozen builder result in bytes."""
+    if isinstance(value, _SerializedFigure):
+        return len(value.json)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        size = value.memory_usage(index=True, deep=True)
+        return int(size.sum()) if isinstance(size, pd.Series) else int(size)
+    if isinstance(value, dict):
+        return sum(_estimate_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _render_cache():
+    if 'render_cache' not in st.session_state:
+        st.session_state.render_cache = OrderedDict()
+        st.session_state.render_cache_stats = {'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+    return st.session_state.render_cache, st.session_state.render_cache_stats
+
+
+def memoize_view(func):
+    """
+    Memoize a figure or data-prep builder for the session, keyed by the builder (chart id),
+    the digest of its data arguments and the value of its widget-state arguments.
+    Figures are stored as JSON and rebuilt on every hit, so callers may modify them;
+    frames are shared across reruns and must not be modified.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (
+            func.__module__,
+            func.__qualname__,
+            tuple(data_digest(arg) for arg in args),
+            tuple((name, data_digest(value)) for name, value in sorted(kwargs.items()))
+        )
+        cache, stats = _render_cache()
+        if key in cache:
+            cache.move_to_end(key)
+            stats['hits'] += 1
+            return _thaw(cache[key][0])
+
+        stats['misses'] += 1
+        result = func(*args, **kwargs)
+        frozen = _freeze(result)
+        size = _estimate_size(frozen)
+        if size <= RENDER_CACHE_MAX_BYTES:
+            cache[key] = (frozen, size)
+            stats['bytes'] += size
+            # Evict the least recently used views until the session is back under budget
+            while stats['bytes'] > RENDER_CACHE_MAX_BYTES:
+                _, (_, evicted_size) = cache.popitem(last=False)
+                stats['bytes'] -= evicted_size
+                stats['evictions'] += 1
+        return _thaw(frozen)
+
+    return wrapper
+
+
+def render_cache_stats():
+    """Return the entry count, size and hit/miss counters of this session's view cache."""
+    cache, stats = _render_cache()
+    return dict(stats, entries=len(cache))
+
+
+def clear_render_cache():
+    """Forget every memoized view and data digest of this session."""
+    for name in ('render_cache', 'render_cache_stats', 'data_digests'):
+        if name in st.session_state:
+            del st.session_state[name]
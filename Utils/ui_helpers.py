@@ -1,5 +1,14 @@
+import math
+
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+from .render_cache import memoize_view
+
+# Rows sent to the browser per page of a paginated table
+TABLE_PAGE_SIZE = 100
+
 def show_big_spinner(message="Processing..."):
     """Display a large, centered spinner with custom message that can be updated."""
     # Create a container for the spinner
@@ -62,111 +71,83 @@ def show_big_spinner(message="Processing..."):
     # Return the updater function and the container
     return update_spinner, spinner_container
 
-def show_progress_checklist(parsing_options):
-    """Display a spinner with a checklist of processing steps."""
-    # Create a container for the spinner and checklist
-    progress_container = st.empty()
+def _text_columns(df):
+    return [column for column in df.columns
+            if pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column])]
+
+@memoize_view
+def table_row_order(df, search, sort_column, ascending):
+    """
+    Return the positions of the rows matching search (case-insensitive, text columns only),
+    ordered by sort_column. Computed once per table state, so paging only slices this index.
+    """
+    positions = np.arange(len(df))
+    if search:
+        mask = np.zeros(len(df), dtype=bool)
+        for column in _text_columns(df):
+            mask |= df[column].astype(str).str.contains(search, case=False, regex=False, na=False).to_numpy()
+        positions = positions[mask]
     
-    # Create a list of all processing steps based on enabled options
-    steps = []
-    if parsing_options['shader']:
-        steps.append({"name": "Shader Compilation Data", "status": "⏳", "complete": False})
-    if parsing_options['imports']:
-        steps.append({"name": "Asset Import Data", "status": "⏳", "complete": False})
-    if parsing_options['loading']:
-        steps.append({"name": "Project Loading Times", "status": "⏳", "complete": False})
-    if parsing_options['build_report']:
-        steps.append({"name": "Build Report Data", "status": "⏳", "complete": False})
-    if parsing_options['pipeline']:
-        steps.append({"name": "Asset Pipeline Refresh Data", "status": "⏳", "complete": False})
-    if parsing_options['player_build']:
-        steps.append({"name": "Player Build Information", "status": "⏳", "complete": False})
-    if parsing_options['il2cpp']:
-        steps.append({"name": "IL2CPP Processing Data", "status": "⏳", "complete": False})
-    if parsing_options['tundra']:
-        steps.append({"name": "Tundra Build Information", "status": "⏳", "complete": False})
-    if parsing_options['domain_reload']:
-        steps.append({"name": "Domain Reload Data", "status": "⏳", "complete": False})
+    if sort_column is not None and len(positions):
+        values = df[sort_column].iloc[positions].reset_index(drop=True)
+        try:
+            order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index
+        except TypeError:
+            # Mixed types in one column: fall back to sorting by the text form
+            order = values.astype(str).sort_values(ascending=ascending, kind='stable').index
+        positions = positions[order.to_numpy()]
+    return positions
+
+def paginated_table(df, key, sort_column=None, ascending=False, formats=None, page_size=TABLE_PAGE_SIZE):
+    """
+    Display a frame one page at a time with search and sorting done on the server,
+    so only the visible rows are sent to the browser. Small frames are shown as a regular table.
+    Pass a frame that stays the same across reruns (e.g. from a memoized view) so its index is reused.
+    """
+    def styled(frame):
+        return frame.style.format(formats, na_rep='-') if formats else frame
     
-    # Function to update the checklist display
-    def update_progress(current_step=None, message="Processing..."):
-        # Mark the current step as complete if specified
-        if current_step is not None:
-            for step in steps:
-                if step["name"] == current_step and not step["complete"]:
-                    step["status"] = "✅"
-                    step["complete"] = True
-                    break
-        
-        # Create HTML for the spinner and checklist
-        checklist_html = ""
-        for step in steps:
-            checklist_html += f"<div style='margin-bottom: 5px;'>{step['status']} {step['name']}</div>"
-        
-        progress_html = f"""
-        <style>
-        .progress-container {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            background-color: rgba(255, 255, 255, 0.9);
-            z-index: 1000;
-        }}
-        .progress-header {{
-            font-size: 24px;
-            font-weight: bold;
-            margin-bottom: 10px;
-            color: #0066cc;
-        }}
-        .progress-message {{
-            font-size: 16px;
-            margin-bottom: 20px;
-            color: #666;
-        }}
-        .progress-spinner {{
-            border: 12px solid #f3f3f3;
-            border-top: 12px solid #0066cc;
-            border-radius: 50%;
-            width: 80px;
-            height: 80px;
-            animation: spin 1s linear infinite;
-            margin-bottom: 20px;
-        }}
-        .progress-checklist {{
-            background-color: white;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            padding: 15px;
-            width: 300px;
-            max-height: 300px;
-            overflow-y: auto;
-            font-size: 14px;
-            text-align: left;
-            margin-bottom: 20px;
-        }}
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-        </style>
-        <div class="progress-container">
-            <div class="progress-header">Parsing Unity Log File</div>
-            <div class="progress-message">{message}</div>
-            <div class="progress-spinner"></div>
-            <div class="progress-checklist">
-                {checklist_html}
-            </div>
-        </div>
-        """
-        progress_container.markdown(progress_html, unsafe_allow_html=True)
+    if len(df) <= page_size:
+        st.dataframe(styled(df))
+        return
     
-    # Initial display
-    update_progress(message="Initializing...")
+    columns = list(df.columns)
+    page_key = f"{key}_page"
+    
+    def reset_page():
+        st.session_state[page_key] = 1
+    
+    col1, col2, col3 = st.columns([3, 2, 1])
+    with col1:
+        search = st.text_input("Search", key=f"{key}_search", placeholder="Show rows containing...", on_change=reset_page)
+    with col2:
+        sort_column = st.selectbox(
+            "Sort by",
+            [None] + columns,
+            index=columns.index(sort_column) + 1 if sort_column in columns else 0,
+            format_func=lambda column: "Log order" if column is None else str(column),
+            key=f"{key}_sort",
+            on_change=reset_page
+        )
+    with col3:
+        ascending = st.checkbox("Ascending", value=ascending, key=f"{key}_ascending", on_change=reset_page)
+    
+    positions = table_row_order(df, search.strip(), sort_column, ascending)
+    if not len(positions):
+        st.info("No rows match the search.")
+        return
+    
+    page_count = math.ceil(len(positions) / page_size)
+    # The filtered rows can shrink while a later page is selected
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = page_count
+    page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key=page_key)
+    
+    start = (page - 1) * page_size
+    page_df = df.iloc[positions[start:start + page_size]]
+    st.dataframe(styled(page_df))
     
-    return update_progress, progress_container
+    caption = f"Rows {start + 1:,}-{start + len(page_df):,} of {len(positions):,}"
+    if len(positions) < len(df):
+        caption += f" (filtered from {len(df):,})"
+    st.caption(caption)
@@ -3,8 +3,9 @@ from .build_visualizer import visualize_player_build_info, visualize_build_repor
 from .domainreload_visualizer import visualize_domain_reload_details, visualize_domain_reloads
 from .il2cpp_visualizer import visualize_il2cpp_data
 from .loading_visualizer import visualize_loading_times
-from .log_data_visualizer import visualize_log_data
+from .log_data_visualizer import reset_parsed_data, reset_time_window, select_time_window, visualize_log_data
 from .performance_visualizer import visualize_performance_report
 from .pipelinerefresh_visualizer import visualize_pipeline_refreshes, visualize_refresh_details
 from .shader_visualizer import display_shader_issues, visualize_shader_data
+from .timeline_visualizer import visualize_event_timeline
 from .timestampgap_visualizer import visualize_timestamp_gaps
@@ -4,34 +4,31 @@ import pandas as pd
 
 from Utils import *
 
-def visualize_asset_imports(import_df, worker_stats_df=None):
-    st.header("Unity Asset Import Analytics")
-    
-    if import_df.empty:
-        st.warning("No asset import data found in the log.")
-        return
-    
+@memoize_view
+def prepare_asset_import_view(import_df):
+    """Sort the imports and build the summary figures of the asset import view."""
     # Sort by import time descending
     sorted_df = import_df.sort_values('import_time_seconds', ascending=False)
     
-    # Summary metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Assets Imported", len(import_df))
-    with col2:
-        if 'timestamp' in sorted_df.columns and sorted_df['timestamp'].notna().any():
-            # Calculate total time using timestamps
-            min_time = sorted_df['timestamp'].min()
-            max_time = sorted_df['timestamp'].max()
-            total_time = (max_time - min_time).total_seconds()
-            st.metric("Total Processing Time", f"{total_time:.2f}s")
-        else:
-            st.metric("Total Import Time", f"{sorted_df['import_time_seconds'].sum():.2f}s")
-    with col3:
-        st.metric("Average Import Time", f"{sorted_df['import_time_seconds'].mean():.4f}s")
+    # Columns of the raw data table
+    raw_columns = [column for column in ['asset_name', 'asset_path', 'file_extension', 'importer_type',
+                                         'import_time_seconds', 'worker_id', 'timestamp_str'] if column in sorted_df.columns]
+    
+    view = {
+        'sorted_df': sorted_df,
+        'raw_df': sorted_df[raw_columns],
+        'total_processing_time': None,
+        'total_import_time': sorted_df['import_time_seconds'].sum(),
+        'average_import_time': sorted_df['import_time_seconds'].mean(),
+        'extension_fig': None
+    }
+    if 'timestamp' in sorted_df.columns and sorted_df['timestamp'].notna().any():
+        # Calculate total time using timestamps
+        min_time = sorted_df['timestamp'].min()
+        max_time = sorted_df['timestamp'].max()
+        view['total_processing_time'] = (max_time - min_time).total_seconds()
     
     # Top slowest imports
-    st.subheader("Top 10 Slowest Asset Imports")
     top_n = min(20, len(sorted_df))
     top_imports = sorted_df.head(top_n)
     
@@ -45,11 +42,10 @@ def visualize_asset_imports(import_df, worker_stats_df=None):
         height=500
     )
     fig.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig, use_container_width=True)
+    view['top_imports_fig'] = fig
     
     # Import time by file extension
     if not sorted_df['file_extension'].empty:
-        st.subheader("Import Time by File Type")
         ext_df = sorted_df.groupby('file_extension').agg(
             total_time=('import_time_seconds', 'sum'),
             count=('import_time_seconds', 'count'),
@@ -70,31 +66,148 @@ def visualize_asset_imports(import_df, worker_stats_df=None):
             height=500
         )
         fig.update_traces(texttemplate='%{text}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        view['extension_fig'] = fig
     
     # Importer type distribution
-    st.subheader("Assets by Importer Type")
     importer_counts = sorted_df['importer_type'].value_counts().reset_index()
     importer_counts.columns = ['Importer Type', 'Count']
     
-    fig = px.pie(
+    view['importer_fig'] = px.pie(
         importer_counts, 
         values='Count', 
         names='Importer Type',
         height=500
     )
-    st.plotly_chart(fig, use_container_width=True)
     
-    # Distribution of import times
-    st.subheader("Distribution of Import Times")
-    fig = px.histogram(
-        sorted_df,
-        x='import_time_seconds',
+    # Distribution of import times, binned here so only the bin counts reach the browser
+    view['histogram_fig'] = histogram_figure(
+        sorted_df['import_time_seconds'],
         nbins=50,
-        labels={'import_time_seconds': 'Import Time (s)'},
+        x_label='Import Time (s)',
         height=400
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return view
+
+@memoize_view
+def prepare_worker_thread_view(import_df, worker_stats_df):
+    """Build the main thread vs worker thread comparison figures."""
+    # Calculate time spent on main thread vs worker threads
+    main_thread_imports = import_df[import_df['worker_id'].isna()]
+    worker_thread_imports = import_df[import_df['worker_id'].notna()]
+    
+    main_thread_time = main_thread_imports['import_time_seconds'].sum() if not main_thread_imports.empty else 0
+    worker_threads_time = worker_thread_imports['import_time_seconds'].sum() if not worker_thread_imports.empty else 0
+    
+    # Create comparison dataframe
+    thread_comparison = pd.DataFrame([
+        {"Thread Type": "Main Thread", "Import Time (s)": main_thread_time, "Number of Imports": len(main_thread_imports)},
+        {"Thread Type": "Worker Threads", "Import Time (s)": worker_threads_time, "Number of Imports": len(worker_thread_imports)}
+    ])
+    
+    view = {
+        'main_thread_time': main_thread_time,
+        'worker_threads_time': worker_threads_time,
+        'distribution_fig': None
+    }
+    
+    # Time comparison chart
+    fig = px.bar(
+        thread_comparison,
+        x="Thread Type",
+        y="Import Time (s)",
+        color="Thread Type",
+        text="Import Time (s)",
+        labels={"Import Time (s)": "Total Import Time (seconds)"},
+        height=400
+    )
+    fig.update_traces(texttemplate='%{text:.2f}s', textposition='outside')
+    view['time_comparison_fig'] = fig
+    
+    # Import count comparison
+    fig = px.bar(
+        thread_comparison,
+        x="Thread Type",
+        y="Number of Imports",
+        color="Thread Type",
+        text="Number of Imports",
+        labels={"Number of Imports": "Number of Assets Imported"},
+        height=400
+    )
+    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    view['count_comparison_fig'] = fig
+    
+    # Worker thread utilization
+    fig = px.bar(
+        worker_stats_df.sort_values('worker_id'),
+        x='worker_id',
+        y='total_time',
+        color='imports',
+        text='imports',
+        labels={
+            'worker_id': 'Worker Thread ID', 
+            'total_time': 'Total Processing Time (s)', 
+            'imports': 'Number of Imports'
+        },
+        height=400
+    )
+    fig.update_traces(textposition='outside')
+    view['utilization_fig'] = fig
+    
+    # Import distribution across worker threads
+    if 'worker_id' in import_df.columns and not worker_thread_imports.empty:
+        worker_import_counts = worker_thread_imports['worker_id'].value_counts().reset_index()
+        worker_import_counts.columns = ['Worker Thread', 'Number of Imports']
+        
+        view['distribution_fig'] = px.pie(
+            worker_import_counts,
+            values='Number of Imports',
+            names='Worker Thread',
+            height=400
+        )
+    return view
+
+def visualize_asset_imports(import_df, worker_stats_df=None):
+    st.header("Unity Asset Import Analytics")
+    
+    if import_df.empty:
+        st.warning("No asset import data found in the log.")
+        return
+    
+    view = prepare_asset_import_view(import_df)
+    sorted_df = view['sorted_df']
+    
+    # Summary metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Assets Imported", len(import_df))
+    with col2:
+        if view['total_processing_time'] is not None:
+            st.metric("Total Processing Time", f"{view['total_processing_time']:.2f}s")
+        else:
+            st.metric("Total Import Time", f"{view['total_import_time']:.2f}s")
+    with col3:
+        st.metric("Average Import Time", f"{view['average_import_time']:.4f}s")
+    
+    # Top slowest imports
+    st.subheader("Top 10 Slowest Asset Imports")
+    st.plotly_chart(view['top_imports_fig'], use_container_width=True)
+    
+    # Import time by file extension
+    if view['extension_fig'] is not None:
+        st.subheader("Import Time by File Type")
+        st.plotly_chart(view['extension_fig'], use_container_width=True)
+    
+    # Importer type distribution
+    st.subheader("Assets by Importer Type")
+    st.plotly_chart(view['importer_fig'], use_container_width=True)
+    
+    # Distribution of import times
+    st.subheader("Distribution of Import Times")
+    st.plotly_chart(view['histogram_fig'], use_container_width=True)
+    
+    # Raw data table, paged so large imports stay responsive
+    with st.expander("View Asset Import Raw Data"):
+        paginated_table(view['raw_df'], key="asset_import_raw_data", sort_column='import_time_seconds')
     
     # Worker thread analysis (if available)
     if hasattr(import_df, 'worker_stats'):
@@ -117,85 +230,33 @@ def visualize_asset_imports(import_df, worker_stats_df=None):
                         help="Estimated wall-clock time (Total CPU Time ÷ Number of Workers). " +
                             "This approximates the actual time spent importing assets when using multithreading.")
         
+        worker_view = prepare_worker_thread_view(import_df, worker_stats_df)
+        
         # Main Thread vs Worker Threads comparison
         st.subheader("Main Thread vs Worker Threads Time Comparison")
         
-        # Calculate time spent on main thread vs worker threads
-        main_thread_imports = import_df[import_df['worker_id'].isna()]
-        worker_thread_imports = import_df[import_df['worker_id'].notna()]
-        
-        main_thread_time = main_thread_imports['import_time_seconds'].sum() if not main_thread_imports.empty else 0
-        worker_threads_time = worker_thread_imports['import_time_seconds'].sum() if not worker_thread_imports.empty else 0
-        
-        # Create comparison dataframe
-        thread_comparison = pd.DataFrame([
-            {"Thread Type": "Main Thread", "Import Time (s)": main_thread_time, "Number of Imports": len(main_thread_imports)},
-            {"Thread Type": "Worker Threads", "Import Time (s)": worker_threads_time, "Number of Imports": len(worker_thread_imports)}
-        ])
-        
         col1, col2 = st.columns(2)
         
         with col1:
             # Time comparison chart
-            fig = px.bar(
-                thread_comparison,
-                x="Thread Type",
-                y="Import Time (s)",
-                color="Thread Type",
-                text="Import Time (s)",
-                labels={"Import Time (s)": "Total Import Time (seconds)"},
-                height=400
-            )
-            fig.update_traces(texttemplate='%{text:.2f}s', textposition='outside')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(worker_view['time_comparison_fig'], use_container_width=True)
         
         with col2:
             # Import count comparison
-            fig = px.bar(
-                thread_comparison,
-                x="Thread Type",
-                y="Number of Imports",
-                color="Thread Type",
-                text="Number of Imports",
-                labels={"Number of Imports": "Number of Assets Imported"},
-                height=400
-            )
-            fig.update_traces(texttemplate='%{text}', textposition='outside')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(worker_view['count_comparison_fig'], use_container_width=True)
         
         # Worker thread utilization
         st.subheader("Worker Thread Utilization")
-        fig = px.bar(
-            worker_stats_df.sort_values('worker_id'),
-            x='worker_id',
-            y='total_time',
-            color='imports',
-            text='imports',
-            labels={
-                'worker_id': 'Worker Thread ID', 
-                'total_time': 'Total Processing Time (s)', 
-                'imports': 'Number of Imports'
-            },
-            height=400
-        )
-        fig.update_traces(textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(worker_view['utilization_fig'], use_container_width=True)
         
         # Import distribution across worker threads
         st.subheader("Asset Imports by Worker Thread")
-        if 'worker_id' in import_df.columns and not worker_thread_imports.empty:
-            worker_import_counts = worker_thread_imports['worker_id'].value_counts().reset_index()
-            worker_import_counts.columns = ['Worker Thread', 'Number of Imports']
-            
-            fig = px.pie(
-                worker_import_counts,
-                values='Number of Imports',
-                names='Worker Thread',
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        if worker_view['distribution_fig'] is not None:
+            st.plotly_chart(worker_view['distribution_fig'], use_container_width=True)
             
             # Display efficiency calculation
+            main_thread_time = worker_view['main_thread_time']
+            worker_threads_time = worker_view['worker_threads_time']
             if main_thread_time > 0 and worker_threads_time > 0:
                 efficiency = (worker_threads_time / (main_thread_time + worker_threads_time)) * 100
                 st.info(f"**Parallelization Efficiency**: {efficiency:.1f}% of import work is parallelized through worker threads.", 
@@ -4,19 +4,12 @@ import pandas as pd
 
 from Utils import *
 
-def visualize_build_report(build_df, total_size, total_unit):
-    st.header("Unity Build Size Report")
-    
-    if build_df.empty:
-        st.warning("No build report data found in the log.")
-        return
-    
+@memoize_view
+def prepare_build_report_view(build_df):
+    """Build the size figures and the details table of the build report view."""
     # Sort by size descending
     sorted_df = build_df.sort_values('size_in_mb', ascending=False)
     
-    # Convert total size to readable format
-    total_size_readable = f"{total_size} {total_unit}"
-    
     # Calculate total user assets size
     user_assets_row = build_df[build_df['category'] == 'Total User Assets']
     if not user_assets_row.empty:
@@ -24,20 +17,12 @@ def visualize_build_report(build_df, total_size, total_unit):
     else:
         user_assets_size = "N/A"
     
-    # Summary metrics
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Complete Build Size", total_size_readable)
-    with col2:
-        st.metric("User Assets Size", user_assets_size)
-    
     # Filter out summary rows for visualization
     categories_to_exclude = ['Total User Assets', 'Complete build size']
     vis_df = sorted_df[~sorted_df['category'].isin(categories_to_exclude)]
     
     # Bar chart showing asset sizes
-    st.subheader("Asset Size by Category")
-    fig = px.bar(
+    size_fig = px.bar(
         vis_df,
         x='category',
         y='size_in_mb',
@@ -46,24 +31,20 @@ def visualize_build_report(build_df, total_size, total_unit):
         height=500,
         color='percentage'
     )
-    fig.update_traces(textposition='outside')
-    st.plotly_chart(fig, use_container_width=True)
+    size_fig.update_traces(textposition='outside')
     
     # Pie chart showing percentage breakdown
-    st.subheader("Asset Size Distribution")
-    fig = px.pie(
+    distribution_fig = px.pie(
         vis_df,
         values='percentage',
         names='category',
         height=500,
         hover_data=['size_value', 'size_unit']
     )
-    fig.update_traces(textinfo='percent+label')
-    st.plotly_chart(fig, use_container_width=True)
+    distribution_fig.update_traces(textinfo='percent+label')
     
     # Treemap visualization
-    st.subheader("Asset Size Treemap")
-    fig = px.treemap(
+    treemap_fig = px.treemap(
         vis_df,
         path=['category'],
         values='size_in_mb',
@@ -72,45 +53,141 @@ def visualize_build_report(build_df, total_size, total_unit):
         color_continuous_scale='RdBu',
         height=500
     )
-    fig.update_traces(textinfo="label+value+percent parent")
-    st.plotly_chart(fig, use_container_width=True)
+    treemap_fig.update_traces(textinfo="label+value+percent parent")
     
     # Raw data in a well-formatted table
-    with st.expander("View Build Report Details"):
-        display_df = sorted_df.copy()
-        display_df['size'] = display_df.apply(lambda row: f"{row['size_value']} {row['size_unit']}", axis=1)
-        display_df['percentage'] = display_df['percentage'].apply(lambda x: f"{x}%")
-        st.dataframe(display_df[['category', 'size', 'percentage']])
+    display_df = sorted_df.copy()
+    display_df['size'] = display_df.apply(lambda row: f"{row['size_value']} {row['size_unit']}", axis=1)
+    display_df['percentage'] = display_df['percentage'].apply(lambda x: f"{x}%")
+    
+    return {
+        'user_assets_size': user_assets_size,
+        'size_fig': size_fig,
+        'distribution_fig': distribution_fig,
+        'treemap_fig': treemap_fig,
+        'display_df': display_df[['category', 'size', 'percentage']]
+    }
 
-def visualize_player_build_info(build_info_entries):
-    st.header("Unity Player Build Performance")
+@memoize_view
+def prepare_used_assets_view(top_assets, asset_folders, folder_depth):
+    """Build the largest assets chart and the used asset sizes rolled up to folder_depth path components."""
+    top_assets_fig = None
+    if not top_assets.empty:
+        chart_df = top_assets.head(20)
+        top_assets_fig = px.bar(
+            chart_df,
+            y='path',
+            x='size_in_mb',
+            orientation='h',
+            hover_data=['size_value', 'size_unit', 'percentage'],
+            labels={'path': 'Asset', 'size_in_mb': 'Size (MB)'},
+            height=600
+        )
+        top_assets_fig.update_layout(yaxis={'categoryorder': 'total ascending'})
     
-    if not build_info_entries:
-        st.warning("No player build information found in the log.")
+    # Roll the per-folder totals up to their first folder_depth path components
+    folder_df = asset_folders.assign(
+        folder=asset_folders['folder'].str.split('/').str[:folder_depth].str.join('/')
+    ).groupby('folder', sort=False).agg(
+        size_in_mb=('size_in_mb', 'sum'),
+        asset_count=('asset_count', 'sum')
+    ).reset_index().sort_values('size_in_mb', ascending=False, ignore_index=True)
+    
+    folder_fig = px.treemap(
+        folder_df.head(CHART_CATEGORY_BUDGET),
+        path=['folder'],
+        values='size_in_mb',
+        color='size_in_mb',
+        hover_data=['asset_count'],
+        color_continuous_scale='RdBu',
+        height=500
+    )
+    return {
+        'top_assets_fig': top_assets_fig,
+        'folder_fig': folder_fig,
+        'folder_df': folder_df
+    }
+
+def visualize_used_assets(report):
+    """Used assets section of one build report."""
+    st.subheader("Used Assets")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Used Assets", f"{report['asset_count']:,}")
+    with col2:
+        st.metric("Used Assets Size", f"{report['assets_total_mb']:.1f} MB")
+    
+    folder_depth = st.slider("Folder depth", min_value=1, max_value=6, value=2, key="used_assets_folder_depth")
+    view = prepare_used_assets_view(report['top_assets'], report['asset_folders'], folder_depth)
+    
+    if view['top_assets_fig'] is not None:
+        st.subheader("Largest Used Assets")
+        st.plotly_chart(view['top_assets_fig'], use_container_width=True)
+    
+    st.subheader("Used Asset Size by Folder")
+    st.plotly_chart(view['folder_fig'], use_container_width=True)
+    
+    with st.expander("View Used Assets by Folder"):
+        paginated_table(view['folder_df'], key="used_assets_folders", sort_column='size_in_mb', formats={'size_in_mb': '{:.2f}'})
+    with st.expander(f"View {len(report['top_assets'])} Largest Used Assets"):
+        paginated_table(report['top_assets'], key="used_assets_largest", sort_column='size_in_mb', formats={'size_in_mb': '{:.3f}'})
+
+def visualize_build_report(build_df, total_size, total_unit, build_reports=None):
+    st.header("Unity Build Size Report")
+    
+    # If there are multiple build reports, show a selector
+    report = None
+    if build_reports:
+        if len(build_reports) > 1:
+            selected_index = st.selectbox(
+                "Select build report:",
+                range(len(build_reports)),
+                format_func=lambda i: f"Build Report {i+1}: {build_reports[i]['timestamp_str'] or 'no timestamp'}",
+                key="build_report_index"
+            )
+        else:
+            selected_index = 0
+        report = build_reports[selected_index]
+        build_df, total_size, total_unit = report['build_df'], report['total_build_size'], report['total_build_unit']
+    
+    if build_df.empty:
+        st.warning("No build report data found in the log.")
         return
     
-    # If there are multiple build entries, show a selector
-    if len(build_info_entries) > 1:
-        selected_index = st.selectbox(
-            "Select build entry:", 
-            range(len(build_info_entries)), 
-            format_func=lambda i: f"Build {i+1}: {build_info_entries[i]['timestamp_str']}"
-        )
-        build_info = build_info_entries[selected_index]
-    else:
-        build_info = build_info_entries[0]
+    view = prepare_build_report_view(build_df)
     
-    # Summary metrics
-    total_duration_sec = build_info['total_duration_sec']
+    # Convert total size to readable format
+    total_size_readable = f"{total_size} {total_unit}"
     
-    col1, col2, col3 = st.columns(3)
+    # Summary metrics
+    col1, col2 = st.columns(2)
     with col1:
-        st.metric("Total Build Time", format_time(total_duration_sec))
+        st.metric("Complete Build Size", total_size_readable)
     with col2:
-        st.metric("Build Phase", build_info['phase'])
-    with col3:
-        st.metric("Build Steps", len(build_info['steps']))
+        st.metric("User Assets Size", view['user_assets_size'])
+    
+    # Bar chart showing asset sizes
+    st.subheader("Asset Size by Category")
+    st.plotly_chart(view['size_fig'], use_container_width=True)
+    
+    # Pie chart showing percentage breakdown
+    st.subheader("Asset Size Distribution")
+    st.plotly_chart(view['distribution_fig'], use_container_width=True)
+    
+    # Treemap visualization
+    st.subheader("Asset Size Treemap")
+    st.plotly_chart(view['treemap_fig'], use_container_width=True)
     
+    # Raw data in a well-formatted table
+    with st.expander("View Build Report Details"):
+        paginated_table(view['display_df'], key="build_report_details")
+    
+    if report is not None and report['asset_count']:
+        visualize_used_assets(report)
+
+@memoize_view
+def prepare_player_build_view(build_info):
+    """Build the step figures of one player build entry. Returns None when it has no steps."""
     # Create dataframe from steps
     steps_data = []
     for step in build_info['steps']:
@@ -129,16 +206,13 @@ def visualize_player_build_info(build_info_entries):
     steps_df = pd.DataFrame(steps_data)
     
     if steps_df.empty:
-        st.warning("No build step data available.")
-        return
+        return None
     
     # Sort by duration (descending)
     sorted_steps_df = steps_df.sort_values('duration_ms', ascending=False)
     
     # Bar chart of build steps by duration
-    st.subheader("Build Steps by Duration")
-    
-    fig = px.bar(
+    steps_fig = px.bar(
         sorted_steps_df,
         y='description',
         x='duration_sec',
@@ -148,12 +222,8 @@ def visualize_player_build_info(build_info_entries):
         height=600,
         color='percentage'
     )
-    fig.update_traces(textposition='outside')
-    fig.update_layout(yaxis={'categoryorder':'total ascending'})
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Pie chart of build step percentages
-    st.subheader("Build Time Distribution")
+    steps_fig.update_traces(textposition='outside')
+    steps_fig.update_layout(yaxis={'categoryorder':'total ascending'})
     
     # Filter to top steps to avoid cluttering the pie chart
     top_steps = sorted_steps_df.head(10).copy()
@@ -161,24 +231,18 @@ def visualize_player_build_info(build_info_entries):
     # Calculate percentage for clarity in the pie chart
     top_steps['percentage_formatted'] = top_steps['percentage'].apply(lambda x: f"{x:.1f}%")
     
-    fig = px.pie(
+    distribution_fig = px.pie(
         top_steps,
         values='duration_ms',
         names='description',
         height=500,
         hover_data=['duration_sec', 'percentage_formatted']
     )
-    fig.update_traces(textinfo='percent+label')
-    st.plotly_chart(fig, use_container_width=True)
+    distribution_fig.update_traces(textinfo='percent+label')
     
-    # Timeline visualization
-    st.subheader("Build Timeline")
-
-    # Check if we have enough data points for a timeline
-    if len(steps_df) < 2:
-        st.info("At least two build steps are needed to create a timeline visualization.")
-    else:
-        # Create a proper timeline dataframe with start and end times
+    # Create a proper timeline dataframe with start and end times
+    timeline_fig = None
+    if len(steps_df) >= 2:
         cumulative_time = 0
         timeline_data = []
         
@@ -219,7 +283,7 @@ def visualize_player_build_info(build_info_entries):
         
         # If we still have timeline data after filtering
         if not timeline_df.empty:
-            fig = px.timeline(
+            timeline_fig = px.timeline(
                 timeline_df,
                 x_start='start_time',
                 x_end='end_time',
@@ -232,21 +296,84 @@ def visualize_player_build_info(build_info_entries):
             )
             
             # Improve the layout
-            fig.update_yaxes(autorange="reversed")
-            fig.update_layout(
+            timeline_fig.update_yaxes(autorange="reversed")
+            timeline_fig.update_layout(
                 xaxis_title="Time",
                 yaxis_title="Build Step"
             )
             
             # Format x-axis to show only the time portion
-            fig.update_xaxes(
+            timeline_fig.update_xaxes(
                 tickformat="%H:%M:%S",
                 tickangle=0
             )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Could not create timeline: no valid duration data in build steps.")
+    
+    # Raw data in a well-formatted table
+    display_df = sorted_steps_df.copy()
+    display_df['duration'] = display_df['duration_sec'].apply(lambda x: f"{x:.3f}s")
+    display_df['percentage'] = display_df['percentage'].apply(lambda x: f"{x:.2f}%")
+    
+    return {
+        'step_count': len(steps_df),
+        'steps_fig': steps_fig,
+        'distribution_fig': distribution_fig,
+        'timeline_fig': timeline_fig,
+        'display_df': display_df[['description', 'duration', 'percentage']]
+    }
+
+def visualize_player_build_info(build_info_entries):
+    st.header("Unity Player Build Performance")
+    
+    if not build_info_entries:
+        st.warning("No player build information found in the log.")
+        return
+    
+    # If there are multiple build entries, show a selector
+    if len(build_info_entries) > 1:
+        selected_index = st.selectbox(
+            "Select build entry:", 
+            range(len(build_info_entries)), 
+            format_func=lambda i: f"Build {i+1}: {build_info_entries[i]['timestamp_str']}"
+        )
+        build_info = build_info_entries[selected_index]
+    else:
+        build_info = build_info_entries[0]
+    
+    # Summary metrics
+    total_duration_sec = build_info['total_duration_sec']
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Build Time", format_time(total_duration_sec))
+    with col2:
+        st.metric("Build Phase", build_info['phase'])
+    with col3:
+        st.metric("Build Steps", len(build_info['steps']))
+    
+    view = prepare_player_build_view(build_info)
+    
+    if view is None:
+        st.warning("No build step data available.")
+        return
+    
+    # Bar chart of build steps by duration
+    st.subheader("Build Steps by Duration")
+    st.plotly_chart(view['steps_fig'], use_container_width=True)
+    
+    # Pie chart of build step percentages
+    st.subheader("Build Time Distribution")
+    st.plotly_chart(view['distribution_fig'], use_container_width=True)
+    
+    # Timeline visualization
+    st.subheader("Build Timeline")
+
+    # Check if we have enough data points for a timeline
+    if view['step_count'] < 2:
+        st.info("At least two build steps are needed to create a timeline visualization.")
+    elif view['timeline_fig'] is not None:
+        st.plotly_chart(view['timeline_fig'], use_container_width=True)
+    else:
+        st.warning("Could not create timeline: no valid duration data in build steps.")
 
     # Show Tundra build information if available
     if 'tundra_info' in build_info and build_info['tundra_info']:
@@ -258,6 +385,8 @@ def visualize_player_build_info(build_info_entries):
                 if i > 0:
                     st.markdown("---")
                     
+                if tundra.get('timestamp_str'):
+                    st.caption(f"Finished at {tundra['timestamp_str']} (line {tundra['line_number']:,})")
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Build Time", f"{tundra['build_time_seconds']:.2f}s")
@@ -274,16 +403,19 @@ def visualize_player_build_info(build_info_entries):
 
     # Raw data in a well-formatted table
     with st.expander("View Build Step Details"):
-        display_df = sorted_steps_df.copy()
-        display_df['duration'] = display_df['duration_sec'].apply(lambda x: f"{x:.3f}s")
-        display_df['percentage'] = display_df['percentage'].apply(lambda x: f"{x:.2f}%")
-        st.dataframe(display_df[['description', 'duration', 'percentage']])
+        paginated_table(view['display_df'], key="build_step_details")
 
 def enhance_build_info_with_tundra(player_build_info, tundra_info):
-    """Update player build info with Tundra build information if available."""
+    """
+    Give each player build the Tundra runs associated with it (see associate_tundra_runs).
+    Returns whether any build got a run.
+    """
     if tundra_info and player_build_info:
-        # Add Tundra info to player build info
-        for build in player_build_info:
-            build['tundra_info'] = tundra_info
-        return True
+        runs_by_build = {}
+        for tundra in tundra_info:
+            if tundra.get('player_build') is not None:
+                runs_by_build.setdefault(tundra['player_build'], []).append(tundra)
+        for index, build in enumerate(player_build_info):
+            build['tundra_info'] = runs_by_build.get(index, [])
+        return bool(runs_by_build)
     return False
@@ -5,28 +5,13 @@ import plotly.express as px
 from Utils import *
 from Parsers import *
 
-def visualize_domain_reloads(log_file_path):
-    st.header("Unity Domain Reload Analysis")
-    
-    # Parse domain reload entries
-    domain_reloads = parse_domain_reloads(log_file_path)
-    
-    if not domain_reloads:
-        st.warning("No domain reload data found in the log.")
-        return
-    
+@memoize_view
+def prepare_domain_reload_view(domain_reloads):
+    """Build the summary metrics and reload time chart of the domain reload view."""
     # Create summary metrics - ensure we handle None values
     total_time = sum((reload.get('reset_time', 0) or 0) for reload in domain_reloads)
     avg_time = total_time / len(domain_reloads) if domain_reloads else 0
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Domain Reloads", len(domain_reloads))
-    with col2:
-        st.metric("Total Reload Time", f"{total_time:.2f}s")
-    with col3:
-        st.metric("Average Reload Time", f"{avg_time:.2f}s")
-    
     # Create a basic overview of all domain reloads
     reload_data = []
     for i, reload in enumerate(domain_reloads):
@@ -39,17 +24,100 @@ def visualize_domain_reloads(log_file_path):
     
     reload_df = pd.DataFrame(reload_data)
     
-    # Bar chart of domain reload times
-    st.subheader("Domain Reload Times")
+    # Keep the slowest and fastest reload of each bucket when there are too many bars to draw
+    chart_df = downsample_frame(reload_df, 'index', 'reset_time', budget=CHART_CATEGORY_BUDGET, method='minmax')
     
     fig = px.bar(
-        reload_df,
+        chart_df,
         x='index',
         y='reset_time',
         labels={'reset_time': 'Reset Time (seconds)', 'index': 'Domain Reload #'},
         height=400
     )
-    st.plotly_chart(fig, use_container_width=True)
+    
+    return {
+        'total_time': total_time,
+        'avg_time': avg_time,
+        'reload_times_fig': fig,
+        'reloads_drawn': len(chart_df)
+    }
+
+@memoize_view
+def prepare_reload_operations_view(reload_ops):
+    """Aggregate every profiled operation by name across all reloads. Returns None without operations."""
+    if reload_ops is None or reload_ops.empty:
+        return None
+    
+    op_stats = reload_ops.groupby('name', sort=False)['time_ms'].agg(
+        total_ms='sum',
+        count='count',
+        avg_ms='mean',
+        max_ms='max'
+    ).reset_index()
+    op_stats['total_s'] = op_stats['total_ms'] / 1000
+    
+    # Share of the time of all top-level operations, which together cover the profiled reload time
+    top_level_ms = reload_ops.loc[reload_ops['depth'] == 0, 'time_ms'].sum()
+    op_stats['percentage'] = op_stats['total_ms'] / top_level_ms * 100 if top_level_ms > 0 else 0
+    op_stats = op_stats.sort_values('total_ms', ascending=False)
+    
+    top_ops = op_stats.head(15)
+    fig = px.bar(
+        top_ops,
+        y='name',
+        x='total_s',
+        orientation='h',
+        color='count',
+        hover_data=['avg_ms', 'max_ms', 'percentage'],
+        labels={'name': 'Operation', 'total_s': 'Total Time (s)', 'count': 'Occurrences',
+                'avg_ms': 'Average (ms)', 'max_ms': 'Max (ms)', 'percentage': '% of Reload Time'},
+        height=500
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    
+    return {
+        'op_stats': op_stats[['name', 'count', 'total_s', 'avg_ms', 'max_ms', 'percentage']],
+        'top_ops_fig': fig
+    }
+
+def visualize_domain_reloads(log_file_path, domain_reloads=None, reload_ops=None):
+    st.header("Unity Domain Reload Analysis")
+    
+    # Parse domain reload entries unless they have already been parsed
+    if domain_reloads is None:
+        domain_reloads, reload_ops = parse_domain_reloads_with_operations(log_file_path)
+    
+    if not domain_reloads:
+        st.warning("No domain reload data found in the log.")
+        return
+    
+    view = prepare_domain_reload_view(domain_reloads)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Domain Reloads", len(domain_reloads))
+    with col2:
+        st.metric("Total Reload Time", f"{view['total_time']:.2f}s")
+    with col3:
+        st.metric("Average Reload Time", f"{view['avg_time']:.2f}s")
+    
+    # Bar chart of domain reload times
+    st.subheader("Domain Reload Times")
+    st.plotly_chart(view['reload_times_fig'], use_container_width=True)
+    if view['reloads_drawn'] < len(domain_reloads):
+        st.caption(f"{len(domain_reloads)} reloads reduced to {view['reloads_drawn']} bars, keeping the slowest and fastest reload of each range.")
+    
+    # Operations aggregated over every reload
+    ops_view = prepare_reload_operations_view(reload_ops)
+    if ops_view is not None:
+        st.subheader("Slowest Operations Across All Reloads")
+        st.plotly_chart(ops_view['top_ops_fig'], use_container_width=True)
+        with st.expander("View Operation Totals"):
+            paginated_table(ops_view['op_stats'], key="reload_operation_totals", formats={
+                'total_s': '{:.3f}',
+                'avg_ms': '{:.1f}',
+                'percentage': '{:.1f}%'
+            })
     
     # Add option to select a specific domain reload
     st.subheader("Detailed Domain Reload Analysis")
@@ -72,24 +140,125 @@ def visualize_domain_reloads(log_file_path):
     button_key = f"analyze_domain_reload_{selected_reload_idx}"
     
     if st.button("Analyze Selected Domain Reload", key=button_key):
-        # Store the current tab index in session state
-        # Find which tab this is (Domain Reloads)
-        tab_titles = []
-        if 'player_build_info' in st.session_state.parsed_data and st.session_state.parsed_data['player_build_info']:
-            tab_titles.append("Player Build Performance")
-        if 'build_df' in st.session_state.parsed_data and not st.session_state.parsed_data['build_df'].empty:
-            tab_titles.append("Build Report")
-        if 'loading_df' in st.session_state.parsed_data and not st.session_state.parsed_data['loading_df'].empty:
-            tab_titles.append("Project Loading")
-        if 'domain_reloads' in st.session_state.parsed_data and st.session_state.parsed_data['domain_reloads']:
-            tab_titles.append("Domain Reloads")
-            # Set the active tab to Domain Reloads
-            st.session_state.active_tab = tab_titles.index("Domain Reloads")
-        
         with st.spinner("Analyzing domain reload details..."):
             # Visualize the selected domain reload
             visualize_domain_reload_details(domain_reloads[selected_reload_idx])
 
+@memoize_view
+def prepare_domain_reload_details_view(reload_entry):
+    """Flatten the operations of one domain reload and build its figures. Returns None without operations."""
+    operations = reload_entry.get('operations', [])
+    
+    # Process operations for visualization
+    # Flatten the hierarchy for a table view first
+    flat_ops = []
+    
+    def process_operation(op, depth=0):
+        name = ("  " * depth) + op['name']  # Add indentation to name
+        flat_ops.append({
+            'name': name,
+            'raw_name': op['name'],
+            'time_ms': op['time_ms'],
+            'time_s': op['time_ms'] / 1000,
+            'depth': depth
+        })
+        
+        for child in op.get('children', []):
+            process_operation(child, depth + 1)
+    
+    # Process all top-level operations
+    for op in operations:
+        process_operation(op)
+    
+    if not flat_ops:
+        return None
+    
+    # Create a DataFrame
+    op_df = pd.DataFrame(flat_ops)
+    
+    # Calculate percentage
+    total_ms = reload_entry.get('profiling_time_ms', op_df['time_ms'].sum())
+    if total_ms > 0:
+        op_df['percentage'] = op_df['time_ms'] / total_ms * 100
+    else:
+        op_df['percentage'] = 0
+    
+    view = {
+        'op_df': op_df,
+        'top_ops_fig': None,
+        'top_ops_error': None,
+        'sunburst_fig': None,
+        'sunburst_error': None
+    }
+    
+    # Sort by time for the top operations view (ignoring hierarchy)
+    top_ops = op_df.sort_values('time_ms', ascending=False).head(15).copy()
+    
+    try:
+        fig = px.bar(
+            top_ops,
+            y='raw_name',
+            x='time_s',
+            orientation='h',
+            text=top_ops['percentage'].apply(lambda x: f"{x:.1f}%"),
+            labels={'time_s': 'Time (seconds)', 'raw_name': 'Operation'},
+            height=600,
+            color='percentage',
+            color_continuous_scale='Viridis'
+        )
+        fig.update_traces(textposition='outside')
+        fig.update_layout(yaxis_tickangle=0)
+        view['top_ops_fig'] = fig
+    except Exception as e:
+        view['top_ops_error'] = str(e)
+    
+    # Create hierarchical data for sunburst
+    try:
+        # We need to prepare a different structure for the sunburst
+        sunburst_data = []
+        
+        def build_path(op, path=""):
+            current_path = path + "/" + op['name'] if path else op['name']
+            sunburst_data.append({
+                'path': current_path,
+                'time_ms': op['time_ms'],
+                'name': op['name']
+            })
+            
+            for child in op.get('children', []):
+                build_path(child, current_path)
+        
+        # Process all top-level operations
+        for op in operations:
+            build_path(op)
+        
+        if sunburst_data:
+            # Create a DataFrame for the sunburst
+            sb_df = pd.DataFrame(sunburst_data)
+            
+            # Add an ID column
+            sb_df['id'] = sb_df['path']
+            
+            # Add a parent column
+            sb_df['parent'] = sb_df['path'].apply(
+                lambda p: "/".join(p.split("/")[:-1]) if "/" in p else ""
+            )
+            
+            view['sunburst_fig'] = px.sunburst(
+                sb_df,
+                ids='id',
+                names='name',
+                parents='parent',
+                values='time_ms',
+                color='time_ms',
+                color_continuous_scale='RdBu',
+                height=700
+            )
+    except Exception as e:
+        view['sunburst_error'] = str(e)
+    
+    return view
+
 def visualize_domain_reload_details(reload_entry):
     st.header("Domain Reload Analysis")
     
@@ -127,123 +296,35 @@ def visualize_domain_reload_details(reload_entry):
         """)
         return
     
-    # Process operations for visualization
-    # Flatten the hierarchy for a table view first
-    flat_ops = []
-    
-    def process_operation(op, depth=0):
-        name = ("  " * depth) + op['name']  # Add indentation to name
-        flat_ops.append({
-            'name': name,
-            'raw_name': op['name'],
-            'time_ms': op['time_ms'],
-            'time_s': op['time_ms'] / 1000,
-            'depth': depth
-        })
-        
-        for child in op.get('children', []):
-            process_operation(child, depth + 1)
+    view = prepare_domain_reload_details_view(reload_entry)
     
-    # Process all top-level operations
-    for op in operations:
-        process_operation(op)
+    if view is None:
+        st.warning("No valid operations data found for visualization.")
+        return
     
-    # Create a DataFrame
-    if flat_ops:
-        op_df = pd.DataFrame(flat_ops)
-        
-        # Calculate percentage
-        total_ms = reload_entry.get('profiling_time_ms', op_df['time_ms'].sum())
-        if total_ms > 0:
-            op_df['percentage'] = op_df['time_ms'] / total_ms * 100
-        else:
-            op_df['percentage'] = 0
-        
-        # Sort by time for the top operations view (ignoring hierarchy)
-        top_ops = op_df.sort_values('time_ms', ascending=False).head(15).copy()
-        
-        # Bar chart of top operations
-        st.subheader("Top Operations by Time")
-        
-        try:
-            fig = px.bar(
-                top_ops,
-                y='raw_name',
-                x='time_s',
-                orientation='h',
-                text=top_ops['percentage'].apply(lambda x: f"{x:.1f}%"),
-                labels={'time_s': 'Time (seconds)', 'raw_name': 'Operation'},
-                height=600,
-                color='percentage',
-                color_continuous_scale='Viridis'
-            )
-            fig.update_traces(textposition='outside')
-            fig.update_layout(yaxis_tickangle=0)
-            st.plotly_chart(fig, use_container_width=True)
-        except Exception as e:
-            st.error(f"Error creating visualization: {str(e)}")
-            st.write("Error details:", e)
-        
-        # Show the hierarchical view
-        st.subheader("Hierarchical Operations View")
-        
-        # Display as a formatted table to preserve hierarchy
-        st.dataframe(
-            op_df[['name', 'time_ms', 'percentage']].rename(
-                columns={'name': 'Operation', 'time_ms': 'Time (ms)', 'percentage': '% of Total'}
-            ).style.format({
-                'Time (ms)': '{:.0f}',
-                '% of Total': '{:.1f}%'
-            })
-        )
-        
-        # Add sunburst chart for hierarchical visualization
-        st.subheader("Operations Hierarchy")
-        
-        # Create hierarchical data for sunburst
-        try:
-            # We need to prepare a different structure for the sunburst
-            sunburst_data = []
-            
-            def build_path(op, path=""):
-                current_path = path + "/" + op['name'] if path else op['name']
-                sunburst_data.append({
-                    'path': current_path,
-                    'time_ms': op['time_ms'],
-                    'name': op['name']
-                })
-                
-                for child in op.get('children', []):
-                    build_path(child, current_path)
-            
-            # Process all top-level operations
-            for op in operations:
-                build_path(op)
-            
-            if sunburst_data:
-                # Create a DataFrame for the sunburst
-                sb_df = pd.DataFrame(sunburst_data)
-                
-                # Add an ID column
-                sb_df['id'] = sb_df['path']
-                
-                # Add a parent column
-                sb_df['parent'] = sb_df['path'].apply(
-                    lambda p: "/".join(p.split("/")[:-1]) if "/" in p else ""
-                )
-                
-                fig = px.sunburst(
-                    sb_df,
-                    ids='id',
-                    names='name',
-                    parents='parent',
-                    values='time_ms',
-                    color='time_ms',
-                    color_continuous_scale='RdBu',
-                    height=700
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        except Exception as e:
-            st.warning(f"Could not create hierarchy visualization: {str(e)}")
+    # Bar chart of top operations
+    st.subheader("Top Operations by Time")
+    if view['top_ops_error']:
+        st.error(f"Error creating visualization: {view['top_ops_error']}")
     else:
-        st.warning("No valid operations data found for visualization.")
+        st.plotly_chart(view['top_ops_fig'], use_container_width=True)
+    
+    # Show the hierarchical view
+    st.subheader("Hierarchical Operations View")
+    
+    # Display as a formatted table to preserve hierarchy
+    st.dataframe(
+        view['op_df'][['name', 'time_ms', 'percentage']].rename(
+            columns={'name': 'Operation', 'time_ms': 'Time (ms)', 'percentage': '% of Total'}
+        ).style.format({
+            'Time (ms)': '{:.0f}',
+            '% of Total': '{:.1f}%'
+        })
+    )
+    
+    # Add sunburst chart for hierarchical visualization
+    st.subheader("Operations Hierarchy")
+    if view['sunburst_error']:
+        st.warning(f"Could not create hierarchy visualization: {view['sunburst_error']}")
+    elif view['sunburst_fig'] is not None:
+        st.plotly_chart(view['sunburst_fig'], use_container_width=True)
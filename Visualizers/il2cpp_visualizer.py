@@ -4,6 +4,92 @@ import plotly.express as px
 
 from Utils import *
 
+def index_il2cpp_assemblies(il2cpp_data):
+    """Map each assembly name to its entry; when an assembly appears more than once, the slowest entry is kept."""
+    index = {}
+    for entry in il2cpp_data:
+        known = index.get(entry['assembly'])
+        if known is None or entry['total_time_ms'] > known['total_time_ms']:
+            index[entry['assembly']] = entry
+    return index
+
+@memoize_view
+def prepare_il2cpp_view(il2cpp_data):
+    """Sort the assemblies and build the summary figure and table of the IL2CPP view."""
+    total_time_ms = sum(entry['total_time_ms'] for entry in il2cpp_data)
+    
+    # Sort assemblies by processing time
+    sorted_data = sorted(il2cpp_data, key=lambda x: x['total_time_ms'], reverse=True)
+    
+    # Create DataFrame for the assemblies
+    assembly_data = []
+    for entry in sorted_data:
+        assembly_data.append({
+            'Assembly': entry['assembly'],
+            'Total Time (ms)': entry['total_time_ms'],
+            'Self Time (ms)': entry.get('self_time_ms', entry['total_time_ms']),
+            'Steps': len(entry['steps']['process']),
+            'Overhead (ms)': entry['total_time_ms'] - sum(entry['steps']['time_ms'])
+        })
+    
+    assembly_df = pd.DataFrame(assembly_data)
+    
+    # Take top 15 assemblies for the chart
+    top_assemblies_df = assembly_df.head(15).copy()
+    top_assemblies_df['Total Time (s)'] = top_assemblies_df['Total Time (ms)'] / 1000
+    
+    fig = px.bar(
+        top_assemblies_df,
+        x='Assembly',
+        y='Total Time (s)',
+        text='Total Time (s)',
+        height=500,
+        color='Total Time (s)',
+        labels={'Total Time (s)': 'Processing Time (seconds)'}
+    )
+    fig.update_traces(texttemplate='%{text:.2f}s', textposition='outside')
+    fig.update_layout(xaxis_tickangle=-45)
+    
+    display_df = assembly_df.copy()
+    display_df['Total Time'] = display_df['Total Time (ms)'].apply(lambda x: f"{x}ms")
+    display_df['Self Time'] = display_df['Self Time (ms)'].apply(lambda x: f"{x}ms")
+    
+    return {
+        'sorted_data': sorted_data,
+        'assembly_index': index_il2cpp_assemblies(il2cpp_data),
+        'total_time_sec': total_time_ms / 1000,
+        'top_assemblies_fig': fig,
+        'display_df': display_df[['Assembly', 'Total Time', 'Self Time', 'Steps']]
+    }
+
+@memoize_view
+def prepare_il2cpp_assembly_view(selected_data):
+    """Build the processing step chart and table of one assembly. Returns None without steps."""
+    steps = selected_data['steps']
+    if not steps['process']:
+        return None
+    
+    step_df = pd.DataFrame({'Process': steps['process'], 'Time (ms)': steps['time_ms']})
+    step_df['Percentage'] = step_df['Time (ms)'] / selected_data['total_time_ms'] * 100
+    
+    # Create pie chart of processing steps
+    fig = px.pie(
+        step_df,
+        values='Time (ms)',
+        names='Process',
+        title=f"{selected_data['assembly']} Processing Steps",
+        height=400
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    
+    step_df['Percentage'] = step_df['Percentage'].apply(lambda x: f"{x:.2f}%")
+    step_df['Time'] = step_df['Time (ms)'].apply(lambda x: f"{x}ms")
+    
+    return {
+        'steps_fig': fig,
+        'step_df': step_df[['Process', 'Time', 'Percentage']]
+    }
+
 def visualize_il2cpp_data(il2cpp_data):
     
     st.header("IL2CPP Processing Analysis")
@@ -31,10 +117,11 @@ def visualize_il2cpp_data(il2cpp_data):
             """)
         return
     
-    # Calculate summary metrics
+    view = prepare_il2cpp_view(il2cpp_data)
+    sorted_data = view['sorted_data']
+    assembly_index = view['assembly_index']
     total_assemblies = len(il2cpp_data)
-    total_time_ms = sum(entry['total_time_ms'] for entry in il2cpp_data)
-    total_time_sec = total_time_ms / 1000
+    total_time_sec = view['total_time_sec']
     
     # Display summary metrics
     col1, col2, col3 = st.columns(3)
@@ -45,41 +132,9 @@ def visualize_il2cpp_data(il2cpp_data):
     with col3:
         st.metric("Average Time per Assembly", f"{total_time_sec / total_assemblies:.2f}s" if total_assemblies > 0 else "N/A")
     
-    # Sort assemblies by processing time
-    sorted_data = sorted(il2cpp_data, key=lambda x: x['total_time_ms'], reverse=True)
-    
-    # Create DataFrame for the assemblies
-    assembly_data = []
-    for entry in sorted_data:
-        assembly_data.append({
-            'Assembly': entry['assembly'],
-            'Total Time (ms)': entry['total_time_ms'],
-            'Self Time (ms)': entry.get('self_time_ms', entry['total_time_ms']),
-            'Steps': len(entry.get('steps', [])),
-            'Overhead (ms)': entry['total_time_ms'] - sum(step['time_ms'] for step in entry.get('steps', []))
-        })
-    
-    assembly_df = pd.DataFrame(assembly_data)
-    
     # Show bar chart of top assemblies by processing time
     st.subheader("Top Assemblies by IL2CPP Processing Time")
-    
-    # Take top 15 assemblies for the chart
-    top_assemblies_df = assembly_df.head(15).copy()
-    top_assemblies_df['Total Time (s)'] = top_assemblies_df['Total Time (ms)'] / 1000
-    
-    fig = px.bar(
-        top_assemblies_df,
-        x='Assembly',
-        y='Total Time (s)',
-        text='Total Time (s)',
-        height=500,
-        color='Total Time (s)',
-        labels={'Total Time (s)': 'Processing Time (seconds)'}
-    )
-    fig.update_traces(texttemplate='%{text:.2f}s', textposition='outside')
-    fig.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(view['top_assemblies_fig'], use_container_width=True)
     
     # Show detailed breakdown of an assembly if selected
     st.subheader("Assembly Processing Details")
@@ -88,43 +143,21 @@ def visualize_il2cpp_data(il2cpp_data):
     selected_assembly = st.selectbox(
         "Select an assembly to see detailed processing steps:",
         [entry['assembly'] for entry in sorted_data],
-        format_func=lambda x: f"{x} ({next(entry['total_time_ms'] for entry in sorted_data if entry['assembly'] == x):.0f}ms)"
+        format_func=lambda x: f"{x} ({assembly_index[x]['total_time_ms']:.0f}ms)"
     )
     
     # Find the selected assembly data
-    selected_data = next((entry for entry in sorted_data if entry['assembly'] == selected_assembly), None)
+    selected_data = assembly_index.get(selected_assembly)
     
     if selected_data:
-        # Calculate step data
-        steps = selected_data.get('steps', [])
+        step_view = prepare_il2cpp_assembly_view(selected_data)
         
-        if steps:
-            step_data = []
-            for step in steps:
-                step_data.append({
-                    'Process': step['process'],
-                    'Time (ms)': step['time_ms'],
-                    'Percentage': (step['time_ms'] / selected_data['total_time_ms']) * 100
-                })
-            
-            step_df = pd.DataFrame(step_data)
-            
-            # Create pie chart of processing steps
-            fig = px.pie(
-                step_df,
-                values='Time (ms)',
-                names='Process',
-                title=f"{selected_assembly} Processing Steps",
-                height=400
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+        if step_view is not None:
+            st.plotly_chart(step_view['steps_fig'], use_container_width=True)
             
             # Show step data table
             st.write("### Processing Steps")
-            step_df['Percentage'] = step_df['Percentage'].apply(lambda x: f"{x:.2f}%")
-            step_df['Time'] = step_df['Time (ms)'].apply(lambda x: f"{x}ms")
-            st.dataframe(step_df[['Process', 'Time', 'Percentage']])
+            paginated_table(step_view['step_df'], key="il2cpp_assembly_steps")
         else:
             st.info(f"No detailed processing steps available for {selected_assembly}")
         
@@ -138,7 +171,4 @@ def visualize_il2cpp_data(il2cpp_data):
     # Show all assembly data in a table
     st.subheader("All IL2CPP Processing Data")
     with st.expander("Show Raw Assembly Data"):
-        display_df = assembly_df.copy()
-        display_df['Total Time'] = display_df['Total Time (ms)'].apply(lambda x: f"{x}ms")
-        display_df['Self Time'] = display_df['Self Time (ms)'].apply(lambda x: f"{x}ms")
-        st.dataframe(display_df[['Assembly', 'Total Time', 'Self Time', 'Steps']])
+        paginated_table(view['display_df'], key="il2cpp_raw_data")
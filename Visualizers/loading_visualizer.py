@@ -5,59 +5,34 @@ import plotly.graph_objects as go
 
 from Utils import *
 
-def visualize_loading_times(loading_df):
-    st.header("Unity Project Loading Times")
-    
-    if loading_df.empty:
-        st.warning("No project loading data found in the log.")
-        return
-    
-    # If there are multiple loading entries, show a selector
-    if len(loading_df) > 1:
-        selected_index = st.selectbox(
-            "Select loading entry:", 
-            range(len(loading_df)), 
-            format_func=lambda i: f"Entry {i+1}: {loading_df.iloc[i]['timestamp_str']}"
-        )
-        entry = loading_df.iloc[selected_index]
-    else:
-        entry = loading_df.iloc[0]
-    
-    # Summary metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Loading Time", f"{entry['total_loading_time']:.3f}s")
-    with col2:
-        st.metric("Project Init Time", f"{entry['project_init_time']:.3f}s")
-    with col3:
-        st.metric("Scene Opening Time", f"{entry['scene_opening_time']:.3f}s" if entry['scene_opening_time'] is not None else "N/A")
-    
-    # Create waterfall chart for project init breakdown
-    st.subheader("Project Initialization Breakdown")
-    
-    # Prepare data for waterfall chart
-    subcomponents = [
-        'template_init', 'package_manager_init', 'asset_db_init',
-        'global_illumination_init', 'assemblies_load',
-        'unity_extensions_init', 'asset_db_refresh'
-    ]
-    
-    subcomponent_names = {
-        'template_init': 'Template Init',
-        'package_manager_init': 'Package Manager Init',
-        'asset_db_init': 'Asset Database Init',
-        'global_illumination_init': 'Global Illumination Init',
-        'assemblies_load': 'Assemblies Load',
-        'unity_extensions_init': 'Unity Extensions Init',
-        'asset_db_refresh': 'Asset Database Refresh'
-    }
+# Project initialization phases reported in the "Loading completed" block
+SUBCOMPONENTS = [
+    'template_init', 'package_manager_init', 'asset_db_init',
+    'global_illumination_init', 'assemblies_load',
+    'unity_extensions_init', 'asset_db_refresh'
+]
+
+SUBCOMPONENT_NAMES = {
+    'template_init': 'Template Init',
+    'package_manager_init': 'Package Manager Init',
+    'asset_db_init': 'Asset Database Init',
+    'global_illumination_init': 'Global Illumination Init',
+    'assemblies_load': 'Assemblies Load',
+    'unity_extensions_init': 'Unity Extensions Init',
+    'asset_db_refresh': 'Asset Database Refresh'
+}
+
+@memoize_view
+def prepare_loading_view(loading_df, selected_index):
+    """Build the initialization breakdown figures of one project loading entry."""
+    entry = loading_df.iloc[selected_index]
     
     # Filter out None values and create data for the chart
     chart_data = []
-    for component in subcomponents:
+    for component in SUBCOMPONENTS:
         if entry[component] is not None and entry[component] > 0:
             chart_data.append({
-                'Component': subcomponent_names.get(component, component),
+                'Component': SUBCOMPONENT_NAMES.get(component, component),
                 'Time': entry[component]
             })
     
@@ -65,7 +40,7 @@ def visualize_loading_times(loading_df):
     chart_df = pd.DataFrame(chart_data).sort_values('Time', ascending=False)
     
     # Create bar chart
-    fig = px.bar(
+    components_fig = px.bar(
         chart_df,
         x='Component',
         y='Time',
@@ -73,23 +48,17 @@ def visualize_loading_times(loading_df):
         title="Component Initialization Times",
         height=500
     )
-    st.plotly_chart(fig, use_container_width=True)
     
     # Pie chart showing time distribution
-    st.subheader("Project Init Time Distribution")
-    fig = px.pie(
+    distribution_fig = px.pie(
         chart_df,
         values='Time',
         names='Component',
         height=500
     )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Stacked waterfall chart to visualize the breakdown of total time
-    st.subheader("Loading Time Composition")
     
     # Calculate the "other" time that isn't accounted for in the subcomponents
-    accounted_time = sum(entry[comp] for comp in subcomponents if entry[comp] is not None)
+    accounted_time = sum(entry[comp] for comp in SUBCOMPONENTS if entry[comp] is not None)
     other_init_time = entry['project_init_time'] - accounted_time if entry['project_init_time'] is not None else 0
     
     # Create data for the waterfall chart
@@ -98,10 +67,10 @@ def visualize_loading_times(loading_df):
     ]
     
     # Add all components of project init time
-    for component in subcomponents:
+    for component in SUBCOMPONENTS:
         if entry[component] is not None and entry[component] > 0:
             waterfall_data.append({
-                'phase': subcomponent_names.get(component, component),
+                'phase': SUBCOMPONENT_NAMES.get(component, component),
                 'time': entry[component],
                 'type': 'project_init'
             })
@@ -129,7 +98,7 @@ def visualize_loading_times(loading_df):
     top_components = waterfall_df[waterfall_df['type'] != 'total'].nlargest(10, 'time')
     
     # Create the waterfall chart
-    fig = go.Figure(go.Waterfall(
+    waterfall_fig = go.Figure(go.Waterfall(
         name="Loading Process",
         orientation="v",
         measure=["absolute"] + ["relative"] * len(top_components),
@@ -138,12 +107,60 @@ def visualize_loading_times(loading_df):
         connector={"line":{"color":"rgb(63, 63, 63)"}},
     ))
     
-    fig.update_layout(
+    waterfall_fig.update_layout(
         title="Loading Time Waterfall Chart",
         showlegend=False
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return {
+        'components_fig': components_fig,
+        'distribution_fig': distribution_fig,
+        'waterfall_fig': waterfall_fig,
+        'other_init_time': other_init_time
+    }
+
+def visualize_loading_times(loading_df):
+    st.header("Unity Project Loading Times")
+    
+    if loading_df.empty:
+        st.warning("No project loading data found in the log.")
+        return
+    
+    # If there are multiple loading entries, show a selector
+    if len(loading_df) > 1:
+        selected_index = st.selectbox(
+            "Select loading entry:", 
+            range(len(loading_df)), 
+            format_func=lambda i: f"Entry {i+1}: {loading_df.iloc[i]['timestamp_str']}"
+        )
+    else:
+        selected_index = 0
+    entry = loading_df.iloc[selected_index]
+    
+    # Summary metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Loading Time", f"{entry['total_loading_time']:.3f}s")
+    with col2:
+        st.metric("Project Init Time", f"{entry['project_init_time']:.3f}s")
+    with col3:
+        st.metric("Scene Opening Time", f"{entry['scene_opening_time']:.3f}s" if entry['scene_opening_time'] is not None else "N/A")
+    
+    # Create waterfall chart for project init breakdown
+    st.subheader("Project Initialization Breakdown")
+    
+    view = prepare_loading_view(loading_df, selected_index)
+    st.plotly_chart(view['components_fig'], use_container_width=True)
+    
+    # Pie chart showing time distribution
+    st.subheader("Project Init Time Distribution")
+    st.plotly_chart(view['distribution_fig'], use_container_width=True)
+    
+    # Stacked waterfall chart to visualize the breakdown of total time
+    st.subheader("Loading Time Composition")
+    st.plotly_chart(view['waterfall_fig'], use_container_width=True)
+    
+    other_init_time = view['other_init_time']
     
     # Raw data in a well-formatted table
     with st.expander("View Loading Time Details"):
@@ -155,9 +172,9 @@ def visualize_loading_times(loading_df):
         }
         
         # Add all subcomponents
-        for comp in subcomponents:
+        for comp in SUBCOMPONENTS:
             if entry[comp] is not None:
-                display_data[subcomponent_names.get(comp, comp)] = f"{entry[comp]:.3f}s"
+                display_data[SUBCOMPONENT_NAMES.get(comp, comp)] = f"{entry[comp]:.3f}s"
         
         # Calculate and display "other" time
         if other_init_time > 0.01:
@@ -1,12 +1,11 @@
+import io
 import pandas as pd
 import time 
 import streamlit as st
 import plotly.express as px
 
-from datetime import datetime
-from datetime import datetime
-from Utils.ui_helpers import show_progress_checklist, show_big_spinner
-from Utils.data_helpers import extract_unity_version
+from datetime import datetime, timedelta
+from Utils.ui_helpers import show_big_spinner
 
 from Parsers import *
 from Utils import *
@@ -20,383 +19,202 @@ from .loading_visualizer import visualize_loading_times
 from .performance_visualizer import visualize_performance_report
 from .pipelinerefresh_visualizer import visualize_pipeline_refreshes
 from .shader_visualizer import visualize_shader_data
+from .timeline_visualizer import visualize_event_timeline
 from .timestampgap_visualizer import visualize_timestamp_gaps
 
+# Number of generated PDF reports kept per session
+PDF_CACHE_MAX_ENTRIES = 4
+
+# Name of the background job parsing the log
+PARSING_JOB = 'log_parsing'
+
 def visualize_log_data(log_file_path, parsing_options=None):
     
     # Use default options (all enabled) if none provided
     if parsing_options is None:
-        parsing_options = {
-            'shader': True,
-            'imports': True,
-            'loading': True,
-            'build_report': True,
-            'pipeline': True, 
-            'domain_reload': True,
-            'player_build': True,
-            'il2cpp': True,
-            'tundra': True,
-            'performance_report': True
-        }
+        parsing_options = DEFAULT_PARSING_OPTIONS
     
     # Check if we already have parsed data in the session state
-    if 'parsed_data' not in st.session_state:
-        # Start overall timing
-        start_time_overall = time.time()
-        
-        # Create a dictionary to store timing results
-        section_times = {}
-        
-        # Show progress checklist during initial parsing
-        update_progress, progress_container = show_progress_checklist(parsing_options)
-        
-        # Extract Unity version first
-        update_progress(message="Reading Unity version...")
-        unity_version = extract_unity_version(log_file_path)
-        
-        # Parse all data types
-        shader_df = pd.DataFrame()
-        shader_issues = {}
-        if parsing_options['shader']:
-            update_progress(message="Parsing shader errors and warnings...")
-            start_time = time.time()
-            shader_issues = parse_shader_errors_warnings(log_file_path)
-            section_times["Parse Shader Issues"] = time.time() - start_time
-            update_progress("Shader Issues", "Shader errors and warnings parsed")
-            
-            update_progress(message="Parsing shader compilation data...")
-            start_time = time.time()
-            shader_df = parse_shader_log(log_file_path)
-            section_times["Parse Shader Log"] = time.time() - start_time
-            update_progress("Shader Compilation Data", "Shader compilation data parsed")
-    
-        # Parse selected data types with timing and update progress
-        shader_df = pd.DataFrame()
-        if parsing_options['shader']:
-            update_progress(message="Parsing shader compilation data...")
-            start_time = time.time()
-            shader_df = parse_shader_log(log_file_path)
-            section_times["Parse Shader Log"] = time.time() - start_time
-            update_progress("Shader Compilation Data", "Shader compilation data parsed")
-        
-
-        #shader_df = pd.DataFrame()
-        shader_issues = {}
-        if parsing_options['shader']:
-            update_progress(message="Parsing shader errors and warnings...")
-            start_time = time.time()
-            shader_issues = parse_shader_errors_warnings(log_file_path)
-            section_times["Parse Shader Issues"] = time.time() - start_time
-            update_progress("Shader Issues", "Shader errors and warnings parsed")
-        
-        
-        import_df = pd.DataFrame()
-        if parsing_options['imports']:
-            update_progress(message="Parsing asset import data...")
-            start_time = time.time()
-            import_df = parse_asset_imports(log_file_path)
-            section_times["Parse Asset Imports"] = time.time() - start_time
-            update_progress("Asset Import Data", "Asset import data parsed")
-        
-        # Continue with the same pattern for all other parsing steps...
-        loading_df = pd.DataFrame()
-        if parsing_options['loading']:
-            update_progress(message="Parsing project loading times...")
-            start_time = time.time()
-            loading_df = parse_loading_times(log_file_path)
-            section_times["Parse Loading Times"] = time.time() - start_time
-            update_progress("Project Loading Times", "Project loading times parsed")
-        
-        build_df, total_build_size, total_build_unit = pd.DataFrame(), None, None
-        if parsing_options['build_report']:
-            update_progress(message="Parsing build report data...")
-            start_time = time.time()
-            build_df, total_build_size, total_build_unit = parse_build_report(log_file_path)
-            section_times["Parse Build Report"] = time.time() - start_time
-            update_progress("Build Report Data", "Build Report Data parsed")
-        
-        refresh_df = pd.DataFrame()
-        if parsing_options['pipeline']:
-            update_progress(message="Parsing asset pipeline refresh data...")
-            start_time = time.time()
-            refresh_df = parse_asset_pipeline_refresh(log_file_path)
-            section_times["Parse Asset Pipeline Refresh"] = time.time() - start_time
-            update_progress("Asset Pipeline Refresh Data", "Asset Pipeline Refresh Data parsed")
-
-        player_build_info = []
-        if parsing_options['player_build']:
-            update_progress(message="Parsing player build information...")
-            start_time = time.time()
-            player_build_info = parse_player_build_info(log_file_path)
-            section_times["Parse Player Build Info"] = time.time() - start_time
-            update_progress("Player Build Information", "Player Build Information parsed")
-
-        il2cpp_data = []
-        if parsing_options['il2cpp']:
-            update_progress(message="Parsing IL2CPP processing data...")
-            start_time = time.time()
-            il2cpp_data = parse_il2cpp_processing(log_file_path)
-            section_times["Parse IL2CPP Processing"] = time.time() - start_time
-            update_progress("IL2CPP Processing Data", "IL2CPP Processing Data parsed")
-
-        # Parse Tundra build info
-        tundra_info = []
-        if parsing_options['tundra']:
-            update_progress(message="Parsing Tundra build data...")
-            start_time = time.time()
-            tundra_info = parse_tundra_build_info(log_file_path)
-            section_times["Parse Tundra Build Info"] = time.time() - start_time
-            update_progress("Tundra Build Information", "Tundra Build Information parsed")
-
-        domain_reloads = []
-        has_domain_reloads = False
-        if parsing_options['domain_reload']:
-            update_progress(message="Parsing domain reload data...")
-            start_time = time.time()
-            domain_reloads = parse_domain_reloads(log_file_path)
-            section_times["Parse Domain Reloads"] = time.time() - start_time
-            update_progress("Domain Reload Data", "Domain Reload Data parsed")
-
-        performance_df = pd.DataFrame()
-        if parsing_options['performance_report']:
-            update_progress(message="Parsing performance report data...")
-            start_time = time.time()
-            performance_df = parse_performance_report(log_file_path)
-            section_times["Parse Performance Report"] = time.time() - start_time
-            update_progress("Performance Report Data", "Performance report data parsed")
-
-        overall_time = time.time() - start_time_overall
-        section_times["Total Processing Time"] = overall_time
-
-        # Store all parsed data in the session state
-        st.session_state.parsed_data = {
-            'shader_df': shader_df,
-            'shader_issues': shader_issues,
-            'import_df': import_df,
-            'loading_df': loading_df,
-            'build_df': build_df,
-            'total_build_size': total_build_size,
-            'total_build_unit': total_build_unit,
-            'refresh_df': refresh_df,
-            'player_build_info': player_build_info,
-            'il2cpp_data': il2cpp_data,
-            'domain_reloads': domain_reloads,
-            'has_domain_reloads': has_domain_reloads,
-            'tundra_info': tundra_info,  
-            'unity_version': unity_version,
-            'section_times': section_times,
-            'overall_time': overall_time,
-            'performance_df': performance_df
-        }
-        
-        # Update progress message before closing the progress container
-        update_progress(message="Preparing visualization...")
-        progress_container.empty()
+    parsing_complete = True
+    if 'parsed_data' in st.session_state:
+        parsed_data = st.session_state.parsed_data
+    elif not st.runtime.exists():
+        # Command line: nothing to show while parsing, so parse right away
+        parsed_data = st.session_state.parsed_data = parse_log_data(log_file_path, parsing_options)
+    elif parsing_options.get('quick_look') and not st.session_state.get('full_analysis_requested'):
+        # Estimate the totals from samples first; the full parse starts once the user asks for it
+        show_quick_look(log_file_path, parsing_options)
+        return
     else:
-            # If data is already parsed, retrieve it from session state
-            shader_df = st.session_state.parsed_data['shader_df']
-            shader_issues = st.session_state.parsed_data['shader_issues']
-            import_df = st.session_state.parsed_data['import_df']
-            loading_df = st.session_state.parsed_data['loading_df']
-            build_df = st.session_state.parsed_data['build_df']
-            total_build_size = st.session_state.parsed_data['total_build_size']
-            total_build_unit = st.session_state.parsed_data['total_build_unit']
-            refresh_df = st.session_state.parsed_data['refresh_df']
-            player_build_info = st.session_state.parsed_data['player_build_info']
-            il2cpp_data = st.session_state.parsed_data['il2cpp_data']
-            domain_reloads = st.session_state.parsed_data['domain_reloads']
-            has_domain_reloads = st.session_state.parsed_data['has_domain_reloads']
-            unity_version = st.session_state.parsed_data['unity_version']
-            tundra_info = st.session_state.parsed_data['tundra_info']  # Retrieve tundra_info here
-            section_times = st.session_state.parsed_data['section_times']
-            overall_time = st.session_state.parsed_data['overall_time']
-            performance_df = st.session_state.parsed_data['performance_df']
-
-            
+        # In the app the log is parsed in the background, showing the data types already parsed meanwhile
+        parsed_data, parsing_complete = parse_log_data_in_background(log_file_path, parsing_options)
+        if parsed_data is None:
+            return
+    parsing_cancelled = parsed_data.get('parsing_cancelled', False)
+
+    # Logs holding several Editor sessions can be looked at one session at a time
+    if parsing_complete and len(parsed_data.get('sessions') or []) > 1:
+        parsed_data = select_log_session(log_file_path, parsed_data)
+    
+    # Views that read the log themselves only see the time window the log was cut to
+    if parsed_data.get('window_log') is not None:
+        log_file_path = parsed_data['window_log']
+    
+    # Retrieve the parsed data
+    shader_df = parsed_data['shader_df']
+    shader_issues = parsed_data['shader_issues']
+    import_df = parsed_data['import_df']
+    loading_df = parsed_data['loading_df']
+    build_df = parsed_data['build_df']
+    build_reports = parsed_data['build_reports']
+    total_build_size = parsed_data['total_build_size']
+    total_build_unit = parsed_data['total_build_unit']
+    refresh_df = parsed_data['refresh_df']
+    refresh_ops = parsed_data['refresh_ops']
+    player_build_info = parsed_data['player_build_info']
+    il2cpp_data = parsed_data['il2cpp_data']
+    domain_reloads = parsed_data['domain_reloads']
+    domain_reload_ops = parsed_data['domain_reload_ops']
+    has_domain_reloads = parsed_data['has_domain_reloads']
+    unity_version = parsed_data['unity_version']
+    log_header = parsed_data['log_header']
+    tundra_info = parsed_data['tundra_info']
+    section_times = parsed_data['section_times']
+    overall_time = parsed_data['overall_time']
+    performance_df = parsed_data['performance_df']
+    parser_stats = parsed_data['parser_stats']
+    coverage = parsed_data.get('coverage', {})
+    time_window = parsed_data.get('time_window')
+    session = parsed_data.get('session')
+    # Snapshots of a parse still running don't have their timeline yet
+    event_timeline = parsed_data.get('event_timeline')
+    if event_timeline is None:
+        event_timeline = build_event_timeline(parsed_data)
+
+    # Visualization timings are collected fresh on every rerun, on top of the parse timings
+    section_times = dict(section_times)
 
 
     # Check data completeness and show summary
-    issues = check_log_data_completeness(log_file_path, shader_df, import_df, loading_df, build_df, refresh_df, player_build_info, unity_version)
+    issues = []
+    if parsing_cancelled:
+        st.warning("Parsing was cancelled. Only the data types parsed before that are shown.")
+        if st.button("Parse again", key="parse_again"):
+            reset_parsed_data()
+            # Straight to the full analysis, without another quick look
+            st.session_state.full_analysis_requested = True
+            st.rerun()
+    elif parsing_complete:
+        issues = check_log_data_completeness(log_file_path, shader_df, import_df, loading_df, build_df, refresh_df, player_build_info, unity_version, log_header, coverage)
     
     if issues:
         with st.expander("⚠️ Log Analysis Summary - Click to expand ⚠️", expanded=True):
             for issue in issues:
                 st.write(issue)
             st.write("The analysis will proceed with available data.")
-    else:
+    elif parsing_complete and not parsing_cancelled:
         st.success("✅ All data types were found in the log file. ✅ ")
+    
+    # Session details read from the log header
+    session_details = [f"Unity {unity_version}" if unity_version else None, log_header.get('platform'),
+                       "Batch mode" if log_header.get('batch_mode') else None,
+                       f"Time window: {format_time_window(time_window)}" if time_window else None,
+                       f"{len(parsed_data['sessions'])} Editor sessions" if len(parsed_data.get('sessions') or []) > 1 else None,
+                       format_log_session(session) if session else None]
+    if any(session_details):
+        st.caption(" · ".join(detail for detail in session_details if detail))
 
     
 
     # Create a row with processing time summary and PDF export button side by side
     col1, col2 = st.columns([3, 1])
 
-    # Put the processing time summary expander in the first column
+    # Reserve space for the processing time summary; it is filled in once the tabs have been
+    # rendered so the visualization timings of this run can be included
     with col1:
-        with st.expander("🕒 Processing Time Summary", expanded=False):
-            # Create a dataframe for the timing data
-            timing_data = []
-            for section, execution_time in section_times.items():
-                timing_data.append({
-                    "Section": section,
-                    "Execution Time (s)": round(execution_time, 3),
-                    "Percentage": round((execution_time / overall_time) * 100, 1) if section != "Total Processing Time" else 100
-                })
-            
-            timing_df = pd.DataFrame(timing_data)
-            
-            # Split into parsing and visualization sections
-            parsing_df = timing_df[timing_df["Section"].str.startswith("Parse")]
-            visualization_df = timing_df[timing_df["Section"].str.startswith("Visualize")]
-            
-            # Display in columns
-            col1a, col2a = st.columns(2)
-            
-            with col1a:
-                st.subheader("Parsing Times")
-                parsing_fig = px.bar(
-                    parsing_df,
-                    y="Section",
-                    x="Execution Time (s)",
-                    text="Execution Time (s)",
-                    color="Percentage",
-                    orientation="h",
-                    height=400
-                )
-                parsing_fig.update_traces(texttemplate="%{text:.3f}s", textposition="outside")
-                st.plotly_chart(parsing_fig, use_container_width=True, key="parsing_times_chart")
-            
-            with col2a:
-                st.subheader("Visualization Times")
-                viz_fig = px.bar(
-                    visualization_df,
-                    y="Section",
-                    x="Execution Time (s)",
-                    text="Execution Time (s)",
-                    color="Percentage",
-                    orientation="h",
-                    height=400
-                )
-                viz_fig.update_traces(texttemplate="%{text:.3f}s", textposition="outside")
-                st.plotly_chart(viz_fig, use_container_width=True, key="visualization_times_chart")
-            
-            # Display the total time as a metric
-            st.metric("Total Log Analysis Time", f"{overall_time:.2f} seconds")
+        timing_placeholder = st.empty()
 
     # Put the PDF export button in the second column, vertically centered
     with col2:
-        if st.button("Generate PDF", key="pdf_button"):
-            with st.spinner("Generating PDF report..."):
-                # Collect all parsed data
-                parsing_data = {
-                    'shader_df': shader_df,
-                    'import_df': import_df,
-                    'loading_df': loading_df,
-                    'build_df': build_df,
-                    'refresh_df': refresh_df,
-                    'player_build_info': player_build_info,
-                    'il2cpp_data': il2cpp_data,
-                    'domain_reloads': domain_reloads,
-                    'unity_version': unity_version,
-                    'total_build_size': total_build_size,
-                    'total_build_unit': total_build_unit,
-                    'performance_df' : performance_df
-                }
-                
-                # Generate the PDF
-                pdf_buffer = generate_pdf_report(log_file_path, parsing_data)
-                
-                # Get filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"unity_log_analysis_{timestamp}.pdf"
-                
-                # Provide download link
-                st.markdown(get_download_link(pdf_buffer, filename), unsafe_allow_html=True)
-                st.success("PDF report generated!")
+        # Collect all parsed data
+        parsing_data = {
+            'shader_df': shader_df,
+            'import_df': import_df,
+            'loading_df': loading_df,
+            'build_df': build_df,
+            'refresh_df': refresh_df,
+            'player_build_info': player_build_info,
+            'il2cpp_data': il2cpp_data,
+            'domain_reloads': domain_reloads,
+            'unity_version': unity_version,
+            'total_build_size': total_build_size,
+            'total_build_unit': total_build_unit,
+            'performance_df' : performance_df,
+            'section_times': section_times,
+            'parser_stats': parser_stats,
+            'coverage': coverage,
+            'time_window': time_window,
+            'session': session
+        }
+        # The report is only offered once every data type has been parsed
+        if parsing_complete:
+            render_pdf_export(log_file_path, parsing_data)
                 
 
     # Create a summary section with timing metrics from all tabs
     st.subheader("📊 Performance Summary 📊")
     
+    def metric_label(label, key):
+        """Mark totals computed from data parsed from only part of the log."""
+        return f"{label} (partial)" if key in coverage else label
+    
     # Create a two-column layout
     left_col, right_col = st.columns([3, 2])
 
+    totals = performance_summary_totals(parsed_data)
+    total_build_time = totals['build']
+    total_loading_time = totals['loading']
+    total_reload_time = totals['domain_reload']
+    total_refresh_time = totals['refresh']
+    total_import_time = totals['import']
+    total_shader_time = totals['shader']
+
     # Put all metrics in the left column
     with left_col:
         col1, col2, col3 = st.columns(3)
 
         # Player Build time
         with col1:
-            total_build_time = None
-            if player_build_info:
-                total_build_time = sum(entry.get('total_duration_sec', 0) for entry in player_build_info)
-            st.metric("Total Build Time", format_time(total_build_time))
+            st.metric(metric_label("Total Build Time", 'player_build_info'), format_time(total_build_time))
 
         # Project Loading time
         with col2:
-            total_loading_time = None
-            if not loading_df.empty and 'total_loading_time' in loading_df.columns:
-                total_loading_time = loading_df['total_loading_time'].sum()
-            st.metric("Total Loading Time", format_time(total_loading_time))
+            st.metric(metric_label("Total Loading Time", 'loading_df'), format_time(total_loading_time))
 
         # Domain Reloads time
         with col3:
-            total_reload_time = None
-            if domain_reloads:
-                total_reload_time = sum((reload.get('reset_time', 0) or 0) for reload in domain_reloads)
-            st.metric("Total Domain Reload Time", format_time(total_reload_time))
+            st.metric(metric_label("Total Domain Reload Time", 'domain_reloads'), format_time(total_reload_time))
 
         col1, col2, col3 = st.columns(3)
 
         # Asset Pipeline Refresh time
         with col1:
-            total_refresh_time = None
-            if not refresh_df.empty and 'total_time' in refresh_df.columns:
-                total_refresh_time = refresh_df['total_time'].sum()
-            st.metric("Total Pipeline Refresh Time", format_time(total_refresh_time))
+            st.metric(metric_label("Total Pipeline Refresh Time", 'refresh_df'), format_time(total_refresh_time))
 
         # Asset Import time
         with col2:
-            total_import_time = None
-            if not import_df.empty and 'import_time_seconds' in import_df.columns:
-                total_import_time = import_df['import_time_seconds'].sum()
-            st.metric("Total Asset Import Time", format_time(total_import_time))
+            st.metric(metric_label("Total Asset Import Time", 'import_df'), format_time(total_import_time))
             
         # Shader Compilation time
         with col3:
-            total_shader_time = None
-            if not shader_df.empty and 'total_seconds' in shader_df.columns:
-                total_shader_time = shader_df['total_seconds'].sum()
-            elif not shader_df.empty and 'compilation_seconds' in shader_df.columns:
-                # Fallback to compilation_seconds if total_seconds is not available
-                total_shader_time = shader_df['compilation_seconds'].sum()
-            st.metric("Total Shader Processing Time", format_time(total_shader_time))
-        
-        # Calculate session duration if timestamps are available
-        all_timestamps = []
-        
-        # Collect timestamps from all dataframes
-        if not shader_df.empty and 'timestamp' in shader_df.columns:
-            all_timestamps.extend(ts for ts in shader_df['timestamp'] if pd.notna(ts))
-        if not import_df.empty and 'timestamp' in import_df.columns:
-            all_timestamps.extend(ts for ts in import_df['timestamp'] if pd.notna(ts))
-        if not loading_df.empty and 'timestamp' in loading_df.columns:
-            all_timestamps.extend(ts for ts in loading_df['timestamp'] if pd.notna(ts))
-        if not refresh_df.empty and 'timestamp' in refresh_df.columns:
-            all_timestamps.extend(ts for ts in refresh_df['timestamp'] if pd.notna(ts))
-        if player_build_info:
-            all_timestamps.extend(entry.get('timestamp') for entry in player_build_info if entry.get('timestamp'))
-        if domain_reloads:
-            all_timestamps.extend(reload.get('timestamp') for reload in domain_reloads if reload.get('timestamp'))
+            st.metric(metric_label("Total Shader Processing Time", 'shader_df'), format_time(total_shader_time))
         
-        # If we have timestamps, calculate and display session duration
-        if all_timestamps:
-            first_timestamp = min(all_timestamps)
-            last_timestamp = max(all_timestamps)
-            session_duration = (last_timestamp - first_timestamp).total_seconds()
+        # Session duration: from the start of the first timed event to the end of the last
+        span = timeline_span(event_timeline)
+        if span:
             col1, col2 = st.columns([1, 2])
             with col1:
-                st.metric("Editor Session Duration", format_time(session_duration))
+                st.metric("Editor Session Duration", format_time((span[1] - span[0]).total_seconds()))
 
     # Put the pie chart in the right column
     with right_col:
@@ -457,173 +275,68 @@ def visualize_log_data(log_file_path, parsing_options=None):
     has_il2cpp_data = bool(il2cpp_data)
     has_tundra_info = bool(tundra_info)
     has_domain_reloads = len(domain_reloads) > 0
-    has_timestamp_gaps = parsing_options['timestamp_gaps']
+    # Timestamp gaps are computed by their view, so they wait until the background parse is done
+    has_timestamp_gaps = parsing_options['timestamp_gaps'] and parsing_complete
     has_performance_data = not performance_df.empty
+    has_event_timeline = len(event_timeline['start']) > 0
 
     # Enhance build info with Tundra data if available
     if has_tundra_info and player_build_info:
         enhance_build_info_with_tundra(player_build_info, tundra_info)
         
-    # Create tabs for different visualizations
-    tab_titles = []
+    # Each view: (title, spinner message, timing section, parsed data keys it shows, render function)
+    views = []
     if has_build_info:
-        tab_titles.append("Player Build Performance")
+        views.append(("Player Build Performance", "Processing Player Build Information...", "Visualize Player Build Info",
+                      ('player_build_info', 'tundra_info'), lambda: visualize_player_build_info(player_build_info)))
     if has_build_report:
-        tab_titles.append("Build Report")
+        views.append(("Build Report", "Analyzing Build Report...", "Visualize Build Report",
+                      ('build_df',), lambda: visualize_build_report(build_df, total_build_size, total_build_unit, build_reports)))
     if has_loading_data:
-        tab_titles.append("Project Loading")
+        views.append(("Project Loading", "Analyzing Project Loading Times...", "Visualize Loading Times",
+                      ('loading_df',), lambda: visualize_loading_times(loading_df)))
     if has_domain_reloads:
-        tab_titles.append("Domain Reloads")
+        views.append(("Domain Reloads", "Analyzing Domain Reloads...", "Visualize Domain Reloads",
+                      ('domain_reloads',), lambda: visualize_domain_reloads(log_file_path, domain_reloads, domain_reload_ops)))
     if has_refresh_data:
-        tab_titles.append("Asset Pipeline Refreshes")
+        views.append(("Asset Pipeline Refreshes", "Analyzing Asset Pipeline Refreshes...", "Visualize Pipeline Refreshes",
+                      ('refresh_df', 'tundra_info'), lambda: visualize_pipeline_refreshes(refresh_df, log_file_path, refresh_ops, tundra_info)))
     if has_import_data:
-        tab_titles.append("Asset Imports")
+        views.append(("Asset Imports", "Analyzing Asset Imports...", "Visualize Asset Imports",
+                      ('import_df',), lambda: visualize_asset_imports(import_df)))
     if has_shader_data:
-        tab_titles.append("Shader Compilation")
+        views.append(("Shader Compilation", "Analyzing Shader Compilation Data...", "Visualize Shader Data",
+                      ('shader_df', 'shader_issues'), lambda: visualize_shader_data(shader_df, shader_issues)))
     if has_il2cpp_data:
-        tab_titles.append("IL2CPP Processing")
+        views.append(("IL2CPP Processing", "Analyzing IL2CPP Processing...", "Visualize IL2CPP Data",
+                      ('il2cpp_data',), lambda: visualize_il2cpp_data(il2cpp_data)))
     if has_timestamp_gaps:
-        tab_titles.append("Timestamp Gaps")  
+        views.append(("Timestamp Gaps", "Analyzing Timestamp Gaps...", "Visualize Timestamp Gaps",
+                      (), lambda: visualize_timestamp_gaps(log_file_path, event_timeline)))
+    if has_event_timeline:
+        views.append(("Event Timeline", "Drawing the Event Timeline...", "Visualize Event Timeline",
+                      ('loading_df', 'player_build_info', 'domain_reloads', 'refresh_df', 'import_df'),
+                      lambda: visualize_event_timeline(parsed_data, event_timeline, log_file_path)))
     if has_performance_data:
-        tab_titles.append("Performance Report")
-
-
-    # Initialize active tab in session state if it doesn't exist
-    if 'active_tab' not in st.session_state:
-        st.session_state.active_tab = 0
+        views.append(("Performance Report", "Analyzing Performance Report...", "Visualize Performance Report",
+                      ('performance_df',), lambda: visualize_performance_report(performance_df)))
     
     # If we don't have any data, show a message
-    if not tab_titles:
-        st.error("No actionable Unity build data found in the log file.")
+    if not views:
+        if parsing_complete:
+            st.error("No actionable Unity build data found in the log file.")
+        else:
+            st.info("No data found in the data types parsed so far.")
         return
     
-    # Create the tabs and track which one is clicked
-    tabs = st.tabs(tab_titles)
-    
-    # Populate tabs based on available data
-    tab_index = 0
-
-    if has_build_info:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Processing Player Build Information...")
-                start_time = time.time()
-                visualize_player_build_info(player_build_info)
-                section_times["Visualize Player Build Info"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-
-    if has_build_report:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Build Report...")
-                start_time = time.time()
-                visualize_build_report(build_df, total_build_size, total_build_unit)
-                section_times["Visualize Build Report"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-        
-    if has_loading_data:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Project Loading Times...")
-                start_time = time.time()
-                visualize_loading_times(loading_df)
-                section_times["Visualize Loading Times"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-
-    if has_domain_reloads:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Domain Reloads...")
-                start_time = time.time()
-                visualize_domain_reloads(log_file_path)
-                section_times["Visualize Domain Reloads"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-
-    if has_refresh_data:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Asset Pipeline Refreshes...")
-                start_time = time.time()
-                visualize_pipeline_refreshes(refresh_df, log_file_path)
-                section_times["Visualize Pipeline Refreshes"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-
-    if has_import_data:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Asset Imports...")
-                start_time = time.time()
-                visualize_asset_imports(import_df)
-                section_times["Visualize Asset Imports"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-
-    if has_shader_data:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Shader Compilation Data...")
-                start_time = time.time()
-                visualize_shader_data(shader_df, shader_issues)
-                section_times["Visualize Shader Data"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
-        
-    if has_il2cpp_data:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing IL2CPP Processing...")
-                start_time = time.time()
-                visualize_il2cpp_data(il2cpp_data)
-                section_times["Visualize IL2CPP Data"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
+    render_selected_view(views, section_times, coverage)
 
-    if has_timestamp_gaps:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Timestamp Gaps...")
-                start_time = time.time()
-                visualize_timestamp_gaps(log_file_path)
-                section_times["Visualize Timestamp Gaps"] = time.time() - start_time
-                spinner_container.empty()
-        tab_index += 1
+    # Now that every visible tab has been drawn, show the processing time summary
+    if parsing_complete:
+        with timing_placeholder.container():
+            show_processing_time_summary(section_times, overall_time, parser_stats)
 
-    if has_performance_data:
-        with tabs[tab_index]:
-            if "active_tab" not in st.session_state or st.session_state.active_tab != tab_index:
-                st.session_state.active_tab = tab_index
-            if st.session_state.active_tab == tab_index:
-                update_spinner, spinner_container = show_big_spinner("Analyzing Performance Report...")
-                start_time = time.time()
-                visualize_performance_report(performance_df)
-                section_times["Visualize Performance Report"] = time.time() - start_time
-                spinner_container.empty()
-
-
-     # Return the parsed data for use in PDF generation
+    # Return the parsed data for use in PDF generation
     return {
         'shader_df': shader_df,
         'shader_issues': shader_issues,
@@ -636,6 +349,365 @@ def visualize_log_data(log_file_path, parsing_options=None):
         'player_build_info': player_build_info,
         'il2cpp_data': il2cpp_data,
         'domain_reloads': domain_reloads,
-        'unity_version': unity_version
+        'unity_version': unity_version,
+        'performance_df': performance_df,
+        'section_times': section_times,
+        'parser_stats': parser_stats,
+        'coverage': coverage,
+        'time_window': time_window,
+        'sessions': parsed_data.get('sessions') or []
     }
- 
\ No newline at end of file
+
+def show_quick_look(log_file_path, parsing_options):
+    """Show the totals estimated from samples of the log, with their 95% intervals, and a button to parse it all."""
+    st.subheader("🔎 Quick Look 🔎")
+    
+    if 'quick_look' not in st.session_state:
+        try:
+            with st.spinner("Sampling the log..."):
+                st.session_state.quick_look = estimate_log_totals(log_file_path, parsing_options)
+        except ValueError as e:
+            st.session_state.quick_look = str(e)
+    quick_look = st.session_state.quick_look
+    
+    if isinstance(quick_look, str):
+        st.info(quick_look)
+    elif not quick_look['estimates']:
+        st.info("None of the selected data types can be estimated from samples.")
+    else:
+        if quick_look['exact']:
+            st.caption("The log is small enough to be parsed whole: these totals are exact.")
+        else:
+            st.caption(f"Estimated from {quick_look['sample_count']} evenly spaced samples "
+                       f"({quick_look['sampled_bytes'] / (1024 * 1024):.1f} MB of {quick_look['log_bytes'] / (1024 * 1024):.1f} MB) "
+                       f"in {quick_look['elapsed_seconds']:.1f}s. Builds and project loads are only counted by the full analysis.")
+        
+        columns = st.columns(4)
+        for index, estimate in enumerate(quick_look['estimates'].values()):
+            with columns[index % 4]:
+                value = format_quick_look_value(estimate['estimate'], estimate['kind'])
+                low = format_quick_look_value(estimate['low'], estimate['kind'])
+                high = format_quick_look_value(estimate['high'], estimate['kind'])
+                st.metric(estimate['label'], value if quick_look['exact'] else f"≈ {value}")
+                if not quick_look['exact']:
+                    st.caption(f"95% interval: {low} – {high}")
+    
+    if st.button("Run Full Analysis", key="run_full_analysis", type="primary"):
+        st.session_state.full_analysis_requested = True
+        st.rerun()
+
+def parse_log_data_in_background(log_file_path, parsing_options):
+    """
+    Parse the log in a background job and show its progress. Returns (parsed_data, complete); while the job
+    runs, parsed_data holds the data types finished so far (None before the first one).
+    """
+    job = get_background_job(PARSING_JOB)
+    if job is None:
+        completed = {'steps': [], 'parsed_data': None}
+        
+        def step_done(step_name, parsed_data):
+            completed['parsed_data'] = parsed_data
+            completed['steps'] = completed['steps'] + [step_name]
+        
+        job = start_background_job(PARSING_JOB, parse_log_data, log_file_path, parsing_options,
+                                   cancellable=True, step_done=step_done)
+        job['completed'] = completed
+    
+    if job['done']:
+        clear_background_job(PARSING_JOB)
+        if job['error'] is not None:
+            st.error(f"Parsing the log failed: {job['error']}")
+            return None, False
+        st.session_state.parsed_data = job['result']
+        return job['result'], True
+    
+    show_parsing_progress(len(job['completed']['steps']))
+    return job['completed']['parsed_data'], False
+
+def format_eta(seconds):
+    """Short remaining time for progress messages."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    return f"{seconds / 60:.1f} min"
+
+def show_parsing_progress(steps_shown):
+    """
+    Progress of the background parse: overall progress with ETA, bytes read and throughput of the running
+    parser, and a cancel button. Refreshes itself and reruns the page once another data type is parsed.
+    """
+    def progress_panel():
+        job = get_background_job(PARSING_JOB)
+        if job is None or job['done'] or len(job['completed']['steps']) != steps_shown:
+            st.rerun()
+        
+        details = job['details']
+        text = job['message'] or "Parsing log..."
+        if details.get('eta_seconds') is not None:
+            text += f" About {format_eta(details['eta_seconds'])} left."
+        st.progress(job['progress'], text=text)
+        
+        if details.get('stage'):
+            read_mb = details['stage_bytes'] / (1024 * 1024)
+            stage_text = f"{details['stage']}: {read_mb:.1f} MB"
+            if details.get('total_bytes'):
+                stage_text += f" of {details['total_bytes'] / (1024 * 1024):.1f} MB"
+            if details.get('throughput'):
+                stage_text += f" at {details['throughput'] / (1024 * 1024):.1f} MB/s"
+            st.caption(stage_text)
+        if job['completed']['steps']:
+            st.caption("Parsed: " + ", ".join(job['completed']['steps']))
+        
+        if st.button("Cancel parsing", key="cancel_parsing"):
+            cancel_log_parsing()
+            st.rerun()
+    
+    if hasattr(st, 'fragment'):
+        st.fragment(progress_panel, run_every=JOB_POLL_INTERVAL)()
+    else:
+        progress_panel()
+
+def cancel_log_parsing():
+    """Stop the background parse and keep the data types it had finished as the parsed data."""
+    job = get_background_job(PARSING_JOB)
+    if job is None:
+        return
+    cancel_background_job(PARSING_JOB)
+    clear_background_job(PARSING_JOB)
+    if job['done'] and job['result'] is not None:
+        st.session_state.parsed_data = job['result']
+    else:
+        parsed_data = job['completed']['parsed_data'] or empty_parsed_data()
+        st.session_state.parsed_data = dict(parsed_data, parsing_cancelled=True)
+
+def reset_parsed_data():
+    """Forget the parsed data (new log or options), stopping a parse still running in the background."""
+    cancel_background_job(PARSING_JOB)
+    clear_background_job(PARSING_JOB)
+    st.session_state.pop('parsed_data', None)
+    st.session_state.pop('quick_look', None)
+    st.session_state.pop('full_analysis_requested', None)
+    st.session_state.pop('selected_session', None)
+    st.session_state.pop('timeline_with_gaps', None)
+
+def select_log_session(log_file_path, parsed_data):
+    """
+    Let the user look at one Editor session of a multi-session log instead of all of them merged
+    (see parse_sessions_data). Returns the parsed data of the selected session, or the merged data.
+    """
+    session_data = parsed_data['sessions']
+    labels = ["All sessions (merged)"] + [format_log_session(data['session']) for data in session_data]
+    choice = st.selectbox("Editor Session", range(len(labels)), format_func=lambda index: labels[index],
+                          key="selected_session",
+                          help="This log holds several Editor sessions. They were parsed separately and merged; "
+                               "pick one to see only its data.")
+    if choice == 0:
+        return parsed_data
+
+    selected = session_data[choice - 1]
+    # Views that read the log themselves only see the selected session; session offsets are in the
+    # log as parsed, which is the time window when the log was cut to one
+    if selected.get('window_log') is None:
+        source = parsed_data['window_log'] if parsed_data.get('window_log') is not None else log_file_path
+        selected['window_log'] = io.BytesIO(read_log_session(source, selected['session']))
+    return dict(selected, time_window=parsed_data.get('time_window'))
+
+def select_time_window(log_file_path, parsing_options):
+    """
+    Let the user restrict the analysis to a time window of the session, stored as parsing_options['time_window'].
+    The log's time range comes from its timestamp index and is kept for the current log (see reset_time_window).
+    """
+    if 'log_time_range' not in st.session_state:
+        timestamps = parse_timestamp_index(log_file_path)['timestamps']
+        st.session_state.log_time_range = (timestamps[0], timestamps[-1]) if timestamps else None
+    time_range = st.session_state.log_time_range
+    
+    with st.expander("⏱️ Time Window", expanded=bool(parsing_options.get('time_window'))):
+        if time_range is None or time_range[1] <= time_range[0]:
+            st.caption("This log has no timestamps spanning a time range, so the whole log is analyzed.")
+            parsing_options.pop('time_window', None)
+            return
+        
+        first, last = time_range
+        enabled = st.checkbox("Only analyze a time window", key="time_window_enabled", on_change=reset_parsed_data,
+                              help="Parsers only read the lines logged in the window, found through an index of the log's timestamps")
+        if not enabled:
+            parsing_options.pop('time_window', None)
+            return
+        
+        parsing_options['time_window'] = st.slider(
+            "Time window",
+            min_value=first,
+            max_value=last,
+            value=(first, last),
+            step=timedelta(minutes=1),
+            format="YYYY-MM-DD HH:mm:ss",
+            key="time_window_slider",
+            on_change=reset_parsed_data
+        )
+
+def reset_time_window():
+    """Forget the time range and window selected for the previous log."""
+    for key in ('log_time_range', 'time_window_enabled', 'time_window_slider'):
+        st.session_state.pop(key, None)
+
+@render_fragment
+def render_selected_view(views, section_times, coverage=None):
+    """
+    Show a selector for the available views and render only the selected one.
+    Running as a fragment, the selector and the widgets inside a view only rerun this function.
+    Views built from data parsed from only part of the log (see coverage) are marked as partial.
+    """
+    tab_titles = [view[0] for view in views]
+    if st.session_state.get('active_view') not in tab_titles:
+        st.session_state.active_view = tab_titles[0]
+    
+    selected_title = st.radio("View", tab_titles, key="active_view", horizontal=True, label_visibility="collapsed")
+    title, message, section, keys, render = views[tab_titles.index(selected_title)]
+    
+    partial_keys = [key for key in keys if coverage and key in coverage]
+    if partial_keys:
+        st.warning(f"This view has {format_partial_coverage(coverage[partial_keys[0]])}: "
+                   "parsing stopped at its time or memory budget.")
+    
+    update_spinner, spinner_container = show_big_spinner(message)
+    start_time = time.time()
+    render()
+    section_times[section] = time.time() - start_time
+    spinner_container.empty()
+
+def build_pdf_report(log_file_path, parsing_data, progress):
+    """Generate the PDF report and return (file name, PDF bytes). Runs in a background thread."""
+    pdf_buffer = generate_pdf_report(log_file_path, parsing_data, progress_callback=progress)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"unity_log_analysis_{timestamp}.pdf", pdf_buffer.getvalue()
+
+@render_fragment
+def render_pdf_export(log_file_path, parsing_data):
+    """
+    PDF export button. The report is built in a background thread so the views stay usable,
+    and kept per session for the parsed results it was built from, so it is only generated once.
+    """
+    report_key = (
+        log_file_path if isinstance(log_file_path, str) else None,
+        tuple(data_digest(parsing_data.get(name)) for name in REPORT_DATA_KEYS)
+    )
+    if 'pdf_reports' not in st.session_state:
+        st.session_state.pdf_reports = {}
+    reports = st.session_state.pdf_reports
+    
+    # Collect the result of a finished report job
+    job = get_background_job('pdf_report')
+    if job is not None and job['done']:
+        clear_background_job('pdf_report')
+        if job['error'] is not None:
+            st.error(f"PDF generation failed: {job['error']}")
+        else:
+            if len(reports) >= PDF_CACHE_MAX_ENTRIES:
+                reports.pop(next(iter(reports)))
+            reports[job['report_key']] = job['result']
+            st.success("PDF report generated!")
+        job = None
+    
+    if report_key in reports:
+        # Served as a file download rather than a base64 link embedded in the page
+        filename, pdf_bytes = reports[report_key]
+        st.download_button(
+            "Download PDF",
+            data=pdf_bytes,
+            file_name=filename,
+            mime="application/pdf",
+            key="pdf_download"
+        )
+    elif job is not None:
+        show_job_progress('pdf_report', "Generating PDF report...")
+    elif st.button("Generate PDF", key="pdf_button"):
+        job = start_background_job('pdf_report', build_pdf_report, log_file_path, parsing_data)
+        job['report_key'] = report_key
+        show_job_progress('pdf_report', "Generating PDF report...")
+
+def show_processing_time_summary(section_times, overall_time, parser_stats):
+    """Display parsing and visualization timings plus the per-parser instrumentation counters."""
+    with st.expander("🕒 Processing Time Summary", expanded=False):
+        # Create a dataframe for the timing data
+        visualization_total = sum(t for section, t in section_times.items() if section.startswith("Visualize"))
+        timing_data = []
+        for section, execution_time in section_times.items():
+            reference_time = visualization_total if section.startswith("Visualize") else overall_time
+            timing_data.append({
+                "Section": section,
+                "Execution Time (s)": round(execution_time, 3),
+                "Percentage": round((execution_time / reference_time) * 100, 1) if section != "Total Processing Time" and reference_time > 0 else 100
+            })
+        
+        timing_df = pd.DataFrame(timing_data)
+        
+        # Split into parsing and visualization sections
+        parsing_df = timing_df[timing_df["Section"].str.startswith("Parse")]
+        visualization_df = timing_df[timing_df["Section"].str.startswith("Visualize")]
+        
+        # Display in columns
+        col1a, col2a = st.columns(2)
+        
+        with col1a:
+            st.subheader("Parsing Times")
+            parsing_fig = px.bar(
+                parsing_df,
+                y="Section",
+                x="Execution Time (s)",
+                text="Execution Time (s)",
+                color="Percentage",
+                orientation="h",
+                height=400
+            )
+            parsing_fig.update_traces(texttemplate="%{text:.3f}s", textposition="outside")
+            st.plotly_chart(parsing_fig, use_container_width=True, key="parsing_times_chart")
+        
+        with col2a:
+            st.subheader("Visualization Times")
+            if visualization_df.empty:
+                st.info("No visualizations have been rendered yet.")
+            else:
+                viz_fig = px.bar(
+                    visualization_df,
+                    y="Section",
+                    x="Execution Time (s)",
+                    text="Execution Time (s)",
+                    color="Percentage",
+                    orientation="h",
+                    height=400
+                )
+                viz_fig.update_traces(texttemplate="%{text:.3f}s", textposition="outside")
+                st.plotly_chart(viz_fig, use_container_width=True, key="visualization_times_chart")
+        
+        # Display the total time as a metric
+        st.metric("Total Log Analysis Time", f"{overall_time:.2f} seconds")
+        
+        # Figure cache usage for this session
+        cache_stats = render_cache_stats()
+        st.caption(
+            f"Figure cache: {cache_stats['entries']} views, {cache_stats['bytes'] / (1024 * 1024):.1f} MB, "
+            f"{cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['evictions']} evictions"
+        )
+        
+        # Per-parser instrumentation counters
+        if parser_stats:
+            st.subheader("Parser Instrumentation")
+            stats_df = pd.DataFrame(parser_stats)
+            stats_df['bytes_read'] = stats_df['bytes_read'] / (1024 * 1024)
+            stats_df['mb_per_s'] = stats_df['bytes_read'] / stats_df['wall_seconds'].where(stats_df['wall_seconds'] > 0)
+            columns = dict(PARSER_STAT_COLUMNS)
+            columns['bytes_read'] = 'MB Read'
+            columns['mb_per_s'] = 'Throughput (MB/s)'
+            columns['cache_hit'] = 'Cached'
+            columns['truncated'] = 'Partial'
+            st.dataframe(
+                stats_df[list(columns)].rename(columns=columns).style.format({
+                    'Wall Time (s)': '{:.3f}',
+                    'MB Read': '{:.1f}',
+                    'Decode Time (s)': '{:.3f}',
+                    'Throughput (MB/s)': '{:.1f}',
+                    'Peak Memory (MB)': '{:.1f}'
+                }, na_rep='-')
+            )
+            if any(stats.get('cache_hit') for stats in parser_stats):
+                st.caption("Cached parsers returned a previous result without reading the log, so their counters are empty.")
@@ -2,29 +2,18 @@ import streamlit as st
 import plotly.express as px
 import pandas as pd
 
-def visualize_performance_report(performance_df):
-    """Visualize Unity Performance Report data."""
-    st.header("Unity Performance Report Analysis")
-    
-    if performance_df.empty:
-        st.warning("No performance report data found in the log.")
-        return
-    
-    # Summary metrics
-    total_operations = len(performance_df)
-    total_samples = performance_df['samples'].sum() if 'samples' in performance_df.columns else 0
-    max_percentage = performance_df['percentage'].max() if 'percentage' in performance_df.columns else 0
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Operations", total_operations)
-    with col2:
-        st.metric("Total Samples", total_samples)
-    with col3:
-        st.metric("Max Time Percentage", f"{max_percentage:.2f}%")
+from Utils import *
+
+@memoize_view
+def prepare_performance_view(performance_df):
+    """Build the category, slowest operation and peak figures of the performance report view."""
+    view = {
+        'total_samples': performance_df['samples'].sum() if 'samples' in performance_df.columns else 0,
+        'max_percentage': performance_df['percentage'].max() if 'percentage' in performance_df.columns else 0,
+        'category_fig': None
+    }
     
     # Category breakdown
-    st.subheader("Performance by Category")
     if 'category' in performance_df.columns:
         category_df = performance_df.groupby('category').agg(
             total_time_us=('total_us', 'sum'),
@@ -51,10 +40,9 @@ def visualize_performance_report(performance_df):
             height=500
         )
         fig.update_traces(texttemplate='%{text}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        view['category_fig'] = fig
     
     # Top slowest operations
-    st.subheader("Top 20 Slowest Operations (by Total Time)")
     sorted_df = performance_df.sort_values('total_us', ascending=False)
     top_n = min(20, len(sorted_df))
     top_operations = sorted_df.head(top_n).copy()
@@ -81,11 +69,10 @@ def visualize_performance_report(performance_df):
         height=600
     )
     fig.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig, use_container_width=True)
+    view['slowest_fig'] = fig
     
     # Operations with highest peak times
-    st.subheader("Top 10 Operations with Highest Peak Times")
-    peak_sorted = performance_df.sort_values('peak_us', ascending=False).head(10)
+    peak_sorted = performance_df.sort_values('peak_us', ascending=False).head(10).copy()
     peak_sorted['peak_s'] = peak_sorted['peak_us'] / 1000000
     
     fig = px.bar(
@@ -105,10 +92,9 @@ def visualize_performance_report(performance_df):
         height=500
     )
     fig.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig, use_container_width=True)
+    view['peak_fig'] = fig
     
     # High peak factor operations
-    st.subheader("Top 10 Operations with Highest Peak Factor")
     factor_sorted = performance_df.sort_values('peak_factor', ascending=False).head(10)
     
     fig = px.bar(
@@ -125,12 +111,136 @@ def visualize_performance_report(performance_df):
         height=500
     )
     fig.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig, use_container_width=True)
+    view['peak_factor_fig'] = fig
+    
+    # Create a more readable version of the dataframe for display
+    view['display_df'] = performance_df[['dump_index', 'operation', 'category', 'samples', 'avg_value', 'avg_unit', 
+                                         'peak_value', 'peak_unit', 'peak_factor', 
+                                         'total_value', 'total_unit', 'percentage']].copy()
+    return view
+
+# Operations charted by default in the evolution across dumps
+EVOLUTION_DEFAULT_OPERATIONS = 5
+
+EVOLUTION_METRICS = {'avg_us': 'Average Time (ms)', 'peak_us': 'Peak Time (ms)'}
+
+@memoize_view
+def prepare_performance_dumps_view(performance_df):
+    """List the dumps of the report and the operations to chart by default (slowest in the last dump)."""
+    dump_count = performance_df['dump_index'].nunique() if 'dump_index' in performance_df.columns else 1
+    if dump_count < 2:
+        return {'dump_count': dump_count}
+    
+    last_dump = performance_df[performance_df['dump_index'] == performance_df['dump_index'].max()]
+    return {
+        'dump_count': dump_count,
+        'operations': sorted(performance_df['operation'].unique()),
+        'default_operations': last_dump.nlargest(EVOLUTION_DEFAULT_OPERATIONS, 'total_us')['operation'].tolist()
+    }
+
+@memoize_view
+def prepare_performance_evolution_view(performance_df, operations, metric):
+    """Build the line chart of one metric of the selected operations across report dumps."""
+    evolution_df = performance_df.loc[performance_df['operation'].isin(operations),
+                                      ['operation', 'dump_index', 'dump_timestamp_str', metric]].copy()
+    evolution_df['value_ms'] = evolution_df[metric] / 1000
+    
+    # Place dumps in time when the log has timestamps, otherwise by their index
+    x = 'dump_index'
+    if evolution_df['dump_timestamp_str'].notna().all():
+        evolution_df['dump_time'] = pd.to_datetime(evolution_df['dump_timestamp_str'], format='%Y-%m-%dT%H:%M:%S.%fZ', errors='coerce')
+        if evolution_df['dump_time'].notna().all():
+            x = 'dump_time'
+    
+    chart_df = downsample_frame(evolution_df, x, 'value_ms', group='operation')
+    fig = px.line(
+        chart_df,
+        x=x,
+        y='value_ms',
+        color='operation',
+        markers=len(chart_df) <= WEBGL_POINT_THRESHOLD,
+        hover_data=['dump_index'],
+        labels={
+            'dump_index': 'Report Dump #',
+            'dump_time': 'Time',
+            'value_ms': EVOLUTION_METRICS[metric],
+            'operation': 'Operation'
+        },
+        height=500
+    )
+    use_webgl(fig)
+    return {'evolution_fig': fig}
+
+def visualize_performance_evolution(performance_df):
+    """Chart how the peak and average times of operations change across repeated report dumps."""
+    dumps_view = prepare_performance_dumps_view(performance_df)
+    if dumps_view['dump_count'] < 2:
+        return
+    
+    st.subheader("Evolution Across Report Dumps")
+    st.caption(f"The performance report was printed {dumps_view['dump_count']} times in this log.")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        operations = st.multiselect(
+            "Operations",
+            dumps_view['operations'],
+            default=dumps_view['default_operations'],
+            key="performance_evolution_operations"
+        )
+    with col2:
+        metric = st.radio(
+            "Metric",
+            list(EVOLUTION_METRICS),
+            format_func=EVOLUTION_METRICS.get,
+            key="performance_evolution_metric"
+        )
+    
+    if not operations:
+        st.info("Select one or more operations to chart.")
+        return
+    
+    view = prepare_performance_evolution_view(performance_df, tuple(operations), metric)
+    st.plotly_chart(view['evolution_fig'], use_container_width=True)
+
+def visualize_performance_report(performance_df):
+    """Visualize Unity Performance Report data."""
+    st.header("Unity Performance Report Analysis")
+    
+    if performance_df.empty:
+        st.warning("No performance report data found in the log.")
+        return
+    
+    view = prepare_performance_view(performance_df)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Operations", len(performance_df))
+    with col2:
+        st.metric("Total Samples", view['total_samples'])
+    with col3:
+        st.metric("Max Time Percentage", f"{view['max_percentage']:.2f}%")
+    
+    # Category breakdown
+    st.subheader("Performance by Category")
+    if view['category_fig'] is not None:
+        st.plotly_chart(view['category_fig'], use_container_width=True)
+    
+    # Top slowest operations
+    st.subheader("Top 20 Slowest Operations (by Total Time)")
+    st.plotly_chart(view['slowest_fig'], use_container_width=True)
+    
+    # Operations with highest peak times
+    st.subheader("Top 10 Operations with Highest Peak Times")
+    st.plotly_chart(view['peak_fig'], use_container_width=True)
+    
+    # High peak factor operations
+    st.subheader("Top 10 Operations with Highest Peak Factor")
+    st.plotly_chart(view['peak_factor_fig'], use_container_width=True)
+    
+    # Changes across repeated dumps of the report
+    visualize_performance_evolution(performance_df)
     
     # Detailed data table
     with st.expander("View All Performance Report Data"):
-        # Create a more readable version of the dataframe for display
-        display_df = performance_df[['operation', 'category', 'samples', 'avg_value', 'avg_unit', 
-                                    'peak_value', 'peak_unit', 'peak_factor', 
-                                    'total_value', 'total_unit', 'percentage']].copy()
-        st.dataframe(display_df)
+        paginated_table(view['display_df'], key="performance_raw_data")
@@ -6,22 +6,9 @@ from Utils import *
 from Parsers import *
 
 
-def visualize_refresh_details(refresh_entry):
-    st.header("Detailed Asset Pipeline Refresh Analysis")
-    
-    # Display metadata about the refresh operation
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Total Refresh Time", f"{refresh_entry['total_time']:.2f}s")
-    with col2:
-        st.metric("Initiator", refresh_entry['initiator'])
-    
-    # Display summary if available
-    if refresh_entry['summary']:
-        with st.expander("Refresh Summary", expanded=True):
-            for key, value in refresh_entry['summary'].items():
-                st.write(f"**{key}:** {value}")
-    
+@memoize_view
+def prepare_refresh_details_view(refresh_entry):
+    """Build the operation figures of one asset pipeline refresh. Returns None without operations."""
     # Create a dataframe of top-level operations
     operations = []
     for op in refresh_entry['operations']:
@@ -38,170 +25,318 @@ def visualize_refresh_details(refresh_entry):
     
     op_df = pd.DataFrame(operations)
     
-    if not op_df.empty:
-        # Sort by time (descending)
-        op_df = op_df.sort_values('Time (ms)', ascending=False)
-        
-        # Display top operations bar chart
-        st.subheader("Top Operations by Time")
-        
-        fig = px.bar(
-            op_df.head(10),
-            y='Operation',
-            x='Time (s)',
-            orientation='h',
-            text=op_df.head(10)['Percentage'].apply(lambda x: f"{x:.1f}%"),
-            labels={'Time (s)': 'Time (seconds)'},
-            height=500,
-            color='Percentage',
-            color_continuous_scale='Viridis'
-        )
-        fig.update_traces(textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Display self vs children time stacked bar chart
-        st.subheader("Self Time vs. Children Time")
-        
-        # Prepare data for stacked bar chart
-        stack_data = []
-        for op in op_df.head(10).to_dict('records'):
+    if op_df.empty:
+        return None
+    
+    # Sort by time (descending)
+    op_df = op_df.sort_values('Time (ms)', ascending=False)
+    
+    # Top operations bar chart
+    top_ops_fig = px.bar(
+        op_df.head(10),
+        y='Operation',
+        x='Time (s)',
+        orientation='h',
+        text=op_df.head(10)['Percentage'].apply(lambda x: f"{x:.1f}%"),
+        labels={'Time (s)': 'Time (seconds)'},
+        height=500,
+        color='Percentage',
+        color_continuous_scale='Viridis'
+    )
+    top_ops_fig.update_traces(textposition='outside')
+    
+    # Prepare data for stacked bar chart
+    stack_data = []
+    for op in op_df.head(10).to_dict('records'):
+        stack_data.append({
+            'Operation': op['Operation'],
+            'Time (s)': op['Self Time (s)'],
+            'Type': 'Self Time'
+        })
+        if op['Children Time (s)'] > 0:
             stack_data.append({
                 'Operation': op['Operation'],
-                'Time (s)': op['Self Time (s)'],
-                'Type': 'Self Time'
+                'Time (s)': op['Children Time (s)'],
+                'Type': 'Children Time'
             })
-            if op['Children Time (s)'] > 0:
-                stack_data.append({
-                    'Operation': op['Operation'],
-                    'Time (s)': op['Children Time (s)'],
-                    'Type': 'Children Time'
-                })
-        
-        stack_df = pd.DataFrame(stack_data)
+    
+    stack_df = pd.DataFrame(stack_data)
+    
+    self_time_fig = px.bar(
+        stack_df,
+        x='Time (s)',
+        y='Operation',
+        color='Type',
+        barmode='stack',
+        orientation='h',
+        height=500,
+        labels={'Time (s)': 'Time (seconds)'},
+        color_discrete_map={'Self Time': '#636EFA', 'Children Time': '#EF553B'}
+    )
+    
+    # Create a dataframe for timeline visualization
+    timeline_data = []
+    cumulative_time = 0
+
+    # Use a reference start time (now)
+    import datetime
+    reference_time = datetime.datetime.now()
+
+    # Assume operations are sequential for visualization purposes
+    for op in refresh_entry['operations']:
+        # Convert seconds to datetime objects
+        start_time = reference_time + datetime.timedelta(seconds=cumulative_time)
+        end_time = reference_time + datetime.timedelta(seconds=cumulative_time + op['time_ms']/1000)
         
-        fig = px.bar(
-            stack_df,
-            x='Time (s)',
-            y='Operation',
-            color='Type',
-            barmode='stack',
-            orientation='h',
-            height=500,
-            labels={'Time (s)': 'Time (seconds)'},
-            color_discrete_map={'Self Time': '#636EFA', 'Children Time': '#EF553B'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        timeline_data.append({
+            'Operation': op['name'],
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration_sec': op['time_ms'] / 1000,
+            'Percentage': (op['time_ms'] / (refresh_entry['total_time'] * 1000)) * 100
+        })
         
-        # Show timeline visualization
-        st.subheader("Operation Timeline")
+        # Update cumulative time for next operation
+        cumulative_time += op['time_ms'] / 1000
 
-        # Create a dataframe for timeline visualization
-        timeline_data = []
-        cumulative_time = 0
+    timeline_df = pd.DataFrame(timeline_data)
 
-        # Use a reference start time (now)
-        import datetime
-        reference_time = datetime.datetime.now()
-
-        # Assume operations are sequential for visualization purposes
-        for op in refresh_entry['operations']:
-            # Convert seconds to datetime objects
-            start_time = reference_time + datetime.timedelta(seconds=cumulative_time)
-            end_time = reference_time + datetime.timedelta(seconds=cumulative_time + op['time_ms']/1000)
-            
-            timeline_data.append({
-                'Operation': op['name'],
-                'start_time': start_time,
-                'end_time': end_time,
-                'duration_sec': op['time_ms'] / 1000,
-                'Percentage': (op['time_ms'] / (refresh_entry['total_time'] * 1000)) * 100
-            })
-            
-            # Update cumulative time for next operation
-            cumulative_time += op['time_ms'] / 1000
+    timeline_fig = px.timeline(
+        timeline_df,
+        x_start='start_time',
+        x_end='end_time',
+        y='Operation',
+        color='Percentage',
+        labels={
+            'Percentage': 'Percentage of Total Time'
+        },
+        height=600,
+        color_continuous_scale='Viridis'
+    )
 
-        timeline_df = pd.DataFrame(timeline_data)
+    # Format x-axis to show only the time portion
+    timeline_fig.update_xaxes(
+        tickformat="%H:%M:%S",
+        tickangle=0
+    )
 
-        fig = px.timeline(
-            timeline_df,
-            x_start='start_time',
-            x_end='end_time',
+    timeline_fig.update_layout(
+        xaxis_title="Time",
+        yaxis_title="Operation"
+    )
+    
+    # Breakdown of the nested operations of the longest operation
+    longest_op_name = op_df.iloc[0]['Operation']
+    longest_op_data = next((op for op in refresh_entry['operations'] if op['name'] == longest_op_name), None)
+    
+    nested_fig = None
+    if longest_op_data and longest_op_data['nested_operations']:
+        nested_ops = []
+        for nested_op in longest_op_data['nested_operations']:
+            nested_ops.append({
+                'Operation': nested_op['name'],
+                'Time (ms)': nested_op['time_ms'],
+                'Time (s)': nested_op['time_ms'] / 1000,
+                'Self Time (ms)': nested_op['self_time_ms'],
+                'Self Time (s)': nested_op['self_time_ms'] / 1000,
+                'Percentage': (nested_op['time_ms'] / longest_op_data['time_ms']) * 100
+            })
+        
+        nested_df = pd.DataFrame(nested_ops).sort_values('Time (ms)', ascending=False)
+        
+        nested_fig = px.bar(
+            nested_df,
             y='Operation',
+            x='Time (s)',
+            orientation='h',
+            text=nested_df['Percentage'].apply(lambda x: f"{x:.1f}%"),
+            labels={'Time (s)': 'Time (seconds)'},
+            height=400,
             color='Percentage',
-            labels={
-                'Percentage': 'Percentage of Total Time'
-            },
-            height=600,
-            color_continuous_scale='Viridis'
+            color_continuous_scale='Inferno'
         )
+        nested_fig.update_traces(textposition='outside')
+    
+    return {
+        'op_df': op_df,
+        'top_ops_fig': top_ops_fig,
+        'self_time_fig': self_time_fig,
+        'timeline_fig': timeline_fig,
+        'longest_op_name': longest_op_name,
+        'nested_fig': nested_fig
+    }
 
-        # Format x-axis to show only the time portion
-        fig.update_xaxes(
-            tickformat="%H:%M:%S",
-            tickangle=0
-        )
 
-        fig.update_layout(
-            xaxis_title="Time",
-            yaxis_title="Operation"
+@memoize_view
+def prepare_pipeline_refresh_view(refresh_df, tundra_info=None):
+    """
+    Sort the refreshes and build the summary figures of the pipeline refresh view. With the Tundra runs
+    (see associate_tundra_runs), each ScriptCompilation refresh also gets the script compilation runs before it.
+    """
+    # Sort by refresh time descending
+    sorted_df = refresh_df.sort_values('total_time', ascending=False)
+    raw_columns = ['timestamp_str', 'refresh_id', 'initiator', 'total_time']
+    
+    # Script compilations outside player builds, and the refresh each of them was matched with
+    compile_runs = [run for run in tundra_info or [] if run.get('context') == 'Script Compilation']
+    script_compilation = None
+    if compile_runs:
+        runs_df = pd.DataFrame({
+            'refresh_id': [run['refresh_id'] for run in compile_runs],
+            'build_time_seconds': [run['build_time_seconds'] for run in compile_runs]
+        })
+        per_refresh = runs_df.dropna(subset=['refresh_id']).groupby('refresh_id').agg(
+            tundra_runs=('build_time_seconds', 'count'),
+            tundra_seconds=('build_time_seconds', 'sum')
         )
+        sorted_df = sorted_df.join(per_refresh, on='refresh_id')
+        sorted_df[['tundra_runs', 'tundra_seconds']] = sorted_df[['tundra_runs', 'tundra_seconds']].fillna(0)
+        raw_columns += ['tundra_runs', 'tundra_seconds']
+        script_compilation = {
+            'runs': len(compile_runs),
+            'seconds': runs_df['build_time_seconds'].sum(),
+            'matched_runs': int(runs_df['refresh_id'].notna().sum()),
+            'refreshes': len(per_refresh)
+        }
+    
+    # Top slowest refreshes
+    top_n = min(20, len(sorted_df))
+    top_refreshes = sorted_df.head(top_n)
+    
+    top_refreshes_fig = px.bar(
+        top_refreshes,
+        x=top_refreshes.index,
+        y='total_time',
+        hover_data=['refresh_id', 'initiator'],
+        labels={'total_time': 'Refresh Time (s)', 'index': 'Refresh #'},
+        height=500,
+        color='initiator'
+    )
+    
+    # Time by initiator
+    initiator_df = sorted_df.groupby('initiator').agg(
+        total_time=('total_time', 'sum'),
+        count=('total_time', 'count'),
+        avg_time=('total_time', 'mean')
+    ).reset_index().sort_values('total_time', ascending=False)
+    
+    initiator_fig = px.bar(
+        initiator_df,
+        x='initiator',
+        y='total_time',
+        color='count',
+        text='count',
+        labels={
+            'initiator': 'Initiator', 
+            'total_time': 'Total Refresh Time (s)',
+            'count': 'Number of Refreshes'
+        },
+        height=500
+    )
+    initiator_fig.update_traces(texttemplate='%{text}', textposition='outside')
+    
+    return {
+        'sorted_df': sorted_df,
+        'raw_df': sorted_df[raw_columns],
+        'script_compilation': script_compilation,
+        'top_refreshes_fig': top_refreshes_fig,
+        'initiator_fig': initiator_fig
+    }
+
 
-        st.plotly_chart(fig, use_container_width=True)
+def visualize_refresh_details(refresh_entry):
+    st.header("Detailed Asset Pipeline Refresh Analysis")
+    
+    # Display metadata about the refresh operation
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Refresh Time", f"{refresh_entry['total_time']:.2f}s")
+    with col2:
+        st.metric("Initiator", refresh_entry['initiator'])
+    
+    # Display summary if available
+    if refresh_entry['summary']:
+        with st.expander("Refresh Summary", expanded=True):
+            for key, value in refresh_entry['summary'].items():
+                st.write(f"**{key}:** {value}")
+    
+    view = prepare_refresh_details_view(refresh_entry)
+    
+    if view is not None:
+        # Display top operations bar chart
+        st.subheader("Top Operations by Time")
+        st.plotly_chart(view['top_ops_fig'], use_container_width=True)
         
-        # Display nested operations for the longest operation
-        longest_op = op_df.iloc[0]
-        longest_op_name = longest_op['Operation']
+        # Display self vs children time stacked bar chart
+        st.subheader("Self Time vs. Children Time")
+        st.plotly_chart(view['self_time_fig'], use_container_width=True)
         
-        longest_op_data = next((op for op in refresh_entry['operations'] if op['name'] == longest_op_name), None)
+        # Show timeline visualization
+        st.subheader("Operation Timeline")
+        st.plotly_chart(view['timeline_fig'], use_container_width=True)
         
-        if longest_op_data and longest_op_data['nested_operations']:
-            st.subheader(f"Breakdown of '{longest_op_name}' Operation")
-            
-            nested_ops = []
-            for nested_op in longest_op_data['nested_operations']:
-                nested_ops.append({
-                    'Operation': nested_op['name'],
-                    'Time (ms)': nested_op['time_ms'],
-                    'Time (s)': nested_op['time_ms'] / 1000,
-                    'Self Time (ms)': nested_op['self_time_ms'],
-                    'Self Time (s)': nested_op['self_time_ms'] / 1000,
-                    'Percentage': (nested_op['time_ms'] / longest_op_data['time_ms']) * 100
-                })
-            
-            nested_df = pd.DataFrame(nested_ops).sort_values('Time (ms)', ascending=False)
-            
-            fig = px.bar(
-                nested_df,
-                y='Operation',
-                x='Time (s)',
-                orientation='h',
-                text=nested_df['Percentage'].apply(lambda x: f"{x:.1f}%"),
-                labels={'Time (s)': 'Time (seconds)'},
-                height=400,
-                color='Percentage',
-                color_continuous_scale='Inferno'
-            )
-            fig.update_traces(textposition='outside')
-            st.plotly_chart(fig, use_container_width=True)
+        # Display nested operations for the longest operation
+        if view['nested_fig'] is not None:
+            st.subheader(f"Breakdown of '{view['longest_op_name']}' Operation")
+            st.plotly_chart(view['nested_fig'], use_container_width=True)
         
         # Raw data in a well-formatted table
         with st.expander("View All Operations Data"):
-            st.dataframe(op_df.style.format({
+            paginated_table(view['op_df'], key="refresh_operations", formats={
                 'Time (s)': '{:.3f}',
                 'Self Time (s)': '{:.3f}',
                 'Children Time (s)': '{:.3f}',
                 'Percentage': '{:.2f}%'
-            }))
+            })
+
+@memoize_view
+def prepare_refresh_operations_view(refresh_ops):
+    """Aggregate the operations of every refresh by name: totals and percentiles. Returns None without operations."""
+    if refresh_ops is None or refresh_ops.empty:
+        return None
+    
+    grouped = refresh_ops.groupby('name', sort=False)
+    op_stats = grouped.agg(
+        refreshes=('refresh_id', 'nunique'),
+        count=('time_ms', 'count'),
+        total_ms=('time_ms', 'sum'),
+        self_ms=('self_time_ms', 'sum'),
+        max_ms=('time_ms', 'max')
+    )
+    percentiles = grouped['time_ms'].quantile([0.5, 0.95, 0.99]).unstack()
+    percentiles.columns = ['p50_ms', 'p95_ms', 'p99_ms']
+    op_stats = op_stats.join(percentiles).reset_index().sort_values('total_ms', ascending=False)
+    op_stats['total_s'] = op_stats['total_ms'] / 1000
+    op_stats['self_s'] = op_stats['self_ms'] / 1000
+    
+    top_ops = op_stats.head(15)
+    fig = px.bar(
+        top_ops,
+        y='name',
+        x='total_s',
+        orientation='h',
+        color='p95_ms',
+        hover_data=['count', 'self_s', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'],
+        labels={'name': 'Operation', 'total_s': 'Total Time (s)', 'self_s': 'Self Time (s)', 'count': 'Occurrences',
+                'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)', 'p99_ms': 'p99 (ms)', 'max_ms': 'Max (ms)'},
+        height=500
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    
+    return {
+        'op_stats': op_stats[['name', 'refreshes', 'count', 'total_s', 'self_s', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']],
+        'top_ops_fig': fig
+    }
 
-def visualize_pipeline_refreshes(refresh_df, log_file_path):
+def visualize_pipeline_refreshes(refresh_df, log_file_path, refresh_ops=None, tundra_info=None):
     st.header("Unity Asset Pipeline Refreshes")
     
     if refresh_df.empty:
         st.warning("No asset pipeline refresh data found in the log.")
         return
     
-    # Sort by refresh time descending
-    sorted_df = refresh_df.sort_values('total_time', ascending=False)
+    view = prepare_pipeline_refresh_view(refresh_df, tundra_info)
+    sorted_df = view['sorted_df']
     
     # Summary metrics
     col1, col2, col3 = st.columns(3)
@@ -217,19 +352,7 @@ def visualize_pipeline_refreshes(refresh_df, log_file_path):
     
     # Top slowest refreshes
     st.subheader("Slowest Asset Pipeline Refreshes")
-    top_n = min(20, len(sorted_df))
-    top_refreshes = sorted_df.head(top_n)
-    
-    fig = px.bar(
-        top_refreshes,
-        x=top_refreshes.index,
-        y='total_time',
-        hover_data=['refresh_id', 'initiator'],
-        labels={'total_time': 'Refresh Time (s)', 'index': 'Refresh #'},
-        height=500,
-        color='initiator'
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(view['top_refreshes_fig'], use_container_width=True)
     
     # Add option to view detailed breakdown for the selected refresh
     st.subheader("Detailed Refresh Analysis")
@@ -259,31 +382,38 @@ def visualize_pipeline_refreshes(refresh_df, log_file_path):
     
     # Time by initiator
     st.subheader("Refresh Time by Initiator")
-    initiator_df = sorted_df.groupby('initiator').agg(
-        total_time=('total_time', 'sum'),
-        count=('total_time', 'count'),
-        avg_time=('total_time', 'mean')
-    ).reset_index().sort_values('total_time', ascending=False)
+    st.plotly_chart(view['initiator_fig'], use_container_width=True)
     
-    fig = px.bar(
-        initiator_df,
-        x='initiator',
-        y='total_time',
-        color='count',
-        text='count',
-        labels={
-            'initiator': 'Initiator', 
-            'total_time': 'Total Refresh Time (s)',
-            'count': 'Number of Refreshes'
-        },
-        height=500
-    )
-    fig.update_traces(texttemplate='%{text}', textposition='outside')
-    st.plotly_chart(fig, use_container_width=True)
+    # Tundra runs that compiled scripts outside player builds
+    script_compilation = view['script_compilation']
+    if script_compilation is not None:
+        st.subheader("Script Compilation (Tundra)")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Script Compilation Runs", script_compilation['runs'])
+        with col2:
+            st.metric("Script Compilation Time", format_time(script_compilation['seconds']))
+        with col3:
+            st.metric("Matched with a Refresh", f"{script_compilation['matched_runs']} runs, {script_compilation['refreshes']} refreshes")
+        st.caption(f"Tundra runs outside player builds, matched with the next refresh initiated by ScriptCompilation "
+                   f"that started within {SCRIPT_COMPILATION_MAX_DELAY:.0f} seconds. The raw data lists them per refresh.")
     
-
+    # Operations aggregated over every refresh
+    ops_view = prepare_refresh_operations_view(refresh_ops)
+    if ops_view is not None:
+        st.subheader("Operations Across All Refreshes")
+        st.plotly_chart(ops_view['top_ops_fig'], use_container_width=True)
+        with st.expander("View Operation Percentiles"):
+            paginated_table(ops_view['op_stats'], key="refresh_operation_totals", sort_column='total_s', formats={
+                'total_s': '{:.3f}',
+                'self_s': '{:.3f}',
+                'p50_ms': '{:.1f}',
+                'p95_ms': '{:.1f}',
+                'p99_ms': '{:.1f}',
+                'max_ms': '{:.1f}'
+            })
     
     # Raw data table
     with st.expander("View Asset Pipeline Refresh Raw Data"):
-        st.dataframe(sorted_df[['timestamp_str', 'refresh_id', 'initiator', 'total_time']])
+        paginated_table(view['raw_df'], key="refresh_raw_data", sort_column='total_time')
 
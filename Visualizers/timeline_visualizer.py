@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from Parsers import *
+from Utils import *
+
+# Maximum number of events drawn at once; the longest are kept, zooming in shows the others
+TIMELINE_EVENT_BUDGET = 20000
+
+# Events shorter than this share of the visible range are widened so they stay visible
+TIMELINE_MIN_WIDTH = 0.001
+
+
+@memoize_view
+def prepare_event_timeline_view(event_timeline, range_start, range_end):
+    """
+    Build the Gantt chart of the events overlapping [range_start, range_end] (nanoseconds), one row per
+    event kind and one WebGL trace per row, each event a segment of a single line broken by gaps.
+    """
+    positions = timeline_overlapping(event_timeline, range_start, range_end)
+    found = len(positions)
+    if found > TIMELINE_EVENT_BUDGET:
+        durations = event_timeline['end'][positions] - event_timeline['start'][positions]
+        positions = positions[np.sort(np.argsort(-durations, kind='stable')[:TIMELINE_EVENT_BUDGET])]
+
+    min_width = int((range_end - range_start) * TIMELINE_MIN_WIDTH)
+    fig = go.Figure()
+    for code, kind in enumerate(TIMELINE_EVENT_KINDS):
+        kind_positions = positions[event_timeline['kind'][positions] == code]
+        if not len(kind_positions):
+            continue
+        starts = event_timeline['start'][kind_positions]
+        ends = event_timeline['end'][kind_positions]
+        # Segment ends, then a missing point that breaks the line before the next event
+        x = np.empty(len(kind_positions) * 3, dtype='int64')
+        x[0::3] = starts
+        x[1::3] = np.maximum(ends, starts + min_width)
+        x = x.view('datetime64[ns]')
+        x[2::3] = np.datetime64('NaT')
+        hover = [f"{label}<br>{format_time((end - start) / 1e9)}"
+                 for label, start, end in zip(event_timeline['label'][kind_positions], starts, ends)]
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=np.full(len(x), kind, dtype=object),
+            mode='lines',
+            line={'width': 14},
+            name=kind,
+            text=np.repeat(np.asarray(hover, dtype=object), 3),
+            hovertemplate="%{text}<extra></extra>",
+            connectgaps=False
+        ))
+    fig.update_layout(
+        height=140 + 45 * len(fig.data),
+        xaxis={'title': "Time", 'range': [pd.Timestamp(range_start), pd.Timestamp(range_end)]},
+        yaxis={'categoryorder': 'array', 'categoryarray': list(reversed(TIMELINE_EVENT_KINDS))},
+        showlegend=False,
+        margin={'t': 30}
+    )
+    return {'timeline_fig': fig, 'events_found': found, 'events_drawn': len(positions)}
+
+
+def timeline_with_gaps(parsed_data, event_timeline, log_file_path):
+    """The event timeline plus the timestamp gaps of the log, kept for the session as finding gaps reads the whole log."""
+    stored = st.session_state.get('timeline_with_gaps')
+    if stored is None or stored[0] is not event_timeline or stored[1] != log_file_path:
+        with st.spinner("Finding timestamp gaps..."):
+            gaps = attribute_timestamp_gaps(parse_timestamp_gaps(log_file_path), event_timeline)
+        stored = (event_timeline, log_file_path, build_event_timeline(parsed_data, gaps))
+        st.session_state.timeline_with_gaps = stored
+    return stored[2]
+
+
+def visualize_event_timeline(parsed_data, event_timeline, log_file_path):
+    """Show every timed event of the log on one timeline, with the events running at any moment."""
+    st.header("Event Timeline")
+    st.markdown("Project loadings, player builds, domain reloads, pipeline refreshes and asset imports on one "
+                "timeline, placed from the timestamp of the line reporting each of them and its duration.")
+
+    if st.checkbox("Include timestamp gaps (reads the whole log)", key="timeline_include_gaps",
+                   help="Periods of at least 60 seconds without any log output"):
+        event_timeline = timeline_with_gaps(parsed_data, event_timeline, log_file_path)
+
+    first, last = timeline_span(event_timeline)
+    first, last = first.to_pydatetime(), last.to_pydatetime()
+    counts = np.bincount(event_timeline['kind'], minlength=len(TIMELINE_EVENT_KINDS))
+    st.caption(" · ".join(f"{count:,} {kind.lower()}{'s' if count != 1 else ''}"
+                          for kind, count in zip(TIMELINE_EVENT_KINDS, counts) if count))
+
+    if last > first:
+        range_start, range_end = st.slider("Time range", min_value=first, max_value=last, value=(first, last),
+                                           format="HH:mm:ss", key="timeline_range")
+    else:
+        range_start, range_end = first, last
+
+    # What was the Editor doing at a given moment
+    if range_end > range_start:
+        moment = st.slider("Moment", min_value=range_start, max_value=range_end, value=range_start,
+                           format="HH:mm:ss", key="timeline_moment",
+                           help="The events running at this moment are listed below the timeline")
+    else:
+        moment = range_start
+
+    view = prepare_event_timeline_view(event_timeline, pd.Timestamp(range_start).value, pd.Timestamp(range_end).value)
+    view['timeline_fig'].add_vline(x=moment, line_dash='dot', line_color='gray')
+    st.plotly_chart(view['timeline_fig'], use_container_width=True, key="event_timeline_chart")
+    if view['events_drawn'] < view['events_found']:
+        st.caption(f"Showing the {view['events_drawn']:,} longest of the {view['events_found']:,} events in this range; "
+                   f"narrow the time range to see the others.")
+
+    st.subheader(f"Running at {moment:%H:%M:%S}")
+    running = timeline_events_frame(event_timeline, timeline_running_at(event_timeline, pd.Timestamp(moment).value))
+    if running.empty:
+        st.info("No timed event was running at this moment.")
+    else:
+        running = running.rename(columns={'kind': 'Kind', 'label': 'Event', 'start': 'Start', 'end': 'End',
+                                          'duration_seconds': 'Duration (s)'})
+        st.dataframe(running[['Kind', 'Event', 'Start', 'End', 'Duration (s)']], hide_index=True,
+                     use_container_width=True)
@@ -3,10 +3,72 @@ import pandas as pd
 import plotly.express as px
 
 from Parsers import *
+from Utils import *
 
-def visualize_timestamp_gaps(log_file_path):
+def format_gap_cause(operation):
+    """Describe the operation a gap was attributed to (see attribute_timestamp_gaps)."""
+    if operation is None:
+        return "Unknown"
+    if operation['source'] == 'last line':
+        return f"{operation['kind']}: {operation['label']} (started before the gap)"
+    return f"{operation['kind']}: {operation['label']} ({operation['coverage']:.0%} of the gap)"
+
+@memoize_view
+def prepare_timestamp_gap_view(gaps):
+    """Build the gap duration chart and details table for the detected gaps."""
+    # Create an overview chart of gaps
+    gap_chart_data = []
+    for i, gap in enumerate(gaps):
+        operation = gap.get('operation')
+        gap_chart_data.append({
+            'Gap #': i + 1,
+            'Start Time': gap['prev_timestamp'],
+            'Duration (s)': gap['time_diff_seconds'],
+            'Cause': operation['kind'] if operation else "Unknown",
+            'Likely Cause': format_gap_cause(operation)
+        })
+    
+    gap_df = pd.DataFrame(gap_chart_data)
+    
+    # Gaps are sorted by duration, so only the longest ones are drawn
+    chart_df, hidden = top_rows(gap_df)
+    
+    fig = px.bar(
+        chart_df,
+        x='Gap #', 
+        y='Duration (s)',
+        text='Duration (s)',
+        color='Duration (s)',
+        height=400,
+        title="Duration of Detected Gaps (Sorted by Duration)"
+    )
+    fig.update_traces(texttemplate='%{text:.1f}s', textposition='outside')
+    
+    # Gap time per kind of operation held responsible
+    cause_df = gap_df.groupby('Cause', as_index=False)['Duration (s)'].sum().sort_values('Duration (s)', ascending=False)
+    cause_fig = px.bar(
+        cause_df,
+        x='Cause',
+        y='Duration (s)',
+        height=350,
+        title="Gap Time by Likely Cause"
+    )
+    
+    display_df = gap_df.copy()
+    display_df['Start Time'] = display_df['Start Time'].dt.strftime('%H:%M:%S')
+    display_df['Duration'] = display_df['Duration (s)'].apply(lambda x: f"{x:.2f}s")
+    
+    return {
+        'gaps_fig': fig,
+        'gaps_hidden': hidden,
+        'cause_fig': cause_fig,
+        'display_df': display_df[['Gap #', 'Start Time', 'Duration', 'Likely Cause']]
+    }
+
+def visualize_timestamp_gaps(log_file_path, event_timeline=None):
     """
     Visualize areas in the log where there are significant time gaps between log entries.
+    With the event timeline of the parsed data, each gap is attributed to the operation most likely responsible.
     """
     st.header("Log Timestamp Gap Analysis")
     st.markdown("This analysis identifies periods of apparent inactivity in the log, which could indicate when Unity was frozen, processing intensive operations, or otherwise unresponsive.")
@@ -32,6 +94,8 @@ def visualize_timestamp_gaps(log_file_path):
         with st.spinner("Analyzing timestamp gaps in log file..."):
             # Import the parser function            
             gaps = parse_timestamp_gaps(log_file_path, threshold_seconds)
+            if event_timeline is not None:
+                gaps = attribute_timestamp_gaps(gaps, event_timeline)
             
             if not gaps:
                 st.info(f"No time gaps greater than {threshold_seconds} seconds were found in the log.")
@@ -40,37 +104,19 @@ def visualize_timestamp_gaps(log_file_path):
             # Display summary
             st.subheader(f"Found {len(gaps)} gaps exceeding {threshold_seconds} seconds")
             
-            # Create an overview chart of gaps
-            gap_chart_data = []
-            for i, gap in enumerate(gaps):
-                gap_chart_data.append({
-                    'Gap #': i + 1,
-                    'Start Time': gap['prev_timestamp'],
-                    'Duration (s)': gap['time_diff_seconds']
-                })
-            
-            gap_df = pd.DataFrame(gap_chart_data)
+            view = prepare_timestamp_gap_view(gaps)
             
             # Create a bar chart of the gaps (now already sorted by duration)
-            fig = px.bar(
-                gap_df,
-                x='Gap #', 
-                y='Duration (s)',
-                text='Duration (s)',
-                color='Duration (s)',
-                height=400,
-                title="Duration of Detected Gaps (Sorted by Duration)"
-            )
-            fig.update_traces(texttemplate='%{text:.1f}s', textposition='outside')
-            st.plotly_chart(fig, use_container_width=True, key="timestamp_gaps_chart")
+            st.plotly_chart(view['gaps_fig'], use_container_width=True, key="timestamp_gaps_chart")
+            if view['gaps_hidden']:
+                st.caption(f"Showing the {CHART_CATEGORY_BUDGET} longest gaps; the remaining {view['gaps_hidden']} are listed below.")
             
-            # Create a table of gaps
-            display_df = gap_df.copy()
-            display_df['Start Time'] = display_df['Start Time'].dt.strftime('%H:%M:%S')
-            display_df['Duration'] = display_df['Duration (s)'].apply(lambda x: f"{x:.2f}s")
+            if event_timeline is not None:
+                st.plotly_chart(view['cause_fig'], use_container_width=True, key="timestamp_gap_causes_chart")
             
+            # Create a table of gaps
             st.subheader("Gap Details")
-            st.dataframe(display_df[['Gap #', 'Start Time', 'Duration']])
+            paginated_table(view['display_df'], key="timestamp_gap_details")
             
             # Display individual gaps with expandable details
             st.subheader("Gap Context")
@@ -86,4 +132,6 @@ def visualize_timestamp_gaps(log_file_path):
                         st.markdown(f"**Line after gap ({gap['current_timestamp'].strftime('%H:%M:%S.%f')[:-3]}):**")
                         st.code(gap['current_line'].strip())
                     
-                    st.markdown(f"**Gap duration:** {gap['time_diff_seconds']:.2f} seconds")
\ No newline at end of file
+                    st.markdown(f"**Gap duration:** {gap['time_diff_seconds']:.2f} seconds")
+                    if event_timeline is not None:
+                        st.markdown(f"**Likely cause:** {format_gap_cause(gap['operation'])}")
\ No newline at end of file
@@ -16,7 +16,15 @@ if __name__ == "__main__":
         # Parse command line arguments
         args = data_helpers.parse_arguments()
         
-        if os.path.exists(args.log_file):
+        if os.path.exists(args.log_file) and args.quick_look:
+            print(f"Quick look at log file: {args.log_file}")
+            try:
+                quick_look = estimate_log_totals(args.log_file)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            print(format_quick_look_report(quick_look))
+        elif os.path.exists(args.log_file):
             print(f"Analyzing log file: {args.log_file}")
             
             # Use default parsing options (all enabled)
@@ -30,12 +38,49 @@ if __name__ == "__main__":
                 'player_build': True,
                 'il2cpp': True,
                 'tundra': True,
-                'timestamp_gaps': True
+                'timestamp_gaps': True,
+                'performance_report': True,
+                'trace_memory': args.trace_memory,
+                'time_budget_seconds': args.time_budget,
+                'memory_budget_mb': args.memory_budget_mb,
+                'split_sessions': True
             }
             
+            # Resolve the time window against the timestamps of the log
+            if args.start or args.end:
+                timestamps = parse_timestamp_index(args.log_file)['timestamps']
+                if not timestamps:
+                    print("Error: This log has no timestamps, so --start and --end can't be used.")
+                    sys.exit(1)
+                try:
+                    parsing_options['time_window'] = (
+                        resolve_window_time(args.start, timestamps[0]) if args.start else None,
+                        resolve_window_time(args.end, timestamps[0]) if args.end else None
+                    )
+                except ValueError as e:
+                    print(f"Error: {e}")
+                    sys.exit(1)
+                start_byte, end_byte = find_log_window(args.log_file, *parsing_options['time_window'])
+                if end_byte <= start_byte:
+                    print(f"Error: No log lines in this time window (the log covers {timestamps[0]} to {timestamps[-1]}).")
+                    sys.exit(1)
+                print(f"Time window: {parsing_options['time_window'][0] or 'start of log'} to {parsing_options['time_window'][1] or 'end of log'}")
+            
             # Parse the data (modified to return parsed data)
             parsed_data = visualize_log_data(args.log_file, parsing_options=parsing_options)
             
+            # List the Editor sessions of concatenated logs, which were parsed separately and merged
+            sessions = parsed_data.get('sessions') or []
+            if len(sessions) > 1:
+                print(f"\nThe log holds {len(sessions)} Editor sessions:")
+                for data in sessions:
+                    print(f"  {format_log_session(data['session'])}")
+            
+            # Print the per-parser instrumentation report
+            print("\nParser instrumentation:")
+            print(format_parser_stats_report(parsed_data.get('parser_stats', [])))
+            print()
+            
             # Determine output path for the PDF
             output_path = args.output
             if not output_path:
@@ -43,8 +88,8 @@ if __name__ == "__main__":
                 log_dir = os.path.dirname(args.log_file)
                 log_filename = os.path.basename(args.log_file)
                 
-                # Replace .log with .pdf or just append .pdf if no extension
-                base_name, ext = os.path.splitext(log_filename)
+                # Replace .log (and any compression extension, e.g. .log.gz) with .pdf
+                base_name = strip_log_extension(log_filename)
                 pdf_filename = f"{base_name}.pdf"
                 
                 output_path = os.path.join(log_dir, pdf_filename)
@@ -166,8 +211,7 @@ if __name__ == "__main__":
                 st.session_state.parse_options = preset_options[selected].copy()
                 
                 # Clear any previously parsed data when changing presets
-                if 'parsed_data' in st.session_state:
-                    del st.session_state.parsed_data
+                reset_parsed_data()
                 
                 # Set flag to indicate need for rerun
                 st.session_state.preset_changed = True
@@ -228,7 +272,7 @@ if __name__ == "__main__":
                 st.session_state.parse_options['domain_reload'] = st.checkbox(
                     "Domain Reloads", 
                     value=st.session_state.parse_options['domain_reload'],
-                    help="Parse domain reload data (can be slow for large logs)"
+                    help="Parse domain reload data"
                 )
             
             with col3:
@@ -259,6 +303,42 @@ if __name__ == "__main__":
                         value=st.session_state.parse_options.get('performance_report', True),
                         help="Parse Unity Performance Report data"
     )
+            
+            st.session_state.parse_options['trace_memory'] = st.checkbox(
+                "Trace Parser Memory Usage",
+                value=st.session_state.parse_options.get('trace_memory', False),
+                help="Record the peak memory allocated by each parser (uses tracemalloc, which slows parsing down)"
+            )
+            
+            st.session_state.parse_options['split_sessions'] = st.checkbox(
+                "Split Editor Sessions",
+                value=st.session_state.parse_options.get('split_sessions', True),
+                help="Parse each Editor session of a concatenated log separately (in parallel for big logs) and merge the results"
+            )
+            
+            st.session_state.parse_options['quick_look'] = st.checkbox(
+                "Quick Look First",
+                value=st.session_state.parse_options.get('quick_look', False),
+                help="Estimate the main totals from samples of the log in a few seconds, then choose whether to run the full analysis"
+            )
+            
+            budget_col1, budget_col2 = st.columns(2)
+            with budget_col1:
+                st.session_state.parse_options['time_budget_seconds'] = st.number_input(
+                    "Time Budget (seconds)",
+                    min_value=0.0,
+                    value=float(st.session_state.parse_options.get('time_budget_seconds') or 0.0),
+                    step=5.0,
+                    help="Stop parsing after this long and show partial results (0 for no limit)"
+                ) or None
+            with budget_col2:
+                st.session_state.parse_options['memory_budget_mb'] = st.number_input(
+                    "Memory Budget (MB)",
+                    min_value=0.0,
+                    value=float(st.session_state.parse_options.get('memory_budget_mb') or 0.0),
+                    step=256.0,
+                    help="Stop parsing once it has used this much memory and show partial results (0 for no limit)"
+                ) or None
                 
         
         # Then show file uploader
@@ -279,7 +359,7 @@ if __name__ == "__main__":
         
         # Track the uploaded file and its modification time
         current_log_file = st.file_uploader("Please Upload your Unity log file (Editor.log)", 
-                                           type=["txt", "log"], 
+                                           type=LOG_FILE_EXTENSIONS, 
                                            help=log_file_help,
                                            key="log_file_uploader")
         
@@ -291,9 +371,10 @@ if __name__ == "__main__":
             # If the file has changed, clear the cached data
             if 'previous_file_name' not in st.session_state or st.session_state.previous_file_name != file_identifier:
                 st.session_state.previous_file_name = file_identifier
-                # Clear the cached parsed data
-                if 'parsed_data' in st.session_state:
-                    del st.session_state.parsed_data
+                # Clear the cached parsed data and the figures built from it
+                reset_parsed_data()
+                reset_time_window()
+                clear_render_cache()
                 st.info("New log file detected. Analyzing...")
             
             with st.spinner("Analyzing log file..."):
@@ -301,14 +382,18 @@ if __name__ == "__main__":
                 import io
                 log_contents = io.BytesIO(current_log_file.getvalue())
                 
+                # Optionally only analyze a time window of the session
+                select_time_window(log_contents, st.session_state.parse_options)
+                
                 # Modify your parsing functions to accept file-like objects instead of paths
                 visualize_log_data(log_contents, parsing_options=st.session_state.parse_options)
         else:
             # Reset the previous file name when no file is uploaded
             st.session_state.previous_file_name = None
             # Clear cached data
-            if 'parsed_data' in st.session_state:
-                del st.session_state.parsed_data
+            reset_parsed_data()
+            reset_time_window()
+            clear_render_cache()
             
             # Show instructions when no file is uploaded
             st.info("👆 Please upload a Unity Editor.log file to begin analysis.")
@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utils.event_timeline import build_event_timeline, timeline_overlapping, timeline_running_at
+
+
+def _import_timeline(starts_s, durations_s):
+    """A timeline of asset imports starting at starts_s seconds and lasting durations_s seconds."""
+    origin = pd.Timestamp('2024-01-01')
+    import_df = pd.DataFrame({
+        'timestamp': [origin + pd.Timedelta(seconds=start + duration) for start, duration in zip(starts_s, durations_s)],
+        'import_time_seconds': durations_s,
+        'asset_path': [f"Assets/Asset_{i}.png" for i in range(len(starts_s))]
+    })
+    return build_event_timeline({'import_df': import_df}), origin.value
+
+
+def _linear_scan(timeline, start_time, end_time):
+    return np.flatnonzero((timeline['start'] <= end_time) & (timeline['end'] >= start_time))
+
+
+def test_back_to_back_events_are_running():
+    timeline, origin = _import_timeline(list(range(42)), [1.0] * 42)
+    for second in (0.5, 31.5, 40.5, 41.5):
+        moment = origin + int(second * 1e9)
+        assert list(timeline_running_at(timeline, moment)) == [int(second)]
+
+
+def test_index_matches_linear_scan():
+    rng = np.random.default_rng(0)
+    for count in list(range(1, 130)) + [257, 1000]:
+        starts = np.sort(rng.uniform(0, 1000, count)).round(3)
+        durations = rng.exponential(5, count).round(3)
+        timeline, origin = _import_timeline(starts.tolist(), durations.tolist())
+        span = int(timeline['max_end'].max())
+        for _ in range(30):
+            start_time = origin + int(rng.uniform(-10, 1010) * 1e9)
+            end_time = start_time + int(rng.choice([0, rng.exponential(20) * 1e9]))
+            expected = _linear_scan(timeline, start_time, end_time)
+            assert np.array_equal(timeline_overlapping(timeline, start_time, end_time), expected), count
+        assert np.array_equal(timeline_running_at(timeline, span), _linear_scan(timeline, span, span))
@@ -0,0 +1,72 @@
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utils.data_helpers import iter_log_lines, read_log_content
+from Utils.instrumentation import instrument_parser
+
+CHUNK_SIZE = 64
+
+
+def _log_bytes(line_count, trailing_newline=True):
+    text = '\n'.join(f"2024-01-01T10:00:{i % 60:02d}.000Z|0x1|Line {i}" for i in range(line_count))
+    return (text + '\n' if trailing_newline else text).encode('utf-8')
+
+
+def _budget_expiring_after(stats, byte_count):
+    """A stop_reading callback whose budget runs out once byte_count bytes have been read."""
+    return lambda: stats[0] is not None and stats[0]['bytes_read'] >= byte_count
+
+
+def _read_lines(data, budget_bytes, chunk_size=CHUNK_SIZE):
+    holder = [None]
+    with instrument_parser("test", stop_reading=_budget_expiring_after(holder, budget_bytes)) as stats:
+        holder[0] = stats
+        lines = list(iter_log_lines(io.BytesIO(data), chunk_size=chunk_size))
+    return lines, stats
+
+
+def test_budget_expiring_during_last_chunk_is_not_partial():
+    data = _log_bytes(20)
+    # The budget runs out while the last chunk is handled: everything has been read by then
+    last_chunk_start = (len(data) - 1) // CHUNK_SIZE * CHUNK_SIZE
+    lines, stats = _read_lines(data, last_chunk_start + 1)
+    assert len(lines) == 20
+    assert stats['bytes_read'] == len(data)
+    assert not stats['truncated']
+    assert stats['covered_bytes'] is None
+
+
+def test_last_line_without_newline_is_kept_under_budget():
+    data = _log_bytes(20, trailing_newline=False)
+    last_chunk_start = (len(data) - 1) // CHUNK_SIZE * CHUNK_SIZE
+    lines, stats = _read_lines(data, last_chunk_start + 1)
+    assert lines[-1] == "2024-01-01T10:00:19.000Z|0x1|Line 19"
+    assert not stats['truncated']
+
+
+def test_budget_expiring_early_covers_complete_lines_read():
+    data = _log_bytes(20)
+    lines, stats = _read_lines(data, CHUNK_SIZE * 2)
+    assert stats['truncated']
+    # Only the chunks handled before the budget ran out count, up to their last complete line
+    assert stats['covered_bytes'] == sum(len(line) + 1 for line in lines)
+    assert stats['covered_bytes'] <= CHUNK_SIZE * 2
+    assert data[:stats['covered_bytes']].decode('utf-8').splitlines() == lines
+
+
+def test_read_log_content_budget_expiring_at_end_is_not_partial():
+    data = _log_bytes(20, trailing_newline=False)
+    checks = []
+
+    def stop_reading():
+        # The budget runs out once the first chunk, the whole log here, has been read
+        checks.append(True)
+        return len(checks) > 1
+
+    with instrument_parser("test", stop_reading=stop_reading) as stats:
+        content = read_log_content(io.BytesIO(data))
+    assert content.splitlines()[-1] == "2024-01-01T10:00:19.000Z|0x1|Line 19"
+    assert not stats['truncated']